@@ -1,5 +1,5 @@
 from fastapi import Depends
-from typing import Annotated
+from typing import Annotated, Callable, Coroutine, Type, TypeVar
 
 from app.services.ingredient_service import IngredientService
 from app.services.product_service import ProductService
@@ -11,16 +11,45 @@ from app.services.user_service import UserService
 from app.services.auth_service import AuthService
 from app.services.inventory_service import InventoryService
 
-purchase_service_depends = Annotated[PurchaseService, Depends(PurchaseService)]
-category_service_depends = Annotated[CategoryService, Depends(CategoryService)]
+S = TypeVar("S")
+
+
+def singleton(service: Type[S]) -> Callable[[], Coroutine[None, None, S]]:
+    """Provider of one process-wide instance of a stateless service.
+
+    The instance is built on first use. The provider is a coroutine so
+    FastAPI resolves it on the event loop instead of the threadpool.
+    """
+    instance: S | None = None
+
+    async def provider() -> S:
+        nonlocal instance
+        if instance is None:
+            instance = service()
+        return instance
+
+    return provider
+
+
+purchase_service_depends = Annotated[
+    PurchaseService, Depends(singleton(PurchaseService))
+]
+category_service_depends = Annotated[
+    CategoryService, Depends(singleton(CategoryService))
+]
 transformation_service_depends = Annotated[
-    TransformationService, Depends(TransformationService)
+    TransformationService, Depends(singleton(TransformationService))
 ]
 transformation_step_service_depends = Annotated[
-    TransformationStepService, Depends(TransformationStepService)
+    TransformationStepService, Depends(singleton(TransformationStepService))
 ]
-user_service_depends = Annotated[UserService, Depends(UserService)]
+user_service_depends = Annotated[UserService, Depends(singleton(UserService))]
+# Built per request: its repository holds the signed in user's auth session
 auth_service_depends = Annotated[AuthService, Depends(AuthService)]
-inventory_service_depends = Annotated[InventoryService, Depends(InventoryService)]
-ingredient_service_depends = Annotated[IngredientService, Depends(IngredientService)]
-product_service_depends = Annotated[ProductService, Depends(ProductService)]
+inventory_service_depends = Annotated[
+    InventoryService, Depends(singleton(InventoryService))
+]
+ingredient_service_depends = Annotated[
+    IngredientService, Depends(singleton(IngredientService))
+]
+product_service_depends = Annotated[ProductService, Depends(singleton(ProductService))]
@@ -0,0 +1,36 @@
+"""Responses rendered without their declared `response_model`.
+
+FastAPI validates whatever an endpoint returns against its `response_model`
+before serializing it, which repeats the validation the repositories already
+did when building the models from the Supabase rows. Endpoints returning such
+trusted models can hand them to `rendered_response` instead: the body is
+then serialized once by pydantic-core, straight to JSON bytes.
+"""
+
+from typing import Any
+
+from fastapi.responses import Response
+from pydantic_core import to_json
+
+from app.config import FAST_RESPONSES
+
+
+class RenderedJSONResponse(Response):
+    """JSON body serialized by pydantic-core, models included, without revalidation"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def rendered_response(content: Any) -> Any:
+    """Pre-render trusted service output when FAST_RESPONSES is enabled"""
+    if FAST_RESPONSES:
+        return RenderedJSONResponse(content)
+    return content
+
+
+def sparse_response(content: Any) -> RenderedJSONResponse:
+    """Render a sparse fieldset, which the full response model would reject"""
+    return RenderedJSONResponse(content)
@@ -10,10 +10,10 @@ from app.core.exception import DatabaseError
 router: APIRouter = APIRouter(prefix="/v1/auth", tags=["auth"])
 
 @router.post("/signup", response_model=AuthResponse)
-def signup(form: SignupForm, auth_service: auth_service_depends):
+async def signup(form: SignupForm, auth_service: auth_service_depends):
     """Register new user with email and password"""
     try:
-        return auth_service.signup(form)
+        return await auth_service.signup(form)
     except DatabaseError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -21,10 +21,10 @@ def signup(form: SignupForm, auth_service: auth_service_depends):
         )
 
 @router.post("/login", response_model=AuthResponse)
-def login(form: AuthForm, auth_service: auth_service_depends):
+async def login(form: AuthForm, auth_service: auth_service_depends):
     """Authenticate user with email and passworwd"""
     try:
-        return auth_service.login(form)
+        return await auth_service.login(form)
     except DatabaseError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -32,10 +32,10 @@ def login(form: AuthForm, auth_service: auth_service_depends):
         )
 
 @router.post("/logout", response_model=Dict[str, str])
-def logout(request: LogoutRequest, auth_service: auth_service_depends):
+async def logout(request: LogoutRequest, auth_service: auth_service_depends):
     """Sign out user"""
     try:
-        return auth_service.logout(request.access_token)
+        return await auth_service.logout(request.access_token)
     except DatabaseError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -43,10 +43,10 @@ def logout(request: LogoutRequest, auth_service: auth_service_depends):
         )
 
 @router.post("/refresh", response_model=AuthResponse)
-def refresh(request: RefreshTokenRequest, auth_service: auth_service_depends):
+async def refresh(request: RefreshTokenRequest, auth_service: auth_service_depends):
     """Refresh user session"""
     try:
-        return auth_service.refresh_session(request.refresh_token)
+        return await auth_service.refresh_session(request.refresh_token)
     except DatabaseError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -54,10 +54,12 @@ def refresh(request: RefreshTokenRequest, auth_service: auth_service_depends):
         )
 
 @router.post("/change-password")
-def change_password(request: ChangePasswordForm, auth_service: auth_service_depends):
+async def change_password(
+    request: ChangePasswordForm, auth_service: auth_service_depends
+):
     """Change user password"""
     try:
-        return auth_service.change_password(request)
+        return await auth_service.change_password(request)
     except DatabaseError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -0,0 +1,16 @@
+"""Cache statistics endpoints."""
+
+from typing import Dict
+
+from fastapi import APIRouter
+
+from app.db.cache import cache_stats
+from app.utils.token_cache import token_cache
+
+router: APIRouter = APIRouter(prefix="/v1/cache", tags=["cache"])
+
+
+@router.get("/stats")
+async def get_cache_stats() -> Dict[str, Dict[str, int | float]]:
+    """Hit-rate metrics of the read-through caches and the token cache."""
+    return {**cache_stats(), "tokens": token_cache.stats()}
@@ -5,9 +5,11 @@ from typing import Dict, List
 from fastapi import APIRouter, Query, status
 
 from app.api.deps import category_service_depends
+from app.api.responses import sparse_response
 from app.models.category import (
     Category,
     CategoryCreate,
+    CategoryDetailPayload,
     CategoryPayload,
     CategoryUpdate,
 )
@@ -15,43 +17,51 @@ from app.models.category import (
 router: APIRouter = APIRouter(prefix="/v1/categories", tags=["categories"])
 
 
-@router.get("/", response_model=Dict[str, List[Category] | int])
-def get_categories(
+@router.get("/", response_model=Dict[str, List[Category] | int | str | None])
+async def get_categories(
     category_service: category_service_depends, payload: CategoryPayload = Query()
-) -> Dict[str, List[Category] | int]:
-    """Retrieve all categories."""
-    return category_service.get_categories(payload)
+) -> Dict[str, List[Category] | int | str | None]:
+    """Retrieve all categories, or only the `fields` asked of each."""
+    categories = await category_service.get_categories(payload)
+    if payload.fields:
+        return sparse_response(categories)
+    return categories
 
 
 @router.get("/{category_id}", response_model=Category)
-def get_category(
-    category_service: category_service_depends, category_id: str
+async def get_category(
+    category_service: category_service_depends,
+    category_id: str,
+    payload: CategoryDetailPayload = Query(),
 ) -> Category:
     """Retrieve a specific category by ID."""
-    return category_service.get_category(category_id)
+    category = await category_service.get_category(category_id, payload.field_names)
+    if payload.fields:
+        return sparse_response(category)
+    return category
 
 
 @router.post("/", response_model=Category, status_code=status.HTTP_201_CREATED)
-def create_category_endpoint(
+async def create_category_endpoint(
     category_service: category_service_depends, payload: CategoryCreate
 ) -> Category:
     """Create a new category."""
-    return category_service.create_category(payload)
+    return await category_service.create_category(payload)
 
 
 @router.put("/{category_id}", response_model=Category)
-def update_category_endpoint(
+async def update_category_endpoint(
     category_service: category_service_depends,
     category_id: str,
     payload: CategoryUpdate,
 ) -> Category:
     """Update an existing category."""
-    return category_service.update_category(category_id, payload)
+    return await category_service.update_category(category_id, payload)
 
 
 @router.delete("/{category_id}")
-def delete_category_endpoint(
+async def delete_category_endpoint(
     category_service: category_service_depends, category_id: str
 ) -> None:
     """Delete a category."""
-    category_service.delete_category(category_id)
+    await category_service.delete_category(category_id)
@@ -6,9 +6,11 @@ including CRUD operations and business logic for ingredients.
 from typing import Dict, List
 from fastapi import APIRouter, Query, status
 from app.api.deps import ingredient_service_depends
+from app.api.responses import sparse_response
 from app.models.ingredients import (
     Ingredient,
     IngredientCreate,
+    IngredientDetailPayload,
     IngredientPayload,
     IngredientUpdate,
 )
@@ -16,31 +18,42 @@ from app.models.ingredients import (
 router: APIRouter = APIRouter(prefix="/v1/ingredients", tags=["ingredients"])
 
 
-@router.get("/", response_model=Dict[str, List[Ingredient] | int])
-def get_ingredients(
+@router.get("/", response_model=Dict[str, List[Ingredient] | int | str | None])
+async def get_ingredients(
     ingredient_service: ingredient_service_depends, payload: IngredientPayload = Query()
-) -> Dict[str, List[Ingredient] | int]:
-    """Retrieve all ingredients."""
-    return ingredient_service.get_ingredients(payload)
+) -> Dict[str, List[Ingredient] | int | str | None]:
+    """Retrieve all ingredients, or only the `fields` asked of each."""
+    ingredients = await ingredient_service.get_ingredients(payload)
+    if payload.fields:
+        return sparse_response(ingredients)
+    return ingredients
 
 
 @router.get("/{ingredient_id}", response_model=Ingredient)
-def get_ingredient(
-    ingredient_service: ingredient_service_depends, ingredient_id: str
+async def get_ingredient(
+    ingredient_service: ingredient_service_depends,
+    ingredient_id: str,
+    payload: IngredientDetailPayload = Query(),
 ) -> Ingredient:
     """Retrieve a specific ingredient by ID.
 
     Args:
         ingredient_id: Unique identifier of the ingredient
+        payload: Optional sparse fieldset
 
     Returns:
         Ingredient: The requested ingredient record
     """
-    return ingredient_service.get_ingredient(ingredient_id)
+    ingredient = await ingredient_service.get_ingredient(
+        ingredient_id, payload.field_names
+    )
+    if payload.fields:
+        return sparse_response(ingredient)
+    return ingredient
 
 
 @router.post("/", response_model=Ingredient, status_code=status.HTTP_201_CREATED)
-def create_ingredient_endpoint(
+async def create_ingredient_endpoint(
     ingredient_service: ingredient_service_depends, payload: IngredientCreate
 ) -> Ingredient:
     """Create a new ingredient.
@@ -51,11 +64,11 @@ def create_ingredient_endpoint(
     Returns:
         Ingredient: The newly created ingredient
     """
-    return ingredient_service.create_ingredient(payload)
+    return await ingredient_service.create_ingredient(payload)
 
 
 @router.put("/{ingredient_id}", response_model=Ingredient)
-def update_ingredient_endpoint(
+async def update_ingredient_endpoint(
     ingredient_service: ingredient_service_depends,
     ingredient_id: str,
     payload: IngredientUpdate,
@@ -69,11 +82,11 @@ def update_ingredient_endpoint(
     Returns:
         Ingredient: The updated ingredient
     """
-    return ingredient_service.update_ingredient(ingredient_id, payload)
+    return await ingredient_service.update_ingredient(ingredient_id, payload)
 
 
 @router.delete("/{ingredient_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_ingredient_endpoint(
+async def delete_ingredient_endpoint(
     ingredient_service: ingredient_service_depends, ingredient_id: str
 ) -> None:
     """Delete an ingredient.
@@ -81,4 +94,4 @@ def delete_ingredient_endpoint(
     Args:
         ingredient_id: Unique identifier of the ingredient to delete
     """
-    ingredient_service.delete_ingredient(ingredient_id)
+    await ingredient_service.delete_ingredient(ingredient_id)
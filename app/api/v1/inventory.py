@@ -1,14 +1,20 @@
 from typing import Dict, List
 
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
 
 from app.api.deps import inventory_service_depends
+from app.api.responses import rendered_response
+from app.config import INVENTORY_BULK_CHUNK_SIZE
+from app.middleware.etag import conditional
 from app.models.inventory import (
     InventoryCreate,
     InventoryPayload,
     InventoryResponse,
     InventoryTransaction,
+    InventoryTransactionBulkReport,
     InventoryTransactionCreate,
+    InventoryTransactionExportPayload,
     InventoryUpdate,
     InventoryWeeklySummary,
     InventoryWeeklySummaryQuery,
@@ -17,46 +23,50 @@ from app.models.inventory import (
 router = APIRouter(prefix="/v1/inventories", tags=["inventories"])
 
 
-@router.get("/", response_model=Dict[str, List[InventoryResponse] | int])
-def get_inventories(
+@router.get(
+    "/",
+    response_model=Dict[str, List[InventoryResponse] | int | str | None],
+    dependencies=[Depends(conditional("inventory", "inventory_transaction"))],
+)
+async def get_inventories(
     inventory_service: inventory_service_depends, payload: InventoryPayload = Query()
-) -> Dict[str, List[InventoryResponse] | int]:
+) -> Dict[str, List[InventoryResponse] | int | str | None]:
     """Retrieve all inventories"""
-    return inventory_service.get_inventories(payload)
+    return rendered_response(await inventory_service.get_inventories(payload))
 
 
 @router.get("/{inventory_id}", response_model=InventoryResponse)
-def get_inventory(
+async def get_inventory(
     inventory_service: inventory_service_depends, inventory_id: str
 ) -> InventoryResponse:
     """Retrieve a specific inventory by ID"""
-    return inventory_service.get_inventory(inventory_id)
+    return await inventory_service.get_inventory(inventory_id)
 
 
 @router.post("/", response_model=InventoryResponse, status_code=status.HTTP_201_CREATED)
-def create_inventory(
+async def create_inventory(
     inventory_service: inventory_service_depends, payload: InventoryCreate
 ) -> InventoryResponse:
     """Create a new inventory"""
-    return inventory_service.create_inventory(payload)
+    return await inventory_service.create_inventory(payload)
 
 
 @router.put("/{inventory_id}", response_model=InventoryResponse)
-def update_inventory(
+async def update_inventory(
     inventory_service: inventory_service_depends,
     inventory_id: str,
     payload: InventoryUpdate,
 ) -> InventoryResponse:
     """Update an existing inventory"""
-    return inventory_service.update_inventory(inventory_id, payload)
+    return await inventory_service.update_inventory(inventory_id, payload)
 
 
 @router.delete("/{inventory_id}")
-def delete_inventory(
+async def delete_inventory(
     inventory_service: inventory_service_depends, inventory_id: str
 ) -> None:
     """Delete an inventory"""
-    inventory_service.delete_inventory(inventory_id)
+    await inventory_service.delete_inventory(inventory_id)
 
 
 @router.post(
@@ -64,27 +74,81 @@ def delete_inventory(
     response_model=InventoryTransaction,
     status_code=status.HTTP_201_CREATED,
 )
-def add_transaction(
+async def add_transaction(
     inventory_service: inventory_service_depends,
     payload: InventoryTransactionCreate,
 ) -> InventoryTransaction:
     """Add a transaction to an inventory"""
-    return inventory_service.add_transaction(payload)
+    return await inventory_service.add_transaction(payload)
+
+
+@router.post(
+    "/transactions/bulk",
+    response_model=InventoryTransactionBulkReport,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": InventoryTransactionCreate.model_json_schema(),
+                    }
+                },
+                "application/x-ndjson": {
+                    "schema": InventoryTransactionCreate.model_json_schema()
+                },
+            },
+        }
+    },
+)
+async def add_transactions(
+    inventory_service: inventory_service_depends,
+    request: Request,
+    chunk_size: int = Query(default=INVENTORY_BULK_CHUNK_SIZE, ge=1, le=1000),
+) -> InventoryTransactionBulkReport:
+    """Add many transactions from a JSON array or an NDJSON stream.
+
+    The whole body is validated before anything is inserted.
+    """
+    ndjson = request.headers.get("content-type", "").startswith(
+        ("application/x-ndjson", "application/jsonl")
+    )
+    transactions = inventory_service.parse_transactions(await request.body(), ndjson)
+    return await inventory_service.add_transactions(transactions, chunk_size)
+
+
+@router.get("/transactions/export", response_class=StreamingResponse)
+async def export_transactions(
+    inventory_service: inventory_service_depends,
+    payload: InventoryTransactionExportPayload = Query(),
+) -> StreamingResponse:
+    """Stream inventory transactions of a period as CSV or NDJSON"""
+    stream = await inventory_service.export_transactions(payload)
+    return StreamingResponse(
+        stream,
+        media_type=payload.format.media_type,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="inventory_transactions.{payload.format.value}"'
+            )
+        },
+    )
 
 
 @router.get("/{inventory_id}/transactions", response_model=List[InventoryTransaction])
-def get_transactions(
+async def get_transactions(
     inventory_service: inventory_service_depends,
     inventory_id: str,
     payload: InventoryPayload = Query(),
 ) -> List[InventoryTransaction]:
     """Retrieve all transactions for a specific inventory"""
-    return inventory_service.get_transactions(inventory_id, payload)
+    return await inventory_service.get_transactions(inventory_id, payload)
 
 
 @router.post("/weekly-summary", response_model=InventoryWeeklySummary)
-def get_weekly_summary(
+async def get_weekly_summary(
     inventory_service: inventory_service_depends, payload: InventoryWeeklySummaryQuery
 ) -> InventoryWeeklySummary:
     """Retrieve weekly summary for a specific inventory"""
-    return inventory_service.get_weekly_summary(payload)
+    return await inventory_service.get_weekly_summary(payload)
@@ -14,8 +14,8 @@ router: APIRouter = APIRouter(prefix="/v1/llm", tags=["llm"])
 
 
 @router.get("/audio", response_model=Dict[str, List[Purchase] | int])
-def audio_to_object(
+async def audio_to_object(
     purchase_service: purchase_service_depends, payload: PurchasePayload = Query()
 ) -> Dict[str, List[Purchase] | int]:
     """Retrieve all purchases."""
-    return purchase_service.get_purchases(payload)
+    return await purchase_service.get_purchases(payload)
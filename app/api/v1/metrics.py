@@ -0,0 +1,67 @@
+"""Prometheus metrics endpoint."""
+
+import secrets
+
+from anyio import to_thread
+from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+from app.config import METRICS_PUBLIC, METRICS_TOKEN
+from app.db.cache import cache_stats
+from app.utils.metrics import metrics_registry
+from app.utils.token_cache import token_cache
+
+router: APIRouter = APIRouter(tags=["metrics"])
+
+CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+cache_hits = metrics_registry.counter(
+    "cache_hits_total", "Cache lookups served from the cache", ("cache",)
+)
+cache_misses = metrics_registry.counter(
+    "cache_misses_total", "Cache lookups that fell through", ("cache",)
+)
+cache_hit_ratio = metrics_registry.gauge(
+    "cache_hit_ratio", "Share of cache lookups served from the cache", ("cache",)
+)
+threadpool_busy = metrics_registry.gauge(
+    "threadpool_threads_busy", "Worker threads running sync code or Supabase calls"
+)
+threadpool_limit = metrics_registry.gauge(
+    "threadpool_threads_limit", "Size of the threadpool"
+)
+threadpool_waiting = metrics_registry.gauge(
+    "threadpool_tasks_waiting", "Tasks queued for a free worker thread"
+)
+
+
+@metrics_registry.collector
+def collect_caches() -> None:
+    for name, stats in {**cache_stats(), "tokens": token_cache.stats()}.items():
+        lookups = stats["hits"] + stats["misses"]
+        cache_hits.set(name, value=stats["hits"])
+        cache_misses.set(name, value=stats["misses"])
+        cache_hit_ratio.set(name, value=stats["hits"] / lookups if lookups else 0.0)
+
+
+@metrics_registry.collector
+def collect_threadpool() -> None:
+    limiter = to_thread.current_default_thread_limiter()
+    threadpool_busy.set(value=limiter.borrowed_tokens)
+    threadpool_limit.set(value=limiter.total_tokens)
+    threadpool_waiting.set(value=limiter.statistics().tasks_waiting)
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics(authorization: str | None = Header(default=None)):
+    """Metrics of this worker process in the Prometheus text format.
+
+    Closed unless METRICS_TOKEN is set or METRICS_PUBLIC explicitly opens it.
+    """
+    if not METRICS_TOKEN and not METRICS_PUBLIC:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if METRICS_TOKEN and not secrets.compare_digest(
+        authorization or "", f"Bearer {METRICS_TOKEN}"
+    ):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    return PlainTextResponse(metrics_registry.render(), media_type=CONTENT_TYPE)
@@ -1,13 +1,18 @@
 """Product API endpoints."""
 
 from typing import Dict, List
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from app.api.deps import product_service_depends
+from app.api.responses import rendered_response
+from app.middleware.etag import conditional
 from app.models.product import (
     Product,
     ProductCreate,
+    ProductTransactionBatchSales,
+    ProductTransactionBatchSalesReport,
+    ProductTransactionExportPayload,
     ProductTransactionPayload,
-    ProductTransactionResponse,
     ProductTransactionUpdateSales,
     ProductUpdate,
     ProductPayload,
@@ -16,58 +21,92 @@ from app.models.product import (
 router: APIRouter = APIRouter(prefix="/v1/products", tags=["products"])
 
 
-@router.get("/", response_model=Dict[str, List[Product] | int])
-def get_products(
+@router.get(
+    "/",
+    response_model=Dict[str, List[Product] | int | str | None],
+    dependencies=[Depends(conditional("products", "ingredients"))],
+)
+async def get_products(
     product_service: product_service_depends, payload: ProductPayload = Query()
-) -> Dict[str, List[Product] | int]:
+) -> Dict[str, List[Product] | int | str | None]:
     """Retrieve all products."""
-    return product_service.get_products(payload)
+    return rendered_response(await product_service.get_products(payload))
 
 
 @router.get("/{product_id}", response_model=Product)
-def get_product(product_service: product_service_depends, product_id: str) -> Product:
+async def get_product(
+    product_service: product_service_depends, product_id: str
+) -> Product:
     """Retrieve a specific product by ID."""
-    return product_service.get_product(product_id)
+    return await product_service.get_product(product_id)
 
 
 @router.post("/", response_model=Product, status_code=status.HTTP_201_CREATED)
-def create_product_endpoint(
+async def create_product_endpoint(
     product_service: product_service_depends, payload: ProductCreate
 ) -> Product:
     """Create a new product."""
-    return product_service.create_product(payload)
+    return await product_service.create_product(payload)
 
 
 @router.put("/{product_id}", response_model=Product)
-def update_product_endpoint(
+async def update_product_endpoint(
     product_service: product_service_depends,
     product_id: str,
     payload: ProductUpdate,
 ) -> Product:
     """Update an existing product."""
-    return product_service.update_product(product_id, payload)
+    return await product_service.update_product(product_id, payload)
 
 
 @router.delete("/{product_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_product_endpoint(
+async def delete_product_endpoint(
     product_service: product_service_depends, product_id: str
 ) -> None:
     """Delete a product."""
-    product_service.delete_product(product_id)
+    await product_service.delete_product(product_id)
 
 
 @router.post("/transaction/summary")
-def delete_product_transaction_summary(
+async def delete_product_transaction_summary(
     product_service: product_service_depends, payload: ProductTransactionPayload
 ) -> Dict:
     """Get product transaction summary"""
-    return product_service.get_product_transaction_summary(payload)
+    return await product_service.get_product_transaction_summary(payload)
+
+
+@router.get("/transaction/summary/export", response_class=StreamingResponse)
+async def export_product_transaction_summary(
+    product_service: product_service_depends,
+    payload: ProductTransactionExportPayload = Query(),
+) -> StreamingResponse:
+    """Stream products transaction summary as CSV or NDJSON"""
+    stream = await product_service.export_product_transaction_summary(payload)
+    return StreamingResponse(
+        stream,
+        media_type=payload.format.media_type,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="product_summary.{payload.format.value}"'
+            )
+        },
+    )
 
 
 @router.put("/transaction/add")
-def sales_update(
+async def sales_update(
     product_service: product_service_depends, payload: ProductTransactionUpdateSales
 ) -> dict:
     """Update saled of a product transaction"""
-    product_service.update_product_sales(payload)
+    await product_service.update_product_sales(payload)
     return {"status": "success", "message": "sales updated"}
+
+
+@router.put(
+    "/transaction/add/batch", response_model=ProductTransactionBatchSalesReport
+)
+async def sales_update_batch(
+    product_service: product_service_depends, payload: ProductTransactionBatchSales
+) -> ProductTransactionBatchSalesReport:
+    """Record the sales of many products at once"""
+    return await product_service.update_products_sales(payload)
@@ -7,43 +7,73 @@ including CRUD operations and business logic for food purchases.
 from typing import Dict, List
 
 from fastapi import APIRouter, Query, status
+from fastapi.responses import StreamingResponse
 
 from app.api.deps import purchase_service_depends
+from app.api.responses import rendered_response, sparse_response
 from app.models.purchase import (
     Purchase,
     PurchaseCreate,
+    PurchaseDetailPayload,
     PurchasePayload,
 )
+from app.models.shared import ExportPayload
 
 # Create router with prefix and tags for OpenAPI documentation
 router: APIRouter = APIRouter(prefix="/v1/purchases", tags=["purchases"])
 
 
-@router.get("/", response_model=Dict[str, List[Purchase] | int])
-def get_purchases(
+@router.get("/", response_model=Dict[str, List[Purchase] | int | str | None])
+async def get_purchases(
     purchase_service: purchase_service_depends, payload: PurchasePayload = Query()
-) -> Dict[str, List[Purchase] | int]:
-    """Retrieve all purchases."""
-    return purchase_service.get_purchases(payload)
+) -> Dict[str, List[Purchase] | int | str | None]:
+    """Retrieve all purchases, or only the `fields` asked of each."""
+    purchases = await purchase_service.get_purchases(payload)
+    if payload.fields:
+        return sparse_response(purchases)
+    return rendered_response(purchases)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_purchases(
+    purchase_service: purchase_service_depends, payload: ExportPayload = Query()
+) -> StreamingResponse:
+    """Stream all purchases of a period as CSV or NDJSON."""
+    stream = await purchase_service.export_purchases(payload)
+    return StreamingResponse(
+        stream,
+        media_type=payload.format.media_type,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="purchases.{payload.format.value}"'
+            )
+        },
+    )
 
 
 @router.get("/{purchase_id}", response_model=Purchase)
-def get_purchase(
-    purchase_service: purchase_service_depends, purchase_id: str
+async def get_purchase(
+    purchase_service: purchase_service_depends,
+    purchase_id: str,
+    payload: PurchaseDetailPayload = Query(),
 ) -> Purchase:
     """Retrieve a specific purchase by ID.
 
     Args:
         purchase_id: Unique identifier of the purchase
+        payload: Optional sparse fieldset
 
     Returns:
         Purchase: The requested purchase record
     """
-    return purchase_service.get_purchase(purchase_id)
+    purchase = await purchase_service.get_purchase(purchase_id, payload.field_names)
+    if payload.fields:
+        return sparse_response(purchase)
+    return purchase
 
 
 @router.get("/{purchase_id}/summary", response_model=Purchase)
-def get_purchase_summary(
+async def get_purchase_summary(
     purchase_service: purchase_service_depends, purchase_id: str
 ) -> Purchase:
     """Retrieve purchase summary with transformation calculations.
@@ -54,11 +84,11 @@ def get_purchase_summary(
     Returns:
         PurchaseSummary: Purchase with calculated transformation data
     """
-    return purchase_service.purchase_summary(purchase_id)
+    return await purchase_service.purchase_summary(purchase_id)
 
 
 @router.post("/", response_model=Purchase, status_code=status.HTTP_201_CREATED)
-def create_purchase_endpoint(
+async def create_purchase_endpoint(
     purchase_service: purchase_service_depends, payload: PurchaseCreate
 ) -> Purchase:
     """Create a new purchase.
@@ -69,11 +99,11 @@ def create_purchase_endpoint(
     Returns:
         Purchase: The newly created purchase
     """
-    return purchase_service.create_purchase(payload) 
+    return await purchase_service.create_purchase(payload) 
 
 
 @router.delete("/{purchase_id}")
-def delete_purchase_endpoint(
+async def delete_purchase_endpoint(
     purchase_service: purchase_service_depends, purchase_id: str
 ) -> None:
     """Delete a purchase.
@@ -81,4 +111,4 @@ def delete_purchase_endpoint(
     Args:
         purchase_id: Unique identifier of the purchase to delete
     """
-    purchase_service.delete_purchase(purchase_id)
+    await purchase_service.delete_purchase(purchase_id)
@@ -8,12 +8,14 @@ from fastapi import APIRouter, Depends
 
 from app.api.v1 import (
     auth,
+    cache,
     categories,
     inventory,
     products,
     purchases,
     transformations,
     ingredients,
+    metrics,
     transformations_steps,
     users,
 )
@@ -34,3 +36,5 @@ api_router.include_router(
 api_router.include_router(ingredients.router, dependencies=[Depends(check_login)])
 api_router.include_router(products.router, dependencies=[Depends(check_login)])
 api_router.include_router(users.router)
+api_router.include_router(cache.router, dependencies=[Depends(check_login)])
+api_router.include_router(metrics.router)
@@ -6,11 +6,14 @@ from fastapi import APIRouter, Query, status
 from app.models.transformation import (
     Transformation,
     TransformationCreate,
+    TransformationDetailPayload,
     TransformationPayload,
     TransformationUpdate,
     TransformationSummary,
+    TransformationSummaryPayload,
 )
 from app.api.deps import transformation_service_depends
+from app.api.responses import rendered_response, sparse_response
 
 # Create router with prefix and tags for OpenAPI documentation
 router: APIRouter = APIRouter(
@@ -19,61 +22,82 @@ router: APIRouter = APIRouter(
 )
 
 
-@router.get("/", response_model=Dict[str, List[Transformation] | int])
-def get_transformations(
+@router.get("/", response_model=Dict[str, List[Transformation] | int | str | None])
+async def get_transformations(
     transformation_service: transformation_service_depends,
     payload: TransformationPayload = Query(),
 ) -> List[Transformation]:
-    """Retrieve all transformations."""
-    return transformation_service.get_transformations(payload)
+    """Retrieve all transformations, or only the `fields` asked of each."""
+    transformations = await transformation_service.get_transformations(payload)
+    if payload.fields:
+        return sparse_response(transformations)
+    return rendered_response(transformations)
 
 
 @router.get("/{transformation_id}", response_model=Transformation)
-def get_transformation(
-    transformation_service: transformation_service_depends, transformation_id: str
+async def get_transformation(
+    transformation_service: transformation_service_depends,
+    transformation_id: str,
+    payload: TransformationDetailPayload = Query(),
 ) -> Transformation:
     """Retrieve a specific transformation by ID."""
-    return transformation_service.get_transformation(transformation_id)
+    transformation = await transformation_service.get_transformation(
+        transformation_id, payload.field_names
+    )
+    if payload.fields:
+        return sparse_response(transformation)
+    return transformation
 
 
 @router.get("/purchase/{purchase_id}", response_model=Transformation)
-def get_purchase_transformation(
+async def get_purchase_transformation(
     transformation_service: transformation_service_depends, purchase_id: str
 ) -> Transformation:
     """Retrieve a specific transformation by Purchase ID."""
-    return transformation_service.get_transformation_by_purchase(purchase_id)
+    return await transformation_service.get_transformation_by_purchase(purchase_id)
 
 
 @router.get("/{transformation_id}/summary", response_model=TransformationSummary)
-def get_transformation_summary(
+async def get_transformation_summary(
     transformation_service: transformation_service_depends, transformation_id: str
 ) -> TransformationSummary:
     """Retrieve transformation summary with step calculations."""
-    return transformation_service.transformation_summary(transformation_id)
+    return await transformation_service.transformation_summary(transformation_id)
+
+
+@router.post("/summaries", response_model=List[TransformationSummary])
+async def get_transformation_summaries(
+    transformation_service: transformation_service_depends,
+    payload: TransformationSummaryPayload,
+) -> List[TransformationSummary]:
+    """Retrieve the summaries of several transformations at once."""
+    return await transformation_service.transformation_summaries(payload)
 
 
 @router.post("/", response_model=Transformation, status_code=status.HTTP_201_CREATED)
-def create_transformation_endpoint(
+async def create_transformation_endpoint(
     transformation_service: transformation_service_depends,
     payload: TransformationCreate,
 ) -> Transformation:
     """Create a new transformation."""
-    return transformation_service.create_transformation(payload)
+    return await transformation_service.create_transformation(payload)
 
 
 @router.put("/{transformation_id}", response_model=Transformation)
-def update_transformation_endpoint(
+async def update_transformation_endpoint(
     transformation_service: transformation_service_depends,
     transformation_id: str,
     payload: TransformationUpdate,
 ) -> Transformation:
     """Update an existing transformation."""
-    return transformation_service.update_transformation(transformation_id, payload)
+    return await transformation_service.update_transformation(
+        transformation_id, payload
+    )
 
 
 @router.delete("/{transformation_id}")
-def delete_transformation_endpoint(
+async def delete_transformation_endpoint(
     transformation_service: transformation_service_depends, transformation_id: str
 ) -> None:
     """Delete a transformation."""
-    transformation_service.delete_transformation(transformation_id)
+    await transformation_service.delete_transformation(transformation_id)
@@ -1,10 +1,11 @@
 """User API endpoints."""
 
 from typing import List
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
-from app.models.users import User, UserCreate, UserUpdate
+from app.models.users import User, UserCreate, UserPayload, UserUpdate
 from app.api.deps import user_service_depends
+from app.api.responses import sparse_response
 
 from app.utils.auth import check_login
 
@@ -17,34 +18,48 @@ router: APIRouter = APIRouter(
 
 
 @router.get("/", response_model=List[User])
-def get_users(user_service: user_service_depends) -> List[User]:
-    """Retrieve all users."""
-    return user_service.get_users()
+async def get_users(
+    user_service: user_service_depends, payload: UserPayload = Query()
+) -> List[User]:
+    """Retrieve all users, or only the `fields` asked of each."""
+    users = await user_service.get_users(payload.field_names)
+    if payload.fields:
+        return sparse_response(users)
+    return users
 
 
 @router.get("/{user_id}", response_model=User)
-def get_user(user_service: user_service_depends, user_id: str) -> User:
+async def get_user(
+    user_service: user_service_depends,
+    user_id: str,
+    payload: UserPayload = Query(),
+) -> User:
     """Retrieve a specific user by ID."""
-    return user_service.get_user(user_id)
+    user = await user_service.get_user(user_id, payload.field_names)
+    if payload.fields:
+        return sparse_response(user)
+    return user
 
 
 @router.post("/", response_model=User, status_code=status.HTTP_201_CREATED)
-def create_user_endpoint(
+async def create_user_endpoint(
     user_service: user_service_depends, payload: UserCreate
 ) -> User:
     """Create a new user."""
-    return user_service.create_user(payload)
+    return await user_service.create_user(payload)
 
 
 @router.put("/{user_id}", response_model=User)
-def update_user_endpoint(
+async def update_user_endpoint(
     user_service: user_service_depends, user_id: str, payload: UserUpdate
 ) -> User:
     """Update an existing user."""
-    return user_service.update_user(user_id, payload)
+    return await user_service.update_user(user_id, payload)
 
 
 @router.delete("/{user_id}")
-def delete_user_endpoint(user_service: user_service_depends, user_id: str) -> None:
+async def delete_user_endpoint(
+    user_service: user_service_depends, user_id: str
+) -> None:
     """Delete a user."""
-    user_service.delete_user(user_id)
+    await user_service.delete_user(user_id)
@@ -12,4 +12,78 @@ load_dotenv()
 
 # Supabase configuration
 SUPABASE_URL: str | None = os.getenv("SUPABASE_URL")
-SUPABASE_SERVICE_ROLE_KEY: str | None = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
\ No newline at end of file
+SUPABASE_SERVICE_ROLE_KEY: str | None = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+
+# "sync" runs the sync Supabase client in the threadpool, "async" awaits the
+# async client on the event loop
+SUPABASE_CLIENT_MODE: str = os.getenv("SUPABASE_CLIENT_MODE", "sync")
+
+# Shared HTTP connection pool used by every Supabase client
+SUPABASE_POOL_MAX_CONNECTIONS: int = int(
+    os.getenv("SUPABASE_POOL_MAX_CONNECTIONS", "50")
+)
+SUPABASE_POOL_MAX_KEEPALIVE: int = int(os.getenv("SUPABASE_POOL_MAX_KEEPALIVE", "20"))
+SUPABASE_POOL_KEEPALIVE_EXPIRY: float = float(
+    os.getenv("SUPABASE_POOL_KEEPALIVE_EXPIRY", "30")
+)
+SUPABASE_HTTP_TIMEOUT: float = float(os.getenv("SUPABASE_HTTP_TIMEOUT", "120"))
+
+# Access token verification: "remote" asks Supabase Auth on every request,
+# "local" checks the JWT signature against the cached JWKS or shared secret
+AUTH_VERIFY_MODE: str = os.getenv("AUTH_VERIFY_MODE", "remote")
+SUPABASE_JWT_SECRET: str | None = os.getenv("SUPABASE_JWT_SECRET")
+SUPABASE_JWT_AUDIENCE: str = os.getenv("SUPABASE_JWT_AUDIENCE", "authenticated")
+SUPABASE_JWKS_TTL: float = float(os.getenv("SUPABASE_JWKS_TTL", "600"))
+
+# Supabase tokens only carry `email_confirmed_at` when a custom access token
+# hook adds it. Without the claim, local mode asks Supabase Auth once per user
+# and trusts the confirmation for this long
+AUTH_CONFIRMED_USER_TTL: float = float(os.getenv("AUTH_CONFIRMED_USER_TTL", "3600"))
+
+# Cache of validated access tokens used by the auth dependency
+AUTH_TOKEN_CACHE_SIZE: int = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "1024"))
+AUTH_TOKEN_CACHE_TTL: float = float(os.getenv("AUTH_TOKEN_CACHE_TTL", "60"))
+
+# Rows per multi-row insert of the bulk inventory transaction endpoint
+INVENTORY_BULK_CHUNK_SIZE: int = int(os.getenv("INVENTORY_BULK_CHUNK_SIZE", "500"))
+
+# Rows fetched per keyset chunk by the streaming export endpoints
+EXPORT_CHUNK_SIZE: int = int(os.getenv("EXPORT_CHUNK_SIZE", "1000"))
+
+# Read-through cache of reference data: "memory" (per process LRU), "redis"
+# (any Redis-compatible server, needs the `redis` extra) or "none"
+CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "memory")
+CACHE_REDIS_URL: str = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+CACHE_MAX_SIZE: int = int(os.getenv("CACHE_MAX_SIZE", "4096"))
+CACHE_TTL: float = float(os.getenv("CACHE_TTL", "300"))
+
+# Worker processes of the deployment, as read by uvicorn and gunicorn. The
+# memory cache backend is only consistent with a single one
+WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# Weekly inventory summaries of windows that ended before today (UTC) are kept
+# this long: only a backdated transaction can change them, and it evicts them.
+# Needs CACHE_BACKEND=redis, the memory backend keeps them for CACHE_TTL since
+# a worker cannot evict the entries of the others
+WEEKLY_SUMMARY_CLOSED_TTL: float = float(
+    os.getenv("WEEKLY_SUMMARY_CLOSED_TTL", str(365 * 24 * 3600))
+)
+
+# How long a list ETag is trusted without querying Supabase, bounding the
+# staleness of writes that did not go through this API
+CONDITIONAL_GET_TTL: float = float(os.getenv("CONDITIONAL_GET_TTL", "10"))
+
+# Per-request Supabase call timings: sent as a `Server-Timing` header (exposes
+# table and RPC names to clients) and logged as one JSON line per request
+SERVER_TIMING_HEADER: bool = os.getenv("SERVER_TIMING_HEADER", "true") == "true"
+REQUEST_TIMING_LOG: bool = os.getenv("REQUEST_TIMING_LOG", "true") == "true"
+
+# Bearer token required to scrape /metrics. Without it the route answers 404,
+# unless METRICS_PUBLIC=true opens it for a scraper on a private network, in
+# which case the ingress must block /metrics from the outside
+METRICS_TOKEN: str | None = os.getenv("METRICS_TOKEN")
+METRICS_PUBLIC: bool = os.getenv("METRICS_PUBLIC", "false") == "true"
+
+# Serialize the models returned by the list endpoints once, straight to JSON,
+# instead of revalidating them against their response_model first
+FAST_RESPONSES: bool = os.getenv("FAST_RESPONSES", "false") == "true"
@@ -0,0 +1,264 @@
+"""Read-through cache of reference data.
+
+Rows that are read far more often than written (categories, ingredients,
+products, users) are fetched by id through a `ReadThroughCache`. Entries are
+stored as JSON in the configured backend: an in-process LRU with TTL, or a
+Redis-compatible server (Redis, Valkey, ...) shared by every worker. The
+repositories invalidate entries on their own writes, and the TTL bounds the
+staleness of rows changed by anyone else.
+
+Invalidations and table version tokens live in the backend too, so the memory
+backend only sees the writes of its own process: with several workers the
+others would keep serving stale rows until the TTL. `check_backend` therefore
+refuses it when WEB_CONCURRENCY announces more than one worker, multi-worker
+deployments use CACHE_BACKEND=redis (or none).
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from app.config import (
+    CACHE_BACKEND,
+    CACHE_MAX_SIZE,
+    CACHE_REDIS_URL,
+    CACHE_TTL,
+    WEB_CONCURRENCY,
+)
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+# Lifetime of table version tokens, far beyond any entry relying on them
+VERSION_TTL: float = 24 * 3600
+
+
+class CacheBackend:
+    """Storage of serialized entries, shared by every `ReadThroughCache`"""
+
+    async def get(self, key: str) -> str | None:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Per-process LRU with a TTL per entry"""
+
+    def __init__(self, max_size: int = 4096) -> None:
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+
+    async def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis-compatible server, requires the `redis` extra"""
+
+    def __init__(self, url: str) -> None:
+        try:
+            from redis import asyncio as redis
+        except ImportError:
+            raise RuntimeError(
+                "CACHE_BACKEND=redis requires the redis package, "
+                "install the project with the `redis` extra"
+            )
+        self._redis = redis.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> str | None:
+        return await self._redis.get(key)
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        await self._redis.set(key, value, px=int(ttl * 1000))
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(key)
+
+    async def aclose(self) -> None:
+        await self._redis.aclose()
+
+
+_backend: CacheBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def get_backend() -> CacheBackend | None:
+    """Configured backend, created on first use, None when caching is off"""
+    global _backend
+    if CACHE_BACKEND == "none":
+        return None
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                if CACHE_BACKEND == "redis":
+                    _backend = RedisCacheBackend(CACHE_REDIS_URL)
+                else:
+                    _backend = MemoryCacheBackend(CACHE_MAX_SIZE)
+    return _backend
+
+
+def check_backend() -> None:
+    """Refuse a per-process backend that the other workers would not see"""
+    if CACHE_BACKEND == "memory" and WEB_CONCURRENCY > 1:
+        raise RuntimeError(
+            f"CACHE_BACKEND=memory cannot invalidate entries across the "
+            f"{WEB_CONCURRENCY} workers of WEB_CONCURRENCY, "
+            "use CACHE_BACKEND=redis or none"
+        )
+
+
+async def close_backend() -> None:
+    """Release the backend connections at shutdown"""
+    global _backend
+    if _backend is not None:
+        await _backend.aclose()
+        _backend = None
+
+
+# Every read-through cache by namespace, for metrics
+caches: Dict[str, "ReadThroughCache"] = {}
+
+
+class ReadThroughCache(Generic[M]):
+    def __init__(self, namespace: str, model: Type[M], ttl: float = CACHE_TTL) -> None:
+        self.namespace = namespace
+        self.model = model
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        caches[namespace] = self
+
+    def _key(self, key: str) -> str:
+        return f"cache:{self.namespace}:{key}"
+
+    async def get(
+        self, key: str, load: Callable[[str], Awaitable[M | None]]
+    ) -> M | None:
+        """Return the cached row, or load it and cache it when it exists.
+
+        Backend failures are logged and degrade to a plain database read.
+        """
+        backend = get_backend()
+        if backend is None:
+            return await load(key)
+
+        try:
+            cached = await backend.get(self._key(key))
+        except Exception:
+            logger.exception("Cache read failed for %s", self._key(key))
+            cached = None
+        if cached is not None:
+            self.hits += 1
+            return self.model.model_validate_json(cached)
+
+        self.misses += 1
+        value = await load(key)
+        if value is not None:
+            try:
+                await backend.set(self._key(key), value.model_dump_json(), self.ttl)
+            except Exception:
+                logger.exception("Cache write failed for %s", self._key(key))
+        return value
+
+    async def invalidate(self, key: str) -> None:
+        """Drop an entry after the row was written"""
+        backend = get_backend()
+        if backend is None:
+            return
+        try:
+            await backend.delete(self._key(key))
+        except Exception:
+            logger.exception("Cache invalidation failed for %s", self._key(key))
+
+    def stats(self) -> Dict[str, int | float]:
+        """Hit and miss counters plus hit rate"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def cache_stats() -> Dict[str, Dict[str, int | float]]:
+    """Hit-rate metrics of every read-through cache"""
+    return {namespace: cache.stats() for namespace, cache in caches.items()}
+
+
+async def table_versions(
+    tables: Iterable[str], ttl: float = VERSION_TTL
+) -> Dict[str, str] | None:
+    """Current version token of each table, None when it cannot be known.
+
+    A token changes whenever a repository writes to its table, so two equal
+    snapshots prove that no write went through this API in between.
+    """
+    backend = get_backend()
+    if backend is None:
+        return None
+    versions: Dict[str, str] = {}
+    try:
+        for table in tables:
+            version = await backend.get(f"version:{table}")
+            if version is None:
+                version = uuid.uuid4().hex
+                await backend.set(f"version:{table}", version, ttl)
+            versions[table] = version
+    except Exception:
+        logger.exception("Cache read failed for table versions")
+        return None
+    return versions
+
+
+async def bump_table_version(table: str, ttl: float = VERSION_TTL) -> None:
+    """Mark a table, or a slice of it, as written"""
+    backend = get_backend()
+    if backend is None:
+        return
+    try:
+        await backend.set(f"version:{table}", uuid.uuid4().hex, ttl)
+    except Exception:
+        logger.exception("Cache write failed for version:%s", table)
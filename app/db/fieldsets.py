@@ -0,0 +1,27 @@
+"""PostgREST select lists of sparse fieldsets."""
+
+from typing import Any, Iterable, Tuple, Type, get_args
+
+from pydantic import BaseModel
+
+
+def _is_relation(annotation: Any) -> bool:
+    """Whether a field holds embedded rows, e.g. `List[Transformation] | None`"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_is_relation(arg) for arg in get_args(annotation))
+
+
+def select_columns(
+    model: Type[BaseModel], fields: Tuple[str, ...], keys: Iterable[str] = ()
+) -> str:
+    """Select only `fields`, plus the `keys` needed server side (e.g. cursors).
+
+    Fields holding related models are embedded whole, `name(*)`.
+    """
+    columns = []
+    for name in dict.fromkeys((*keys, *fields)):
+        field = model.model_fields.get(name)
+        is_relation = field is not None and _is_relation(field.annotation)
+        columns.append(f"{name}(*)" if is_relation else name)
+    return ",".join(columns)
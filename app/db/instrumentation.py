@@ -0,0 +1,106 @@
+"""Per-request accounting of Supabase round-trips.
+
+`SUPABASE.execute` and `SUPABASE.run` time every PostgREST, RPC and Auth
+call and record it, with the table or RPC it targeted, on the timings of
+the current request. `ServerTimingMiddleware` opens those timings for each
+request and reports them, so N+1 query patterns and slow RPCs are visible
+per route. Every call is also exported to the `/metrics` histograms.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from app.utils.metrics import supabase_call_duration, supabase_call_errors
+
+# PostgREST verbs by HTTP method
+OPERATIONS: Dict[str, str] = {
+    "GET": "select",
+    "HEAD": "select",
+    "POST": "insert",
+    "PATCH": "update",
+    "PUT": "upsert",
+    "DELETE": "delete",
+}
+
+
+@dataclass
+class SupabaseCall:
+    kind: str
+    name: str
+    operation: str
+    duration: float
+    failed: bool = False
+
+
+@dataclass
+class RequestTimings:
+    """Supabase calls made while serving one request"""
+
+    started: float = field(default_factory=time.perf_counter)
+    calls: List[SupabaseCall] = field(default_factory=list)
+
+    @property
+    def total(self) -> float:
+        return sum(call.duration for call in self.calls)
+
+    def by_target(self) -> Dict[Tuple[str, str], List[SupabaseCall]]:
+        """Calls grouped by (kind, name), slowest target first"""
+        groups: Dict[Tuple[str, str], List[SupabaseCall]] = {}
+        for call in self.calls:
+            groups.setdefault((call.kind, call.name), []).append(call)
+        return dict(
+            sorted(
+                groups.items(),
+                key=lambda item: sum(c.duration for c in item[1]),
+                reverse=True,
+            )
+        )
+
+
+# Shared by reference with the tasks a request spawns (asyncio.gather, ...)
+current_timings: ContextVar[RequestTimings | None] = ContextVar(
+    "current_timings", default=None
+)
+
+
+def describe_query(query: Any) -> Tuple[str, str, str]:
+    """(kind, name, operation) of a PostgREST request builder"""
+    request = getattr(query, "request", None)
+    path = getattr(getattr(request, "path", None), "path", "")
+    method = getattr(request, "http_method", "GET")
+    method = str(getattr(method, "value", method))
+    target = path.rsplit("/rest/v1/", 1)[-1]
+    if target.startswith("rpc/"):
+        return "rpc", target.removeprefix("rpc/"), "call"
+    return "table", target or "unknown", OPERATIONS.get(method, method.lower())
+
+
+def describe_call(fn: Callable[..., Any]) -> Tuple[str, str, str]:
+    """(kind, name, operation) of a client method such as `auth.get_user`"""
+    module = getattr(fn, "__module__", "") or ""
+    kind = "auth" if module.startswith(("supabase_auth", "gotrue")) else "client"
+    return kind, getattr(fn, "__name__", repr(fn)), "call"
+
+
+@contextmanager
+def track_call(kind: str, name: str, operation: str) -> Iterator[None]:
+    """Time a Supabase call, export it and record it on the current request"""
+    started = time.perf_counter()
+    failed = True
+    try:
+        yield
+        failed = False
+    finally:
+        duration = time.perf_counter() - started
+        supabase_call_duration.observe(kind, name, operation, value=duration)
+        if failed:
+            supabase_call_errors.inc(kind, name)
+
+        timings = current_timings.get()
+        if timings is not None:
+            timings.calls.append(
+                SupabaseCall(kind, name, operation, duration, failed)
+            )
@@ -0,0 +1,86 @@
+"""Keyset (cursor) pagination helpers for PostgREST list queries.
+
+Rows are ordered by a sort column with the primary key as tie-breaker, and
+the next page starts strictly after the last `(value, id)` pair returned.
+"""
+
+from typing import Any, AsyncIterator, Callable, Dict, List
+
+from postgrest import APIResponse, CountMethod
+
+from app.db.supabase import SUPABASE
+from app.models.shared import CountMode, Cursor
+
+
+def _quote(value: Any) -> str:
+    """Quote a value for a PostgREST logic tree (timestamps contain `:` and `+`)"""
+    return '"{}"'.format(str(value).replace("\\", "\\\\").replace('"', '\\"'))
+
+
+def apply_keyset(
+    stmt: Any,
+    cursor: Cursor | None,
+    column: str,
+    id_column: str,
+    is_desc: bool = True,
+) -> Any:
+    """Order by `(column, id_column)` and filter rows after the cursor"""
+    stmt = stmt.order(column, desc=is_desc).order(id_column, desc=is_desc)
+    if cursor is None:
+        return stmt
+
+    op = "lt" if is_desc else "gt"
+    value, id = _quote(cursor.value), _quote(cursor.id)
+    return stmt.or_(
+        f"{column}.{op}.{value},and({column}.eq.{value},{id_column}.{op}.{id})"
+    )
+
+
+def next_cursor(
+    rows: List[Dict[str, Any]], limit: int, column: str, id_column: str
+) -> str | None:
+    """Cursor for the page after `rows`, None once the last page is reached"""
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return Cursor(value=last[column], id=str(last[id_column])).encode()
+
+
+async def iter_keyset(
+    db: SUPABASE,
+    build: Callable[[], Any],
+    column: str,
+    id_column: str,
+    chunk_size: int,
+    is_desc: bool = False,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Walk a whole query in keyset chunks of raw rows.
+
+    `build` returns a fresh filtered query for every chunk, as PostgREST
+    builders are mutated by each call.
+    """
+    cursor: Cursor | None = None
+    while True:
+        stmt = build().limit(chunk_size)
+        stmt = apply_keyset(stmt, cursor, column, id_column, is_desc)
+        resp = await db.execute(stmt)
+        if resp.data:
+            yield resp.data
+        if len(resp.data) < chunk_size:
+            return
+        last = resp.data[-1]
+        cursor = Cursor(value=last[column], id=str(last[id_column]))
+
+
+def count_method(mode: CountMode) -> CountMethod | None:
+    """PostgREST count method for a count mode, None skips the count"""
+    if mode == CountMode.NONE:
+        return None
+    return CountMethod(mode.value)
+
+
+def total_count(resp: APIResponse, mode: CountMode) -> int | None:
+    """Total reported by PostgREST, None when the count was skipped"""
+    if mode == CountMode.NONE:
+        return None
+    return resp.count if resp.count else 0
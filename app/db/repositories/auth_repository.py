@@ -6,29 +6,38 @@ handling login and logout operations with Supabase auth.
 
 from typing import Dict
 
+from supabase import Client
+
 from app.db.repositories.users_repository import UserRepo
-from app.db.supabase import SUPABASE
+from app.db.supabase import SUPABASE, registry
 from app.models.auth import AuthForm, AuthResponse, ChangePasswordForm, SignupForm
 from app.models.users import User, UserCreate
+from app.utils.token_cache import token_cache
 
 
 class AuthRepo(SUPABASE):
     def __init__(self) -> None:
         super().__init__()
+        self._client = registry.new_client()
         self.user_repo = UserRepo()
 
-    def sign_in(self, form: AuthForm) -> AuthResponse:
+    def get_supabase(self) -> Client:
+        """Return the client holding this repository's own auth session"""
+        return self._client
+
+    async def sign_in(self, form: AuthForm) -> AuthResponse:
         """Authenticate user with email and password"""
-        response = self.client.auth.sign_in_with_password(
-            {"email": form.email, "password": form.password}
+        response = await self.run(
+            self.client.auth.sign_in_with_password,
+            {"email": form.email, "password": form.password},
         )
 
         if not response.user or not response.session:
             raise Exception("Invalid credentials")
 
         # Get user data from users table
-        user_data = (
-            self.client.table("users").select("*").eq("email", form.email).execute()
+        user_data = await self.execute(
+            self.client.table("users").select("*").eq("email", form.email)
         )
 
         if user_data.data and len(user_data.data) > 0:
@@ -41,7 +50,7 @@ class AuthRepo(SUPABASE):
                 full_name=metadata.get("full_name", ""),
                 role=metadata.get("role", "manager"),
             )
-            user = self.user_repo.create_user(user_create)
+            user = await self.user_repo.create_user(user_create)
 
         return AuthResponse(
             access_token=response.session.access_token,
@@ -52,16 +61,17 @@ class AuthRepo(SUPABASE):
             user=user,
         )
 
-    def sign_up(self, form: SignupForm) -> AuthResponse:
+    async def sign_up(self, form: SignupForm) -> AuthResponse:
         """Register new user with email and password"""
-        response = self.client.auth.sign_up(
+        response = await self.run(
+            self.client.auth.sign_up,
             {
                 "email": form.email,
                 "password": form.password,
                 "options": {
                     "data": {"full_name": form.full_name, "role": form.role.value}
                 },
-            }
+            },
         )
 
         if not response.user:
@@ -71,7 +81,7 @@ class AuthRepo(SUPABASE):
         user_create = UserCreate(
             email=form.email, full_name=form.full_name, role=form.role.value
         )
-        user = self.user_repo.create_user(user_create)
+        user = await self.user_repo.create_user(user_create)
 
         return AuthResponse(
             access_token="",
@@ -82,23 +92,25 @@ class AuthRepo(SUPABASE):
             user=user,
         )
 
-    def sign_out(self) -> Dict[str, str]:
+    async def sign_out(self, access_token: str | None = None) -> Dict[str, str]:
         """Sign out user"""
-        self.client.auth.sign_out()
+        if access_token:
+            token_cache.revoke(access_token)
+        await self.run(self.client.auth.sign_out)
         return {"message": "Successfully logged out"}
 
-    def validate_token(self, token: str) -> bool:
+    async def validate_token(self, token: str) -> bool:
         """Validate user token and check user status"""
-        response = self.client.auth.get_user(token)
+        response = await self.run(self.client.auth.get_user, token)
 
         if not response.user or not response.user.id:
             return False
 
         return True
 
-    def refresh_session(self, refresh_token: str) -> AuthResponse:
+    async def refresh_session(self, refresh_token: str) -> AuthResponse:
         """Refresh user session with refresh token"""
-        response = self.client.auth.refresh_session(refresh_token)
+        response = await self.run(self.client.auth.refresh_session, refresh_token)
 
         return AuthResponse(
             access_token=response.session.access_token,
@@ -108,17 +120,20 @@ class AuthRepo(SUPABASE):
             metadata=response.user.user_metadata,
         )
 
-    def change_password(self, payload: ChangePasswordForm):
+    async def change_password(self, payload: ChangePasswordForm):
         """Change user password"""
-        response = self.client.auth.sign_in_with_password(
-            {"email": payload.email, "password": payload.old_password}
+        response = await self.run(
+            self.client.auth.sign_in_with_password,
+            {"email": payload.email, "password": payload.old_password},
         )
 
         if not response.user or not response.session:
             raise Exception("Invalid credentials")
 
-        self.client.auth.update_user({"password": payload.password})
+        await self.run(self.client.auth.update_user, {"password": payload.password})
         if not response.user:
             return None
 
+        token_cache.revoke_user(response.user.id)
+
         return {"message": "Password changed successfully"}
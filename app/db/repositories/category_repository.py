@@ -2,31 +2,41 @@
 
 from typing import List, Tuple
 
-from postgrest import CountMethod
-
+from app.db.cache import ReadThroughCache
+from app.db.fieldsets import select_columns
+from app.db.pagination import count_method, total_count
 from app.db.supabase import SUPABASE
 from app.models.category import Category, CategoryCreate, CategoryUpdate
+from app.models.shared import CountMode, sparse_copy, sparse_model
 from app.services.serialization import serialize_for_supabase
 
 TABLE_NAME: str = "categories"
 
+category_cache: ReadThroughCache[Category] = ReadThroughCache(TABLE_NAME, Category)
+
 
 class CategoryRepo(SUPABASE):
     def __init__(self) -> None:
         super().__init__()
 
-    def list_categories(
+    async def list_categories(
         self,
         limit: int = 20,
         offset: int = 0,
         is_desc: bool = True,
         start_date: str | None = None,
         end_date: str | None = None,
-    ) -> Tuple[List[Category], int]:
-        """Retrieve all categories from the database."""
+        count_mode: CountMode = CountMode.EXACT,
+        fields: Tuple[str, ...] | None = None,
+    ) -> Tuple[List[Category], int | None]:
+        """Retrieve all categories from the database, or only their `fields`."""
+        model, columns = Category, "*"
+        if fields:
+            model = sparse_model(Category, fields)
+            columns = select_columns(Category, fields)
         stmt = (
             self.client.table(TABLE_NAME)
-            .select("*", count=CountMethod.exact)
+            .select(columns, count=count_method(count_mode))
             .limit(limit)
             .offset(offset)
             .order("created_at", desc=is_desc)
@@ -36,47 +46,61 @@ class CategoryRepo(SUPABASE):
         if end_date:
             stmt = stmt.lte("created_at", end_date)
 
-        resp = stmt.execute()
+        resp = await self.execute(stmt)
         return (
-            [Category.model_validate(row) for row in resp.data],
-            resp.count if resp.count else 0,
+            [model.model_validate(row) for row in resp.data],
+            total_count(resp, count_mode),
         )
 
-    def get_category_by_id(self, category_id: str) -> Category | None:
-        """Retrieve a specific category by its ID."""
-        resp = self.client.table(TABLE_NAME).select("*").eq("id", category_id).execute()
+    async def get_category_by_id(
+        self, category_id: str, fields: Tuple[str, ...] | None = None
+    ) -> Category | None:
+        """Retrieve a specific category by its ID, through the cache."""
+        category = await category_cache.get(category_id, self._load_category)
+        if category is not None and fields:
+            return sparse_copy(category, fields)
+        return category
+
+    async def _load_category(self, category_id: str) -> Category | None:
+        resp = await self.execute(
+            self.client.table(TABLE_NAME).select("*").eq("id", category_id)
+        )
         data = resp.data
         if data:
             return Category.model_validate(data[0])
         return None
 
-    def create_category(self, payload: CategoryCreate) -> Category:
+    async def create_category(self, payload: CategoryCreate) -> Category:
         """Create a new category in the database."""
         data = serialize_for_supabase(payload.model_dump())
-        resp = self.client.table(TABLE_NAME).insert(data).execute()
+        resp = await self.execute(self.client.table(TABLE_NAME).insert(data))
         return Category.model_validate(resp.data[0])
 
-    def update_category(
+    async def update_category(
         self, category_id: str, payload: CategoryUpdate
     ) -> Category | None:
         """Update an existing category in the database."""
         update_data = {k: v for k, v in payload.model_dump(exclude_unset=True).items()}
         if not update_data:
-            return self.get_category_by_id(category_id)
+            return await self.get_category_by_id(category_id)
 
         update_data = serialize_for_supabase(update_data)
 
-        resp = (
+        resp = await self.execute(
             self.client.table(TABLE_NAME)
             .update(update_data)
             .eq("id", category_id)
-            .execute()
         )
+        await category_cache.invalidate(category_id)
         data = resp.data
         if data:
             return Category.model_validate(data[0])
         return None
 
-    def delete_category(self, category_id: str) -> None:
-        """Delete a category from the database."""
-        self.client.table(TABLE_NAME).delete().eq("id", category_id).execute()
+    async def delete_category(self, category_id: str) -> bool:
+        """Delete a category from the database, returning whether it existed."""
+        resp = await self.execute(
+            self.client.table(TABLE_NAME).delete().eq("id", category_id)
+        )
+        await category_cache.invalidate(category_id)
+        return bool(resp.data)
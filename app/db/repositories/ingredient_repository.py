@@ -5,41 +5,60 @@ handling all CRUD operations with the Supabase database.
 
 from typing import List, Tuple
 from uuid import UUID
-from postgrest import CountMethod
+from app.db.cache import ReadThroughCache, bump_table_version
+from app.db.fieldsets import select_columns
+from app.db.pagination import apply_keyset, count_method, next_cursor, total_count
 from app.db.supabase import SUPABASE
 from app.models.ingredients import (
     Ingredient,
     IngredientCreate,
     IngredientUpdate,
 )
+from app.models.shared import CountMode, Cursor, sparse_copy, sparse_model
 from app.services.serialization import serialize_for_supabase
 
 TABLE_NAME: str = "ingredients"
 
+ingredient_cache: ReadThroughCache[Ingredient] = ReadThroughCache(
+    TABLE_NAME, Ingredient
+)
+
 
 class IngredientRepo(SUPABASE):
     def __init__(self) -> None:
         super().__init__()
 
-    def list_ingredients(
+    async def list_ingredients(
         self,
         limit: int = 20,
         offset: int = 0,
         name: str | None = None,
         category: UUID | None = None,
-    ) -> Tuple[List[Ingredient], int]:
+        cursor: Cursor | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+        fields: Tuple[str, ...] | None = None,
+    ) -> Tuple[List[Ingredient], int | None, str | None]:
         """Retrieve all ingredients from the database.
 
+        Args:
+            fields: Sparse fieldset, the rows then only hold these fields
+
         Returns:
-            Tuple[List[Ingredient], int]: List of ingredients and total count
+            Tuple[List[Ingredient], int | None, str | None]: List of ingredients, total
+            count and the cursor of the next page
         """
+        model, columns = Ingredient, "*"
+        if fields:
+            model = sparse_model(Ingredient, fields)
+            columns = select_columns(Ingredient, fields, keys=("created_at", "id"))
         stmt = (
             self.client.table(TABLE_NAME)
-            .select("*", count=CountMethod.exact)
+            .select(columns, count=count_method(count_mode))
             .limit(limit)
-            .offset(offset)
-            .order("created_at", desc=True)
         )
+        stmt = apply_keyset(stmt, cursor, "created_at", "id")
+        if cursor is None:
+            stmt = stmt.offset(offset)
 
         if name:
             stmt = stmt.ilike("name", f"%{name}%")
@@ -47,30 +66,40 @@ class IngredientRepo(SUPABASE):
         if category:
             stmt = stmt.eq("category", str(category))
 
-        resp = stmt.execute()
+        resp = await self.execute(stmt)
         return (
-            [Ingredient.model_validate(row) for row in resp.data],
-            resp.count if resp.count else 0,
+            [model.model_validate(row) for row in resp.data],
+            total_count(resp, count_mode),
+            next_cursor(resp.data, limit, "created_at", "id"),
         )
 
-    def get_ingredient_by_id(self, ingredient_id: str) -> Ingredient | None:
+    async def get_ingredient_by_id(
+        self, ingredient_id: str, fields: Tuple[str, ...] | None = None
+    ) -> Ingredient | None:
         """Retrieve a specific ingredient by its ID.
 
         Args:
             ingredient_id: Unique identifier of the ingredient
+            fields: Sparse fieldset, the record then only holds these fields
 
         Returns:
             Ingredient | None: The requested ingredient or None if not found
         """
-        resp = (
-            self.client.table(TABLE_NAME).select("*").eq("id", ingredient_id).execute()
+        ingredient = await ingredient_cache.get(ingredient_id, self._load_ingredient)
+        if ingredient is not None and fields:
+            return sparse_copy(ingredient, fields)
+        return ingredient
+
+    async def _load_ingredient(self, ingredient_id: str) -> Ingredient | None:
+        resp = await self.execute(
+            self.client.table(TABLE_NAME).select("*").eq("id", ingredient_id)
         )
         data = resp.data
         if data:
             return Ingredient.model_validate(data[0])
         return None
 
-    def create_ingredient(self, payload: IngredientCreate) -> Ingredient:
+    async def create_ingredient(self, payload: IngredientCreate) -> Ingredient:
         """Create a new ingredient in the database.
 
         Args:
@@ -80,10 +109,11 @@ class IngredientRepo(SUPABASE):
             Ingredient: The newly created ingredient record
         """
         data = serialize_for_supabase(payload.model_dump())
-        resp = self.client.table(TABLE_NAME).insert(data).execute()
+        resp = await self.execute(self.client.table(TABLE_NAME).insert(data))
+        await bump_table_version(TABLE_NAME)
         return Ingredient.model_validate(resp.data[0])
 
-    def update_ingredient(
+    async def update_ingredient(
         self, ingredient_id: str, payload: IngredientUpdate
     ) -> Ingredient | None:
         """Update an existing ingredient in the database.
@@ -93,20 +123,32 @@ class IngredientRepo(SUPABASE):
             payload: Updated ingredient data
 
         Returns:
-            Ingredient: The updated ingredient record
+            Ingredient | None: The updated ingredient record, or None if not found
         """
         data = {k: v for k, v in payload.model_dump(exclude_unset=True).items()}
         if not data:
-            return self.get_ingredient_by_id(ingredient_id)
-        resp = (
-            self.client.table(TABLE_NAME).update(data).eq("id", ingredient_id).execute()
+            return await self.get_ingredient_by_id(ingredient_id)
+        resp = await self.execute(
+            self.client.table(TABLE_NAME).update(data).eq("id", ingredient_id)
         )
-        return Ingredient.model_validate(resp.data[0])
+        await ingredient_cache.invalidate(ingredient_id)
+        await bump_table_version(TABLE_NAME)
+        if resp.data:
+            return Ingredient.model_validate(resp.data[0])
+        return None
 
-    def delete_ingredient(self, ingredient_id: str) -> None:
+    async def delete_ingredient(self, ingredient_id: str) -> bool:
         """Delete an ingredient from the database.
 
         Args:
             ingredient_id: Unique identifier of the ingredient to delete
+
+        Returns:
+            bool: Whether an ingredient was deleted
         """
-        self.client.table(TABLE_NAME).delete().eq("id", ingredient_id).execute()
+        resp = await self.execute(
+            self.client.table(TABLE_NAME).delete().eq("id", ingredient_id)
+        )
+        await ingredient_cache.invalidate(ingredient_id)
+        await bump_table_version(TABLE_NAME)
+        return bool(resp.data)
@@ -1,7 +1,20 @@
-from typing import List, Tuple
-
-from postgrest import CountMethod
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Iterable, List, Tuple
 
+from app.config import (
+    CACHE_BACKEND,
+    CACHE_TTL,
+    EXPORT_CHUNK_SIZE,
+    WEEKLY_SUMMARY_CLOSED_TTL,
+)
+from app.db.cache import ReadThroughCache, bump_table_version, table_versions
+from app.db.pagination import (
+    apply_keyset,
+    count_method,
+    iter_keyset,
+    next_cursor,
+    total_count,
+)
 from app.db.supabase import SUPABASE
 from app.models.inventory import (
     InventoryCreate,
@@ -12,15 +25,61 @@ from app.models.inventory import (
     InventoryWeeklySummary,
     InventoryWeeklySummaryQuery,
 )
+from app.models.shared import CountMode, Cursor
 
 TABLE_NAME = "inventory"
+SUMMARY_TABLE = "daily_transaction_summary"
+
+# Weekly summaries by their full input. Each entry is keyed on the version
+# tokens of the calendar weeks its window covers, which inserting a
+# transaction in one of those weeks replaces. Windows still open also expire
+# with the default TTL. Closed ones are kept for WEEKLY_SUMMARY_CLOSED_TTL, but
+# only in a shared backend: an in-process one never sees the writes taken by
+# the other workers, so there they expire like open windows
+weekly_summary_cache: ReadThroughCache[InventoryWeeklySummary] = ReadThroughCache(
+    "weekly_summary", InventoryWeeklySummary
+)
+closed_weekly_summary_cache: ReadThroughCache[InventoryWeeklySummary] = (
+    ReadThroughCache(
+        "weekly_summary_closed",
+        InventoryWeeklySummary,
+        ttl=WEEKLY_SUMMARY_CLOSED_TTL if CACHE_BACKEND == "redis" else CACHE_TTL,
+    )
+)
+
+# Longer windows are not cached, their version lookups would outweigh the RPC
+MAX_CACHED_WEEKS = 6
+
+
+def _today() -> date:
+    """UTC date, the one of the timestamps stored by Supabase"""
+    return datetime.now(timezone.utc).date()
+
+
+def _monday(value: str | None) -> date:
+    """First day of the week of an ISO date or timestamp, today's when None"""
+    day = date.fromisoformat(value[:10]) if value else _today()
+    return day - timedelta(days=day.weekday())
+
+
+def _week_version(inventory_id: str, monday: date) -> str:
+    return f"inventory_transaction:{inventory_id}:{monday.isoformat()}"
+
+
+async def _bump_weeks(transactions: Iterable[InventoryTransaction]) -> None:
+    """Evict the weekly summaries covering the weeks of new transactions"""
+    weeks = {(t.inventory_id, _monday(t.created_at)) for t in transactions}
+    for inventory_id, monday in weeks:
+        await bump_table_version(
+            _week_version(inventory_id, monday), ttl=WEEKLY_SUMMARY_CLOSED_TTL
+        )
 
 
 class InventoryRepository(SUPABASE):
     def __init__(self):
         super().__init__()
 
-    def list_inventories(
+    async def list_inventories(
         self,
         search: str | None = None,
         category_id: str | None = None,
@@ -29,14 +88,33 @@ class InventoryRepository(SUPABASE):
         is_desc: bool = True,
         start_date: str | None = None,
         end_date: str | None = None,
-    ) -> Tuple[List[InventoryResponse], int]:
+        cursor: Cursor | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+        include_summary: bool = False,
+        summary_from: date | None = None,
+        summary_to: date | None = None,
+        summary_limit: int = 31,
+    ) -> Tuple[List[InventoryResponse], int | None, str | None]:
+        """List inventories, with a bounded window of daily summaries if asked"""
+        columns = f"*, {SUMMARY_TABLE}(*)" if include_summary else "*"
         stmt = (
             self.client.table(TABLE_NAME)
-            .select("*, daily_transaction_summary(*)", count=CountMethod.exact)
+            .select(columns, count=count_method(count_mode))
             .limit(limit)
-            .offset(offset)
-            .order("created_at", desc=is_desc)
         )
+        if include_summary:
+            stmt = stmt.order(
+                "summary_date", desc=True, foreign_table=SUMMARY_TABLE
+            ).limit(summary_limit, foreign_table=SUMMARY_TABLE)
+            if summary_from:
+                stmt = stmt.gte(
+                    f"{SUMMARY_TABLE}.summary_date", summary_from.isoformat()
+                )
+            if summary_to:
+                stmt = stmt.lte(f"{SUMMARY_TABLE}.summary_date", summary_to.isoformat())
+        stmt = apply_keyset(stmt, cursor, "created_at", "inventory_id", is_desc)
+        if cursor is None:
+            stmt = stmt.offset(offset)
         if search:
             stmt = stmt.ilike("name", f"%{search}%")
         if category_id:
@@ -46,18 +124,18 @@ class InventoryRepository(SUPABASE):
         if end_date:
             stmt = stmt.lte("created_at", end_date)
 
-        resp = stmt.execute()
+        resp = await self.execute(stmt)
         return (
             [InventoryResponse.model_validate(row) for row in resp.data],
-            resp.count if resp.count else 0,
+            total_count(resp, count_mode),
+            next_cursor(resp.data, limit, "created_at", "inventory_id"),
         )
 
-    def get_by_id(self, inventory_id: str) -> InventoryResponse | None:
-        response = (
+    async def get_by_id(self, inventory_id: str) -> InventoryResponse | None:
+        response = await self.execute(
             self.client.table(TABLE_NAME)
             .select("*")
             .eq("inventory_id", inventory_id)
-            .execute()
         )
         return (
             InventoryResponse.model_validate(response.data[0])
@@ -65,41 +143,63 @@ class InventoryRepository(SUPABASE):
             else None
         )
 
-    def create(self, inventory: InventoryCreate) -> InventoryResponse:
+    async def create(self, inventory: InventoryCreate) -> InventoryResponse:
         data = inventory.model_dump()
-        response = self.client.table(TABLE_NAME).insert(data).execute()
+        response = await self.execute(self.client.table(TABLE_NAME).insert(data))
+        await bump_table_version(TABLE_NAME)
         return InventoryResponse.model_validate(response.data[0])
 
-    def update(
+    async def update(
         self, inventory_id: str, inventory: InventoryUpdate
     ) -> InventoryResponse | None:
         data = {k: v for k, v in inventory.model_dump(exclude_unset=True).items()}
         if not data:
-            return self.get_by_id(inventory_id)
+            return await self.get_by_id(inventory_id)
 
-        response = (
+        response = await self.execute(
             self.client.table(TABLE_NAME)
             .update(data)
             .eq("inventory_id", inventory_id)
-            .execute()
         )
+        await bump_table_version(TABLE_NAME)
         return (
             InventoryResponse.model_validate(response.data[0])
             if response.data
             else None
         )
 
-    def delete(self, inventory_id: str) -> None:
-        self.client.table(TABLE_NAME).delete().eq(
-            "inventory_id", inventory_id
-        ).execute()
+    async def delete(self, inventory_id: str) -> bool:
+        """Delete an inventory, returning whether it existed"""
+        response = await self.execute(
+            self.client.table(TABLE_NAME).delete().eq("inventory_id", inventory_id)
+        )
+        await bump_table_version(TABLE_NAME)
+        return bool(response.data)
 
-    def add_transaction(self, transaction: InventoryTransactionCreate):
+    async def add_transaction(self, transaction: InventoryTransactionCreate):
         data = transaction.model_dump()
-        response = self.client.table("inventory_transaction").insert(data).execute()
-        return InventoryTransaction.model_validate(response.data[0])
+        response = await self.execute(
+            self.client.table("inventory_transaction").insert(data)
+        )
+        await bump_table_version("inventory_transaction")
+        created = InventoryTransaction.model_validate(response.data[0])
+        await _bump_weeks([created])
+        return created
+
+    async def add_transactions(
+        self, transactions: List[InventoryTransactionCreate]
+    ) -> List[InventoryTransaction]:
+        """Insert several transactions with a single multi-row insert"""
+        data = [transaction.model_dump() for transaction in transactions]
+        response = await self.execute(
+            self.client.table("inventory_transaction").insert(data)
+        )
+        await bump_table_version("inventory_transaction")
+        created = [InventoryTransaction.model_validate(item) for item in response.data]
+        await _bump_weeks(created)
+        return created
 
-    def get_transactions(
+    async def get_transactions(
         self,
         inventory_id: str,
         start_date: str | None = None,
@@ -120,31 +220,88 @@ class InventoryRepository(SUPABASE):
         if end_date is not None:
             query = query.lte("created_at", end_date)
 
-        response = query.execute()
+        response = await self.execute(query)
         print(response.data)
         if len(response.data) > 0:
             return [InventoryTransaction.model_validate(item) for item in response.data]
 
         return []
 
-    def get_day_transaction(
+    def iter_transactions(
+        self,
+        inventory_id: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Walk inventory transactions of a period in keyset chunks of raw rows"""
+
+        def build() -> Any:
+            stmt = self.client.table("inventory_transaction").select("*")
+            if inventory_id:
+                stmt = stmt.eq("inventory_id", inventory_id)
+            if start_date:
+                stmt = stmt.gte("created_at", start_date)
+            if end_date:
+                stmt = stmt.lte("created_at", end_date)
+            return stmt
+
+        return iter_keyset(self, build, "created_at", "id", chunk_size)
+
+    async def get_day_transaction(
         self, date: str | None, inventory_id: str
     ) -> InventoryTransaction | None:
         if date is None:
             return None
-        response = (
+        response = await self.execute(
             self.client.table("inventory_transaction")
             .select("*")
             .eq("inventory_id", inventory_id)
             .gte("created_at", date)
             .lte("created_at", date)
-            .execute()
         )
         if len(response.data) > 0:
             return InventoryTransaction.model_validate(response.data[0])
         return None
 
-    def get_weekly_summary(self, payload: InventoryWeeklySummaryQuery):
+    async def get_weekly_summary(
+        self, payload: InventoryWeeklySummaryQuery
+    ) -> InventoryWeeklySummary:
+        """Summary of a window, served from the cache while its weeks are unchanged"""
+        try:
+            first, last = _monday(payload.start_date), _monday(payload.end_date)
+            closed = date.fromisoformat(payload.end_date[:10]) < _today()
+        except ValueError:
+            return await self._load_weekly_summary(payload)
+        weeks = (last - first).days // 7 + 1
+        if not 0 < weeks <= MAX_CACHED_WEEKS:
+            return await self._load_weekly_summary(payload)
+
+        versions = await table_versions(
+            [
+                _week_version(payload.inventory_id, first + timedelta(weeks=week))
+                for week in range(weeks)
+            ],
+            ttl=WEEKLY_SUMMARY_CLOSED_TTL,
+        )
+        if versions is None:
+            return await self._load_weekly_summary(payload)
+
+        key = ":".join(
+            [
+                payload.inventory_id,
+                payload.start_date,
+                payload.end_date,
+                str(payload.manual_qty),
+                *versions.values(),
+            ]
+        )
+        cache = closed_weekly_summary_cache if closed else weekly_summary_cache
+        return await cache.get(key, lambda _: self._load_weekly_summary(payload))
+
+    async def _load_weekly_summary(
+        self, payload: InventoryWeeklySummaryQuery
+    ) -> InventoryWeeklySummary:
         data = payload.model_dump()
         input = {
             "p_current_manual_qty": data["manual_qty"],
@@ -152,5 +309,7 @@ class InventoryRepository(SUPABASE):
             "p_end_date": data["end_date"],
             "p_inventory_id": data["inventory_id"],
         }
-        response = self.client.rpc("calculate_weekly_summary", input).execute()
+        response = await self.execute(
+            self.client.rpc("calculate_weekly_summary", input)
+        )
         return InventoryWeeklySummary.model_validate(response.data[0])
@@ -1,42 +1,54 @@
 """Product repository for database operations."""
 
-from typing import List, Tuple
+from typing import Any, AsyncIterator, Dict, List, Set, Tuple
 from uuid import UUID
-from postgrest import CountMethod
+from app.config import EXPORT_CHUNK_SIZE
+from app.db.cache import ReadThroughCache, bump_table_version
+from app.db.pagination import (
+    apply_keyset,
+    count_method,
+    iter_keyset,
+    next_cursor,
+    total_count,
+)
 from app.db.supabase import SUPABASE
 from app.models.product import (
     Product,
     ProductCreate,
-    ProductTransaction,
     ProductTransactionPayload,
-    ProductTransactionResponse,
     ProductTransactionUpdateSales,
     ProductUpdate,
 )
+from app.models.shared import CountMode, Cursor
 from app.services.serialization import serialize_for_supabase
 
 TABLE_NAME: str = "products"
 
+product_cache: ReadThroughCache[Product] = ReadThroughCache(TABLE_NAME, Product)
+
 
 class ProductRepo(SUPABASE):
     def __init__(self) -> None:
         super().__init__()
 
-    def list_products(
+    async def list_products(
         self,
         limit: int = 20,
         offset: int = 0,
         name: str | None = None,
         category: UUID | None = None,
         ingredient_id: UUID | None = None,
-    ) -> Tuple[List[Product], int]:
+        cursor: Cursor | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> Tuple[List[Product], int | None, str | None]:
         stmt = (
             self.client.table(TABLE_NAME)
-            .select("*, ingredients(*)", count=CountMethod.exact)
+            .select("*, ingredients(*)", count=count_method(count_mode))
             .limit(limit)
-            .offset(offset)
-            .order("created_at", desc=True)
         )
+        stmt = apply_keyset(stmt, cursor, "created_at", "product_id")
+        if cursor is None:
+            stmt = stmt.offset(offset)
 
         if name:
             stmt = stmt.ilike("name", f"%{name}%")
@@ -45,73 +57,133 @@ class ProductRepo(SUPABASE):
         if ingredient_id:
             stmt = stmt.eq("ingredient_id", str(ingredient_id))
 
-        resp = stmt.execute()
+        resp = await self.execute(stmt)
         return (
             [Product.model_validate(row) for row in resp.data],
-            resp.count if resp.count else 0,
+            total_count(resp, count_mode),
+            next_cursor(resp.data, limit, "created_at", "product_id"),
         )
 
-    def get_product_by_id(self, product_id: str) -> Product | None:
-        resp = (
+    async def get_product_by_id(self, product_id: str) -> Product | None:
+        return await product_cache.get(product_id, self._load_product)
+
+    async def _load_product(self, product_id: str) -> Product | None:
+        resp = await self.execute(
             self.client.table(TABLE_NAME)
             .select("*")
             .eq("product_id", product_id)
-            .execute()
         )
         data = resp.data
         if data:
             return Product.model_validate(data[0])
         return None
 
-    def create_product(self, payload: ProductCreate) -> Product:
+    async def create_product(self, payload: ProductCreate) -> Product:
         data = serialize_for_supabase(payload.model_dump())
-        resp = self.client.table(TABLE_NAME).insert(data).execute()
+        resp = await self.execute(self.client.table(TABLE_NAME).insert(data))
+        await bump_table_version(TABLE_NAME)
         return Product.model_validate(resp.data[0])
 
-    def update_product(self, product_id: str, payload: ProductUpdate) -> Product | None:
+    async def update_product(
+        self, product_id: str, payload: ProductUpdate
+    ) -> Product | None:
         data = {k: v for k, v in payload.model_dump(exclude_unset=True).items()}
         if not data:
-            return self.get_product_by_id(product_id)
-        resp = (
+            return await self.get_product_by_id(product_id)
+        resp = await self.execute(
             self.client.table(TABLE_NAME)
             .update(data)
             .eq("product_id", product_id)
-            .execute()
         )
-        return Product.model_validate(resp.data[0])
+        await product_cache.invalidate(product_id)
+        await bump_table_version(TABLE_NAME)
+        if resp.data:
+            return Product.model_validate(resp.data[0])
+        return None
 
-    def delete_product(self, product_id: str) -> None:
-        self.client.table(TABLE_NAME).delete().eq("product_id", product_id).execute()
+    async def delete_product(self, product_id: str) -> bool:
+        """Delete a product, returning whether it existed"""
+        resp = await self.execute(
+            self.client.table(TABLE_NAME).delete().eq("product_id", product_id)
+        )
+        await product_cache.invalidate(product_id)
+        await bump_table_version(TABLE_NAME)
+        return bool(resp.data)
 
-    def calculate_product_transaction_summary(
+    async def calculate_product_transaction_summary(
         self, payload: ProductTransactionPayload
-    ) -> ProductTransactionResponse:
-        """Using start and end date we calculate the summary of all product transactions and group them by dates"""
-        stmt = (
-            self.client.rpc(
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Using start and end date we calculate the summary of all products.
+
+        The database groups the daily rows by product and paginates products,
+        each returned row holds one product with its `days` as a JSON array.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: The products of the page and the
+            number of products in the period
+        """
+        stmt = self.client.rpc(
+            "get_product_transactions_summary_grouped",
+            {
+                "p_start_date": payload.start_date,
+                "p_end_date": payload.end_date,
+                "p_name": payload.name,
+                "p_limit": payload.limit,
+                "p_offset": payload.offset,
+            },
+        )
+        response = await self.execute(stmt)
+        count = response.data[0]["total_count"] if response.data else 0
+        products = [
+            {key: value for key, value in row.items() if key != "total_count"}
+            for row in response.data
+        ]
+        return products, count
+
+    def iter_product_transaction_summary(
+        self,
+        start_date: str,
+        end_date: str,
+        name: str | None = None,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Walk the daily product summaries of a period in keyset chunks of raw rows"""
+
+        def build() -> Any:
+            stmt = self.client.rpc(
                 "get_product_transactions_summary",
-                {
-                    "p_start_date": payload.start_date,
-                    "p_end_date": payload.end_date,
-                },
-                count=CountMethod.exact,
+                {"p_start_date": start_date, "p_end_date": end_date},
             )
-            .limit(payload.limit)
-            .offset(payload.offset)
+            if name:
+                stmt = stmt.ilike("name", f"%{name}%")
+            return stmt
+
+        return iter_keyset(self, build, "day", "product_id", chunk_size)
+
+    async def update_product_transaction_sales(
+        self, payload: ProductTransactionUpdateSales
+    ):
+        stmt = self.client.from_("product_transactions").insert(
+            {"sale": payload.sales, "product_id": payload.product_id}
         )
-        if payload.name:
-            stmt = stmt.ilike("name", f"%{payload.name}%")
-
-        response = stmt.execute()
-        # Parse the output
-        return ProductTransactionResponse(
-            summaries=[ProductTransaction.model_validate(row) for row in response.data],
-            count=response.count,
+        response = await self.execute(stmt)
+        return response
+
+    async def get_existing_product_ids(self, product_ids: List[str]) -> Set[str]:
+        """Return which of the given product IDs exist, in a single query"""
+        resp = await self.execute(
+            self.client.table(TABLE_NAME)
+            .select("product_id")
+            .in_("product_id", product_ids)
         )
+        return {row["product_id"] for row in resp.data}
 
-    def update_product_transaction_sales(self, payload: ProductTransactionUpdateSales):
+    async def add_product_transaction_sales(
+        self, items: List[ProductTransactionUpdateSales]
+    ):
+        """Record several sales with a single multi-row insert"""
         stmt = self.client.from_("product_transactions").insert(
-            {"sale": payload.sales, "product_id": payload.product_id}
+            [{"sale": item.sales, "product_id": item.product_id} for item in items]
         )
-        response = stmt.execute()
+        response = await self.execute(stmt)
         return response
@@ -4,15 +4,23 @@ This module provides data access layer functions for purchase entities,
 handling all CRUD operations with the Supabase database.
 """
 
-from typing import List, Tuple
-
-from postgrest import CountMethod
-
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+from app.config import EXPORT_CHUNK_SIZE
+from app.db.fieldsets import select_columns
+from app.db.pagination import (
+    apply_keyset,
+    count_method,
+    iter_keyset,
+    next_cursor,
+    total_count,
+)
 from app.db.supabase import SUPABASE
 from app.models.purchase import (
     Purchase,
     PurchaseCreate,
 )
+from app.models.shared import CountMode, Cursor, sparse_model
 from app.services.serialization import serialize_for_supabase
 
 # Database table name for purchases
@@ -23,7 +31,7 @@ class PurchaseRepo(SUPABASE):
     def __init__(self) -> None:
         super().__init__()
 
-    def list_purchases(
+    async def list_purchases(
         self,
         search: str | None = None,
         category_id: str | None = None,
@@ -34,19 +42,31 @@ class PurchaseRepo(SUPABASE):
         start_date: str | None = None,
         end_date: str | None = None,
         ingredient: str | None = None,
-    ) -> Tuple[List[Purchase], int]:
+        cursor: Cursor | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+        fields: Tuple[str, ...] | None = None,
+    ) -> Tuple[List[Purchase], int | None, str | None]:
         """Retrieve all purchases from the database.
 
+        Args:
+            fields: Sparse fieldset, the rows then only hold these fields
+
         Returns:
-            List[Purchase]: List of all purchase records ordered by date (newest first)
+            Tuple[List[Purchase], int | None, str | None]: Purchase records ordered by
+            date (newest first), total count and the cursor of the next page
         """
+        model, columns = Purchase, "*"
+        if fields:
+            model = sparse_model(Purchase, fields)
+            columns = select_columns(Purchase, fields, keys=("created_at", "id"))
         stmt = (
             self.client.table(TABLE_NAME)
-            .select("*", count=CountMethod.exact)
+            .select(columns, count=count_method(count_mode))
             .limit(limit)
-            .offset(offset)
-            .order("created_at", desc=is_desc)
         )
+        stmt = apply_keyset(stmt, cursor, "created_at", "id", is_desc)
+        if cursor is None:
+            stmt = stmt.offset(offset)
         if ingredient:
             stmt = stmt.eq("item_name", ingredient)
         if search:
@@ -60,34 +80,57 @@ class PurchaseRepo(SUPABASE):
         if end_date:
             stmt = stmt.lte("created_at", end_date)
 
-        resp = stmt.execute()
+        resp = await self.execute(stmt)
 
         return (
-            [Purchase.model_validate(row) for row in resp.data],
-            resp.count if resp.count else 0,
+            [model.model_validate(row) for row in resp.data],
+            total_count(resp, count_mode),
+            next_cursor(resp.data, limit, "created_at", "id"),
         )
 
-    def get_purchase_by_id(self, purchase_id: str) -> Purchase | None:
+    def iter_purchases(
+        self,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Walk all purchases of a period in keyset chunks of raw rows"""
+
+        def build() -> Any:
+            stmt = self.client.table(TABLE_NAME).select("*")
+            if start_date:
+                stmt = stmt.gte("created_at", start_date)
+            if end_date:
+                stmt = stmt.lte("created_at", end_date)
+            return stmt
+
+        return iter_keyset(self, build, "created_at", "id", chunk_size)
+
+    async def get_purchase_by_id(
+        self, purchase_id: str, fields: Tuple[str, ...] | None = None
+    ) -> Purchase | None:
         """Retrieve a specific purchase by its ID.
 
         Args:
             purchase_id: Unique identifier of the purchase
+            fields: Sparse fieldset, the record then only holds these fields
 
         Returns:
             Purchase: The requested purchase record
         """
-        resp = (
-            self.client.table(TABLE_NAME)
-            .select("*, transformations(*)")
-            .eq("id", purchase_id)
-            .execute()
+        model, columns = Purchase, "*, transformations(*)"
+        if fields:
+            model = sparse_model(Purchase, fields)
+            columns = select_columns(Purchase, fields)
+        resp = await self.execute(
+            self.client.table(TABLE_NAME).select(columns).eq("id", purchase_id)
         )
         data = resp.data
         if data:
-            return Purchase.model_validate(data[0])
+            return model.model_validate(data[0])
         return None
 
-    def create_purchase(self, payload: PurchaseCreate) -> Purchase:
+    async def create_purchase(self, payload: PurchaseCreate) -> Purchase:
         """Create a new purchase in the database.
 
         Args:
@@ -97,13 +140,19 @@ class PurchaseRepo(SUPABASE):
             Purchase: The newly created purchase record
         """
         data = serialize_for_supabase(payload.model_dump())
-        resp = self.client.table(TABLE_NAME).insert(data).execute()
+        resp = await self.execute(self.client.table(TABLE_NAME).insert(data))
         return Purchase.model_validate(resp.data[0])
 
-    def delete_purchase(self, purchase_id: str) -> None:
+    async def delete_purchase(self, purchase_id: str) -> bool:
         """Delete a purchase from the database.
 
         Args:
             purchase_id: Unique identifier of the purchase to delete
+
+        Returns:
+            bool: Whether a purchase was deleted
         """
-        self.client.table(TABLE_NAME).delete().eq("id", purchase_id).execute()
+        resp = await self.execute(
+            self.client.table(TABLE_NAME).delete().eq("id", purchase_id)
+        )
+        return bool(resp.data)
@@ -6,7 +6,8 @@ handling all CRUD operations with the Supabase database.
 
 from typing import List, Tuple
 
-from postgrest import CountMethod
+from app.db.fieldsets import select_columns
+from app.db.pagination import apply_keyset, count_method, next_cursor, total_count
 from app.db.supabase import SUPABASE
 from app.services.serialization import serialize_for_supabase
 from app.models.transformation import (
@@ -14,6 +15,7 @@ from app.models.transformation import (
     TransformationCreate,
     TransformationUpdate,
 )
+from app.models.shared import CountMode, Cursor, sparse_model
 
 
 # Database table name for transformations
@@ -24,7 +26,7 @@ class TransformationRepo(SUPABASE):
     def __init__(self) -> None:
         super().__init__()
 
-    def list_transformations(
+    async def list_transformations(
         self,
         search: str | None = None,
         limit: int = 20,
@@ -32,19 +34,33 @@ class TransformationRepo(SUPABASE):
         is_desc: bool = True,
         start_date: str | None = None,
         end_date: str | None = None,
-    ) -> Tuple[List[Transformation], int]:
+        cursor: Cursor | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+        fields: Tuple[str, ...] | None = None,
+    ) -> Tuple[List[Transformation], int | None, str | None]:
         """Retrieve all transformations from the database.
 
+        Args:
+            fields: Sparse fieldset, the rows then only hold these fields
+
         Returns:
-            List[Transformation]: List of all transformation records ordered by date (newest first)
+            Tuple[List[Transformation], int | None, str | None]: Transformation records
+            ordered by date (newest first), total count and the next page cursor
         """
+        model, columns = Transformation, "*"
+        if fields:
+            model = sparse_model(Transformation, fields)
+            columns = select_columns(
+                Transformation, fields, keys=("transformation_date", "id")
+            )
         stmt = (
             self.client.table(TABLE_NAME)
-            .select("*", count=CountMethod.exact)
+            .select(columns, count=count_method(count_mode))
             .limit(limit)
-            .offset(offset)
-            .order("transformation_date", desc=is_desc)
         )
+        stmt = apply_keyset(stmt, cursor, "transformation_date", "id", is_desc)
+        if cursor is None:
+            stmt = stmt.offset(offset)
         if search:
             stmt = stmt.ilike("product_name", f"%{search}%")
         if start_date:
@@ -54,33 +70,58 @@ class TransformationRepo(SUPABASE):
             print(end_date)
             stmt = stmt.lte("transformation_date", end_date)
 
-        resp = stmt.execute()
+        resp = await self.execute(stmt)
         return (
-            [Transformation.model_validate(row) for row in resp.data],
-            resp.count if resp.count else 0,
+            [model.model_validate(row) for row in resp.data],
+            total_count(resp, count_mode),
+            next_cursor(resp.data, limit, "transformation_date", "id"),
         )
 
-    def get_transformation_by_id(self, transformation_id: str) -> Transformation | None:
+    async def get_transformation_by_id(
+        self, transformation_id: str, fields: Tuple[str, ...] | None = None
+    ) -> Transformation | None:
         """Retrieve a specific transformation by its ID.
 
         Args:
             transformation_id: Unique identifier of the transformation
+            fields: Sparse fieldset, the record then only holds these fields
 
         Returns:
             Transformation | None: The requested transformation record or None if not found
         """
-        resp = (
+        model, columns = Transformation, "*"
+        if fields:
+            model = sparse_model(Transformation, fields)
+            columns = select_columns(Transformation, fields)
+        resp = await self.execute(
             self.client.table(TABLE_NAME)
-            .select("*")
+            .select(columns)
             .eq("id", str(transformation_id))
-            .execute()
         )
         data = resp.data
         if data:
-            return Transformation.model_validate(data[0])
+            return model.model_validate(data[0])
         return None
 
-    def get_transformation_by_purchase(self, purchase_id: str) -> Transformation | None:
+    async def get_transformations_by_ids(
+        self, transformation_ids: List[str]
+    ) -> List[Transformation]:
+        """Retrieve several transformations in a single query.
+
+        Args:
+            transformation_ids: Unique identifiers of the transformations
+
+        Returns:
+            List[Transformation]: The transformation records found, in no given order
+        """
+        resp = await self.execute(
+            self.client.table(TABLE_NAME).select("*").in_("id", transformation_ids)
+        )
+        return [Transformation.model_validate(row) for row in resp.data]
+
+    async def get_transformation_by_purchase(
+        self, purchase_id: str
+    ) -> Transformation | None:
         """Retrieve a specific transformation by its purchase.
 
         Args:
@@ -89,24 +130,25 @@ class TransformationRepo(SUPABASE):
         Returns:
             Transformation | None: The requested transformation record or None if not found
         """
-        resp = (
+        resp = await self.execute(
             self.client.table(TABLE_NAME)
             .select("*")
             .eq("purchase_id", str(purchase_id))
-            .execute()
         )
         data = resp.data
         if data:
             return Transformation.model_validate(data[0])
         return None
 
-    def create_transformation(self, payload: TransformationCreate) -> Transformation:
+    async def create_transformation(
+        self, payload: TransformationCreate
+    ) -> Transformation:
         """Create a new transformation in the database."""
         data = serialize_for_supabase(payload.model_dump())
-        resp = self.client.table(TABLE_NAME).insert(data).execute()
+        resp = await self.execute(self.client.table(TABLE_NAME).insert(data))
         return Transformation.model_validate(resp.data[0])
 
-    def update_transformation(
+    async def update_transformation(
         self, transformation_id: str, payload: TransformationUpdate
     ) -> Transformation | None:
         """Update an existing transformation in the database.
@@ -120,31 +162,34 @@ class TransformationRepo(SUPABASE):
         """
         update_data = {k: v for k, v in payload.model_dump(exclude_unset=True).items()}
         if not update_data:
-            return self.get_transformation_by_id(transformation_id)
+            return await self.get_transformation_by_id(transformation_id)
 
         update_data = serialize_for_supabase(update_data)
 
-        resp = (
+        resp = await self.execute(
             self.client.table(TABLE_NAME)
             .update(update_data)
             .eq("id", str(transformation_id))
-            .execute()
         )
         data = resp.data
         if data:
             return Transformation.model_validate(data[0])
         return None
 
-    def delete_transformation(self, transformation_id: str) -> None:
+    async def delete_transformation(self, transformation_id: str) -> bool:
         """Delete a transformation from the database.
 
         Args:
             transformation_id: Unique identifier of the transformation to delete
 
+        Returns:
+            bool: Whether a transformation was deleted
+
         Note:
             This operation will also delete all associated transformation steps
             due to cascade delete constraints.
         """
-        self.client.table(TABLE_NAME).delete().eq(
-            "id", str(transformation_id)
-        ).execute()
+        resp = await self.execute(
+            self.client.table(TABLE_NAME).delete().eq("id", str(transformation_id))
+        )
+        return bool(resp.data)
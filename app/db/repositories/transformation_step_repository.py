@@ -1,23 +1,32 @@
 """Transformation step repository for database operations."""
 
-from typing import List
+from typing import Dict, List
 from app.db.supabase import SUPABASE
 from app.services.serialization import serialize_for_supabase
 from app.models.transformation_step import (
     TransformationStep,
     TransformationStepCreate,
     TransformationStepUpdate,
+    TransformationStepTotals,
 )
 
 
 TABLE_NAME: str = "transformation_steps"
 
+# PostgREST aggregate select, enabled by the
+# 20261017000200_enable_postgrest_aggregates migration
+TOTALS_SELECT: str = (
+    "step_count:count(),"
+    "total_portions:portions.sum(),"
+    "total_step_quantity:quantity.sum()"
+)
+
 
 class TransformationStepRepo(SUPABASE):
     def __init__(self) -> None:
         super().__init__()
 
-    def list_steps_by_transformation(
+    async def list_steps_by_transformation(
         self,
         transformation_id: str,
         limit: int = 20,
@@ -40,39 +49,82 @@ class TransformationStepRepo(SUPABASE):
         if end_date:
             stmt = stmt.lte("created_at", end_date)
 
-        resp = stmt.execute()
+        resp = await self.execute(stmt)
         return [TransformationStep.model_validate(row) for row in resp.data]
 
-    def get_step_by_id(self, step_id: str) -> TransformationStep | None:
+    async def get_step_totals(self, transformation_id: str) -> TransformationStepTotals:
+        """Count the steps of a transformation and sum their portions and quantity.
+
+        The aggregation runs in the database, whatever the number of steps.
+        """
+        resp = await self.execute(
+            self.client.table(TABLE_NAME)
+            .select(TOTALS_SELECT)
+            .eq("transformation_id", transformation_id)
+        )
+        if resp.data:
+            return TransformationStepTotals.model_validate(resp.data[0])
+        return TransformationStepTotals()
+
+    async def list_step_totals(
+        self, transformation_ids: List[str]
+    ) -> Dict[str, TransformationStepTotals]:
+        """Step totals of several transformations, grouped by transformation.
+
+        Transformations without any step are absent from the result.
+        """
+        resp = await self.execute(
+            self.client.table(TABLE_NAME)
+            .select(f"transformation_id,{TOTALS_SELECT}")
+            .in_("transformation_id", transformation_ids)
+        )
+        totals = [TransformationStepTotals.model_validate(row) for row in resp.data]
+        if any(item.transformation_id is None for item in totals):
+            raise ValueError(
+                "Step totals came back without transformation_id, "
+                "check that PostgREST aggregates are enabled"
+            )
+        return {item.transformation_id: item for item in totals}
+
+    async def get_step_by_id(self, step_id: str) -> TransformationStep | None:
         """Retrieve a specific transformation step by its ID."""
-        resp = self.client.table(TABLE_NAME).select("*").eq("id", step_id).execute()
+        resp = await self.execute(
+            self.client.table(TABLE_NAME).select("*").eq("id", step_id)
+        )
         data = resp.data
         if data:
             return TransformationStep.model_validate(data[0])
         return None
 
-    def create_step(self, payload: TransformationStepCreate) -> TransformationStep:
+    async def create_step(
+        self, payload: TransformationStepCreate
+    ) -> TransformationStep:
         """Create a new transformation step in the database."""
         data = serialize_for_supabase(payload.model_dump())
-        resp = self.client.table(TABLE_NAME).insert(data).execute()
+        resp = await self.execute(self.client.table(TABLE_NAME).insert(data))
         return TransformationStep.model_validate(resp.data[0])
 
-    def update_step(
+    async def update_step(
         self, step_id: str, payload: TransformationStepUpdate
     ) -> TransformationStep | None:
         """Update an existing transformation step in the database."""
         update_data = {k: v for k, v in payload.model_dump(exclude_unset=True).items()}
         if not update_data:
-            return self.get_step_by_id(step_id)
+            return await self.get_step_by_id(step_id)
 
         update_data = serialize_for_supabase(update_data)
 
-        resp = self.client.table(TABLE_NAME).update(update_data).eq("id", step_id).execute()
+        resp = await self.execute(
+            self.client.table(TABLE_NAME).update(update_data).eq("id", step_id)
+        )
         data = resp.data
         if data:
             return TransformationStep.model_validate(data[0])
         return None
 
-    def delete_step(self, step_id: str) -> None:
-        """Delete a transformation step from the database."""
-        self.client.table(TABLE_NAME).delete().eq("id", step_id).execute()
\ No newline at end of file
+    async def delete_step(self, step_id: str) -> bool:
+        """Delete a transformation step, returning whether it existed."""
+        resp = await self.execute(
+            self.client.table(TABLE_NAME).delete().eq("id", step_id)
+        )
+        return bool(resp.data)
\ No newline at end of file
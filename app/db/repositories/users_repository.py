@@ -4,36 +4,49 @@ This module provides data access layer functions for user entities,
 handling all CRUD operations with the Supabase database.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from app.db.cache import ReadThroughCache
+from app.db.fieldsets import select_columns
 from app.db.supabase import SUPABASE
+from app.models.shared import sparse_copy, sparse_model
 from app.models.users import User, UserCreate, UserUpdate
 from app.services.serialization import serialize_for_supabase
 
 # Database table name for users
 TABLE_NAME: str = "users"
 
+user_cache: ReadThroughCache[User] = ReadThroughCache(TABLE_NAME, User)
+
 
 class UserRepo(SUPABASE):
     def __init__(self) -> None:
         super().__init__()
 
-    def list_users(
+    async def list_users(
         self,
         limit: int = 20,
         offset: int = 0,
         is_desc: bool = True,
         start_date: str | None = None,
         end_date: str | None = None,
+        fields: Tuple[str, ...] | None = None,
     ) -> List[User]:
         """Retrieve all users from the database.
 
+        Args:
+            fields: Sparse fieldset, the rows then only hold these fields
+
         Returns:
             List[User]: List of all user records
         """
+        model, columns = User, "*"
+        if fields:
+            model = sparse_model(User, fields)
+            columns = select_columns(User, fields)
         stmt = (
             self.client.table(TABLE_NAME)
-            .select("*")
+            .select(columns)
             .limit(limit)
             .offset(offset)
             .order("created_at", desc=is_desc)
@@ -43,25 +56,36 @@ class UserRepo(SUPABASE):
         if end_date:
             stmt = stmt.lte("created_at", end_date)
 
-        resp = stmt.execute()
-        return [User.model_validate(row) for row in resp.data]
+        resp = await self.execute(stmt)
+        return [model.model_validate(row) for row in resp.data]
 
-    def get_user_by_id(self, user_id: str) -> User | None:
+    async def get_user_by_id(
+        self, user_id: str, fields: Tuple[str, ...] | None = None
+    ) -> User | None:
         """Retrieve a specific user by their ID.
 
         Args:
             user_id: Unique identifier of the user
+            fields: Sparse fieldset, the record then only holds these fields
 
         Returns:
             User | None: The requested user record or None if not found
         """
-        resp = self.client.table(TABLE_NAME).select("*").eq("id", user_id).execute()
+        user = await user_cache.get(user_id, self._load_user)
+        if user is not None and fields:
+            return sparse_copy(user, fields)
+        return user
+
+    async def _load_user(self, user_id: str) -> User | None:
+        resp = await self.execute(
+            self.client.table(TABLE_NAME).select("*").eq("id", user_id)
+        )
         data = resp.data
         if data:
             return User.model_validate(data[0])
         return None
 
-    def create_user(self, payload: UserCreate) -> User:
+    async def create_user(self, payload: UserCreate) -> User:
         """Create a new user in the database.
 
         Args:
@@ -74,34 +98,46 @@ class UserRepo(SUPABASE):
             Email addresses must be unique across all users.
         """
         data = serialize_for_supabase(payload.model_dump())
-        resp = self.client.table(TABLE_NAME).insert(data).execute()
+        resp = await self.execute(self.client.table(TABLE_NAME).insert(data))
         return User.model_validate(resp.data[0])
 
-    def update_user(self, user_id: str, full_name: str = None) -> Optional[dict]:
+    async def update_user(self, user_id: str, full_name: str = None) -> Optional[dict]:
         """Update user full_name in auth.users metadata and public table."""
         
         if full_name is None:
             return None
         
         # Update public table
-        resp = (
+        resp = await self.execute(
             self.client.table(TABLE_NAME)
             .update({"full_name": full_name})
             .eq("id", user_id)
-            .execute()
         )
+        await user_cache.invalidate(user_id)
 
         return resp.data[0] if resp.data else None
 
-    def delete_user(self, user_id: str) -> None:
+    async def delete_user(self, user_id: str) -> bool:
         """Delete a user from the database.
 
         Args:
             user_id: Unique identifier of the user to delete
 
+        Returns:
+            bool: Whether a user was deleted, the auth account is only removed
+            when the public row matched
+
         Note:
             This operation will fail if there are purchases created by this user
             due to foreign key constraints.
         """
-        self.client.auth.admin.delete_user(user_id)
-        self.client.table(TABLE_NAME).update({"is_deleted": True}).eq("id", user_id).execute()
+        resp = await self.execute(
+            self.client.table(TABLE_NAME)
+            .update({"is_deleted": True})
+            .eq("id", user_id)
+        )
+        await user_cache.invalidate(user_id)
+        if not resp.data:
+            return False
+        await self.run(self.client.auth.admin.delete_user, user_id)
+        return True
@@ -1,30 +1,177 @@
 """Supabase database client configuration.
 
-This module provides a factory function to create and configure
-Supabase client instances for database operations.
+This module owns the process-wide Supabase client registry. A single
+keep-alive HTTP connection pool is opened at application startup and
+shared by every repository, so requests no longer pay TCP/TLS setup
+for each new client.
+
+With SUPABASE_CLIENT_MODE=async the repositories await the async
+Supabase client on the event loop, otherwise the sync client is run
+in the threadpool.
 """
 
-from supabase import Client, create_client
-from app.config import SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY
+import threading
+from typing import Any, Awaitable, Callable, TypeVar
 
+import httpx
+from fastapi.concurrency import run_in_threadpool
+from postgrest import APIResponse
+from supabase import (
+    AsyncClient,
+    AsyncClientOptions,
+    Client,
+    ClientOptions,
+    create_client,
+)
 
-class SUPABASE:
-    def __init__(self) -> None:
-        self.client = self.get_supabase()
+from app.config import (
+    SUPABASE_CLIENT_MODE,
+    SUPABASE_HTTP_TIMEOUT,
+    SUPABASE_POOL_KEEPALIVE_EXPIRY,
+    SUPABASE_POOL_MAX_CONNECTIONS,
+    SUPABASE_POOL_MAX_KEEPALIVE,
+    SUPABASE_SERVICE_ROLE_KEY,
+    SUPABASE_URL,
+)
+from app.db.instrumentation import describe_call, describe_query, track_call
 
-    def get_supabase(self) -> Client:
-        """Create and return a configured Supabase client.
+T = TypeVar("T")
 
-        Returns:
-            Client: Configured Supabase client instance
 
-        Raises:
-            ValueError: If required environment variables are not set
+class ClientRegistry:
+    """Process-lifetime holder of the shared HTTP pools and Supabase client."""
+
+    def __init__(self, mode: str = "sync") -> None:
+        self.is_async = mode == "async"
+        self._lock = threading.Lock()
+        self._http_client: httpx.Client | None = None
+        self._async_http_client: httpx.AsyncClient | None = None
+        self._client: Client | AsyncClient | None = None
+
+    def open(self) -> None:
+        """Create the shared connection pool and service-role client."""
+        with self._lock:
+            if self._client is not None:
+                return
+            if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
+                raise ValueError("Supabase configuration is missing")
+
+            pool = dict(
+                limits=httpx.Limits(
+                    max_connections=SUPABASE_POOL_MAX_CONNECTIONS,
+                    max_keepalive_connections=SUPABASE_POOL_MAX_KEEPALIVE,
+                    keepalive_expiry=SUPABASE_POOL_KEEPALIVE_EXPIRY,
+                ),
+                timeout=SUPABASE_HTTP_TIMEOUT,
+                follow_redirects=True,
+                http2=True,
+            )
+            self._http_client = httpx.Client(**pool)
+            if self.is_async:
+                self._async_http_client = httpx.AsyncClient(**pool)
+            self._client = self._build_client()
+
+    def close(self) -> None:
+        """Close the shared sync connection pool."""
+        with self._lock:
+            if self._http_client is not None:
+                self._http_client.close()
+            self._http_client = None
+            self._client = None
+
+    async def aclose(self) -> None:
+        """Close every shared connection pool."""
+        if self._async_http_client is not None:
+            await self._async_http_client.aclose()
+            self._async_http_client = None
+        self.close()
+
+    @property
+    def client(self) -> Client | AsyncClient:
+        """Shared service-role client, opened lazily outside the app lifespan."""
+        if self._client is None:
+            self.open()
+        return self._client
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """Shared keep-alive connection pool"""
+        if self._http_client is None:
+            self.open()
+        return self._http_client
+
+    def new_client(self) -> Client | AsyncClient:
+        """Build a client with its own auth session on top of the shared pool.
+
+        Auth flows such as sign in or password change store the user session
+        on the client, so they must not run on the shared client.
         """
-        if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
-            raise ValueError("Supabase configuration is missing")
+        if self._client is None:
+            self.open()
+        return self._build_client()
 
+    def _build_client(self) -> Client | AsyncClient:
+        if self.is_async:
+            return AsyncClient(
+                SUPABASE_URL,
+                SUPABASE_SERVICE_ROLE_KEY,
+                options=AsyncClientOptions(
+                    httpx_client=self._async_http_client,
+                    auto_refresh_token=False,
+                    persist_session=False,
+                ),
+            )
         return create_client(
             SUPABASE_URL,
             SUPABASE_SERVICE_ROLE_KEY,
+            options=ClientOptions(
+                httpx_client=self._http_client,
+                auto_refresh_token=False,
+                persist_session=False,
+            ),
         )
+
+
+registry = ClientRegistry(SUPABASE_CLIENT_MODE)
+
+
+class SUPABASE:
+    @property
+    def client(self) -> Client | AsyncClient:
+        """Client of this repository, resolved on every use.
+
+        Repositories live as long as the process, so they must not keep a
+        client the registry may have closed and reopened since.
+        """
+        return self.get_supabase()
+
+    def get_supabase(self) -> Client | AsyncClient:
+        """Return the shared Supabase client.
+
+        Returns:
+            Client | AsyncClient: Configured Supabase client instance
+
+        Raises:
+            ValueError: If required environment variables are not set
+        """
+        return registry.client
+
+    async def execute(self, query: Any) -> APIResponse:
+        """Execute a PostgREST query built on `self.client`"""
+        with track_call(*describe_query(query)):
+            return await self._call(query.execute)
+
+    async def run(
+        self, fn: Callable[..., T | Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """Call a client method, awaiting it in async mode or in the threadpool otherwise"""
+        with track_call(*describe_call(fn)):
+            return await self._call(fn, *args, **kwargs)
+
+    @staticmethod
+    async def _call(
+        fn: Callable[..., T | Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        if registry.is_async:
+            return await fn(*args, **kwargs)
+        return await run_in_threadpool(fn, *args, **kwargs)
@@ -4,27 +4,50 @@ This module creates and configures the FastAPI application instance,
 including all API routes and middleware.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.router import api_router
 from app.core.exception import BusinessError 
+from app.db.cache import check_backend, close_backend
+from app.db.supabase import registry
 from app.middleware.error_handler import business_exception_handler
+from app.middleware.etag import ETagMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.server_timing import ServerTimingMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared Supabase connection pool for the process lifetime"""
+    check_backend()
+    registry.open()
+    yield
+    await close_backend()
+    await registry.aclose()
+
 
 # Create FastAPI application instance
 app: FastAPI = FastAPI(
     title="O-Platy60 Server",
     description="API for managing food purchases and transformations",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+app.add_middleware(ETagMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
-    allow_headers=["*"]
+    allow_headers=["*"],
+    expose_headers=["ETag", "Server-Timing"],
 )
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 # Include all API routes
 app.include_router(api_router)
@@ -1,6 +1,12 @@
 from fastapi import Request
 from fastapi.responses import JSONResponse
-from app.core.exception import DatabaseError, BusinessError, ItemNotFoundError
+from app.core.exception import (
+    DatabaseError,
+    BusinessError,
+    ItemNotFoundError,
+    ValidationError,
+)
+from app.utils.metrics import business_errors
 
 
 def business_exception_handler(request: Request, exc: BusinessError):
@@ -9,7 +15,10 @@ def business_exception_handler(request: Request, exc: BusinessError):
         status_code = 504
     if isinstance(exc, ItemNotFoundError):
         status_code = 404
+    if isinstance(exc, ValidationError):
+        status_code = 422
 
+    business_errors.inc(exc.__class__.__name__, getattr(exc, "name", ""))
     return JSONResponse(
         status_code=status_code,
         content={"error": exc.__class__.__name__, "message": str(exc)},
@@ -0,0 +1,143 @@
+"""ETag and conditional GET support.
+
+`ETagMiddleware` tags every JSON GET response with a weak ETag hashed from
+its body and answers `304 Not Modified` when the client already holds it.
+
+List endpoints that are polled can also depend on `conditional(tables)`:
+their ETag is remembered together with the version tokens of the tables
+they read, and a request presenting that ETag while the versions are
+unchanged is answered with a 304 before Supabase is queried at all.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Callable, Coroutine, List
+
+from fastapi import HTTPException, Request, status
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import CONDITIONAL_GET_TTL
+from app.db.cache import get_backend, table_versions
+
+logger = logging.getLogger(__name__)
+
+
+def _etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """Weak comparison against an If-None-Match header"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in tags
+
+
+def conditional(*tables: str) -> Callable[[Request], Coroutine]:
+    """Dependency skipping the query when the client's ETag is provably current"""
+
+    async def dependency(request: Request) -> None:
+        versions = await table_versions(tables)
+        if versions is None:
+            return
+
+        key = f"etag:{request.url.path}?{request.url.query}"
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            try:
+                remembered = await get_backend().get(key)
+            except Exception:
+                logger.exception("Cache read failed for %s", key)
+                remembered = None
+            if remembered is not None:
+                entry = json.loads(remembered)
+                if entry["versions"] == versions and _etag_matches(
+                    entry["etag"], if_none_match
+                ):
+                    raise HTTPException(
+                        status_code=status.HTTP_304_NOT_MODIFIED,
+                        headers={"ETag": entry["etag"]},
+                    )
+
+        # Versions are read before the query, so a concurrent write can only
+        # make the remembered entry look older than the data, never newer
+        request.state.etag_key = key
+        request.state.etag_versions = versions
+
+    return dependency
+
+
+class ETagMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        passthrough = False
+        body: List[bytes] = []
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                is_json = headers.get("content-type", "").startswith("application/json")
+                if message["status"] != 200 or not is_json:
+                    passthrough = True
+                    await send(message)
+                    return
+                start = message
+                return
+
+            body.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            await self._respond(scope, start, b"".join(body), send)
+
+        await self.app(scope, receive, send_with_etag)
+
+    async def _respond(
+        self, scope: Scope, start: Message, body: bytes, send: Send
+    ) -> None:
+        headers = MutableHeaders(raw=list(start["headers"]))
+        if "etag" not in headers:
+            digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+            headers["etag"] = f'W/"{digest}"'
+        etag = headers["etag"]
+        await self._remember(scope, etag)
+
+        if _etag_matches(etag, Headers(scope=scope).get("if-none-match")):
+            del headers["content-length"]
+            del headers["content-type"]
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": status.HTTP_304_NOT_MODIFIED,
+                    "headers": headers.raw,
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send({**start, "headers": headers.raw})
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    async def _remember(scope: Scope, etag: str) -> None:
+        """Store the ETag of a `conditional` list with the table versions it saw"""
+        state = scope.get("state", {})
+        if "etag_key" not in state:
+            return
+        entry = json.dumps({"etag": etag, "versions": state["etag_versions"]})
+        try:
+            await get_backend().set(state["etag_key"], entry, CONDITIONAL_GET_TTL)
+        except Exception:
+            logger.exception("Cache write failed for %s", state["etag_key"])
@@ -0,0 +1,45 @@
+"""Request count, latency and in-flight metrics per route template."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.metrics import (
+    http_request_duration,
+    http_requests,
+    http_requests_in_flight,
+)
+
+# Route label of requests no route matched, keeps the label set bounded
+UNMATCHED_ROUTE: str = "<unmatched>"
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc(method)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec(method)
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            http_requests.inc(method, route, str(status))
+            http_request_duration.observe(
+                method, route, value=time.perf_counter() - started
+            )
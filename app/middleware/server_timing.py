@@ -0,0 +1,116 @@
+"""Server-Timing header and structured log of the Supabase calls of a request.
+
+Every response carries the time spent in Supabase, in total and per table
+or RPC, e.g.
+
+    Server-Timing: supabase;dur=41.2;desc="6 calls",
+        table.purchases;dur=30.5;desc="select x5", app;dur=48.0
+
+and one JSON line per request is logged on `app.middleware.server_timing`
+with the same breakdown, the status and the route path.
+"""
+
+import json
+import logging
+import re
+import time
+from typing import Any, Dict, List
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import REQUEST_TIMING_LOG, SERVER_TIMING_HEADER
+from app.db.instrumentation import RequestTimings, SupabaseCall, current_timings
+
+logger = logging.getLogger(__name__)
+
+# Targets listed in the header, the log always has all of them
+MAX_HEADER_TARGETS: int = 10
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+
+def _operations(calls: List[SupabaseCall]) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for call in calls:
+        counts[call.operation] = counts.get(call.operation, 0) + 1
+    return counts
+
+
+def server_timing(timings: RequestTimings) -> str:
+    """Render the calls of a request as a Server-Timing header value"""
+    count = len(timings.calls)
+    entries = [
+        f'supabase;dur={_ms(timings.total)};desc="{count} call{"s" * (count != 1)}"'
+    ]
+    targets = list(timings.by_target().items())[:MAX_HEADER_TARGETS]
+    for (kind, name), calls in targets:
+        desc = ", ".join(f"{op} x{n}" for op, n in _operations(calls).items())
+        duration = _ms(sum(call.duration for call in calls))
+        entries.append(
+            f'{kind}.{_UNSAFE.sub("_", name)};dur={duration};desc="{desc}"'
+        )
+    entries.append(f"app;dur={_ms(time.perf_counter() - timings.started)}")
+    return ", ".join(entries)
+
+
+def timing_record(
+    scope: Scope, status: int, timings: RequestTimings
+) -> Dict[str, Any]:
+    """Structured summary of a request and its Supabase calls"""
+    route = scope.get("route")
+    return {
+        "method": scope["method"],
+        "path": scope["path"],
+        "route": getattr(route, "path", None),
+        "status": status,
+        "duration_ms": _ms(time.perf_counter() - timings.started),
+        "supabase_calls": len(timings.calls),
+        "supabase_ms": _ms(timings.total),
+        "targets": [
+            {
+                "kind": kind,
+                "name": name,
+                "calls": len(calls),
+                "duration_ms": _ms(sum(call.duration for call in calls)),
+                "max_ms": _ms(max(call.duration for call in calls)),
+                "operations": _operations(calls),
+                "failed": sum(call.failed for call in calls),
+            }
+            for (kind, name), calls in timings.by_target().items()
+        ],
+    }
+
+
+class ServerTimingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if SERVER_TIMING_HEADER:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", server_timing(timings))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_timings.reset(token)
+            if REQUEST_TIMING_LOG:
+                logger.info(json.dumps(timing_record(scope, status, timings)))
@@ -2,11 +2,7 @@
 
 from datetime import datetime
 from pydantic import BaseModel
-from app.models.shared import FilterPayload
-
-
-class CategoryPayload(FilterPayload):
-    pass
+from app.models.shared import CountPayload, FieldsPayload, FilterPayload
 
 
 class CategoryBase(BaseModel):
@@ -27,4 +23,12 @@ class Category(CategoryBase):
     updated_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class CategoryDetailPayload(FieldsPayload):
+    fields_model = Category
+
+
+class CategoryPayload(FilterPayload, CountPayload, FieldsPayload):
+    fields_model = Category
\ No newline at end of file
@@ -10,6 +10,8 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+from app.models.shared import CountPayload, CursorPayload, FieldsPayload
+
 
 class Measurement(str, Enum):
     """Measurement units for ingredients."""
@@ -49,9 +51,15 @@ class Ingredient(IngredientBase):
         from_attributes = True
 
 
-class IngredientPayload(BaseModel):
+class IngredientDetailPayload(FieldsPayload):
+    fields_model = Ingredient
+
+
+class IngredientPayload(CursorPayload, CountPayload, FieldsPayload):
     """Query parameters for listing ingredients."""
 
+    fields_model = Ingredient
+
     limit: int = 10
     offset: int = 0
     name: Optional[str] = None
@@ -1,8 +1,18 @@
-from typing import List, Optional
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional, Self
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
-from app.models.shared import FilterPayload
+from app.models.shared import (
+    CountPayload,
+    CursorPayload,
+    ExportPayload,
+    FilterPayload,
+)
+
+
+# Upper bound of the daily summaries embedded per inventory item
+MAX_SUMMARY_DAYS: int = 366
 
 
 # INVENTORY TRANSACTION
@@ -21,6 +31,27 @@ class InventoryTransaction(InventoryTransactionBase):
     entry: int = 0
 
 
+class InventoryTransactionExportPayload(ExportPayload):
+    inventory_id: str | None = None
+
+
+class InventoryTransactionChunkResult(BaseModel):
+    """Outcome of one multi-row insert of a bulk ingestion"""
+
+    chunk: int
+    start: int
+    size: int
+    inserted: int = 0
+    error: str | None = None
+
+
+class InventoryTransactionBulkReport(BaseModel):
+    total: int
+    inserted: int
+    failed: int
+    chunks: List[InventoryTransactionChunkResult]
+
+
 class WeeklyInventorySummary(BaseModel):
     id: int
     start_date: str
@@ -33,8 +64,42 @@ class WeeklyInventorySummary(BaseModel):
 
 
 # INVENTORY
-class InventoryPayload(FilterPayload):
+class InventoryPayload(FilterPayload, CursorPayload, CountPayload):
     category_id: str | None = None
+    # Embed each item's daily summaries, the stock level needs none of them
+    include_summary: bool = False
+    # Window of the embedded summaries, newest first and at most
+    # `summary_limit` per item. Setting a window implies `include_summary`.
+    summary_days: int | None = Field(default=None, ge=1, le=MAX_SUMMARY_DAYS)
+    summary_start: date | None = None
+    summary_end: date | None = None
+    summary_limit: int = Field(default=31, ge=1, le=MAX_SUMMARY_DAYS)
+
+    @model_validator(mode="after")
+    def validate_summary_window(self) -> Self:
+        if self.summary_days is not None and self.summary_start is not None:
+            raise ValueError("summary_days and summary_start are mutually exclusive")
+        if (
+            self.summary_start is not None
+            and self.summary_end is not None
+            and self.summary_start > self.summary_end
+        ):
+            raise ValueError("summary_start must not be after summary_end")
+        return self
+
+    @property
+    def embeds_summary(self) -> bool:
+        """Whether the daily summaries are embedded in the list"""
+        window = (self.summary_days, self.summary_start, self.summary_end)
+        return self.include_summary or any(v is not None for v in window)
+
+    @property
+    def summary_from(self) -> date | None:
+        """First day of the embedded window, `summary_days` ending today (UTC)"""
+        if self.summary_days is not None:
+            today = datetime.now(timezone.utc).date()
+            return today - timedelta(days=self.summary_days - 1)
+        return self.summary_start
 
 
 class InventoryBase(BaseModel):
@@ -67,6 +132,9 @@ class DailyTransactionSummary(BaseModel):
 class InventoryResponse(InventoryBase):
     inventory_id: str
     created_at: str
+    # Maintained by database triggers on every inventory transaction
+    current_quantity: float = 0
+    last_txn_at: Optional[str] = None
     daily_transaction_summary: List[DailyTransactionSummary] = []
 
 
@@ -4,9 +4,10 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 
 from app.models.ingredients import Measurement, Ingredient
+from app.models.shared import CountPayload, CursorPayload, ExportFormat, iso_date
 
 
 class ProductBase(BaseModel):
@@ -37,7 +38,7 @@ class Product(ProductBase):
         from_attributes = True
 
 
-class ProductPayload(BaseModel):
+class ProductPayload(CursorPayload, CountPayload):
     """Query parameters for listing products."""
 
     limit: int = 10
@@ -59,11 +60,6 @@ class ProductTransaction(BaseModel):
     remaining: float
 
 
-class ProductTransactionResponse(BaseModel):
-    summaries: List[ProductTransaction]
-    count: int
-
-
 class ProductTransactionPayload(BaseModel):
     """Query parameters for listing products summary"""
 
@@ -74,6 +70,40 @@ class ProductTransactionPayload(BaseModel):
     name: str | None = None
 
 
+class ProductTransactionExportPayload(BaseModel):
+    """Query parameters for exporting products summary"""
+
+    start_date: str
+    end_date: str
+    name: str | None = None
+    format: ExportFormat = ExportFormat.CSV
+
+    @field_validator("start_date", "end_date")
+    @classmethod
+    def validate_date(cls, value: str) -> str:
+        parsed = iso_date(value)
+        if parsed is None:
+            raise ValueError(f"Unrecognised date: {value}")
+        return parsed
+
+
 class ProductTransactionUpdateSales(BaseModel):
     product_id: str
     sales: float
+
+
+class ProductTransactionBatchSales(BaseModel):
+    items: List[ProductTransactionUpdateSales] = Field(min_length=1, max_length=1000)
+
+
+class ProductTransactionSalesResult(BaseModel):
+    index: int
+    product_id: str
+    recorded: bool
+    error: str | None = None
+
+
+class ProductTransactionBatchSalesReport(BaseModel):
+    recorded: int
+    failed: int
+    items: List[ProductTransactionSalesResult]
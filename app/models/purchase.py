@@ -5,16 +5,15 @@ from typing import List
 
 from pydantic import BaseModel
 
-from app.models.shared import FilterPayload
+from app.models.shared import (
+    CountPayload,
+    CursorPayload,
+    FieldsPayload,
+    FilterPayload,
+)
 from app.models.transformation import Transformation
 
 
-class PurchasePayload(FilterPayload):
-    category_id: str | None = None
-    created_by: str | None = None
-    ingredient: str | None = None
-
-
 class PurchaseBase(BaseModel):
     item_name: str
     quantity: float
@@ -40,3 +39,15 @@ class Purchase(PurchaseBase):
 
     class Config:
         from_attributes = True
+
+
+class PurchaseDetailPayload(FieldsPayload):
+    fields_model = Purchase
+
+
+class PurchasePayload(FilterPayload, CursorPayload, CountPayload, FieldsPayload):
+    fields_model = Purchase
+
+    category_id: str | None = None
+    created_by: str | None = None
+    ingredient: str | None = None
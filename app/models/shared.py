@@ -1,8 +1,10 @@
+import base64
+import json
 from datetime import datetime
-from typing import Self
-from pydantic import BaseModel, Field, model_validator
+from functools import lru_cache
+from typing import Any, ClassVar, Self, Tuple, Type
+from pydantic import BaseModel, Field, create_model, field_validator, model_validator
 from enum import Enum
-import dateparser
 
 
 class Order(Enum):
@@ -10,6 +12,138 @@ class Order(Enum):
     DESCENDING = "desc"
 
 
+class CountMode(Enum):
+    """How the total row count of a list is computed by PostgREST"""
+
+    EXACT = "exact"
+    PLANNED = "planned"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+class CountPayload(BaseModel):
+    """Lets clients pick a cheaper count, or skip it for infinite scroll"""
+
+    count_mode: CountMode = CountMode.EXACT
+
+
+class Cursor(BaseModel):
+    """Keyset position: sort column value and id of the last row of a page"""
+
+    value: Any
+    id: str
+
+    def encode(self) -> str:
+        raw = json.dumps([self.value, self.id], default=str).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            value, id = json.loads(raw)
+        except (ValueError, TypeError):
+            raise ValueError("Invalid cursor")
+        return cls(value=value, id=str(id))
+
+
+class CursorPayload(BaseModel):
+    """Opaque cursor returned as `next_cursor`, replaces page/offset when set"""
+
+    cursor: str | None = None
+
+    @field_validator("cursor")
+    @classmethod
+    def validate_cursor(cls, value: str | None) -> str | None:
+        if value is not None:
+            Cursor.decode(value)
+        return value
+
+    @property
+    def keyset(self) -> Cursor | None:
+        """Decoded cursor"""
+        return Cursor.decode(self.cursor) if self.cursor else None
+
+
+class FieldsPayload(BaseModel):
+    """Sparse fieldset: comma separated response fields, e.g. `id,item_name`"""
+
+    fields: str | None = None
+
+    # Response model the requested fields must belong to
+    fields_model: ClassVar[Type[BaseModel]]
+
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, value: str | None) -> str | None:
+        if value is None:
+            return None
+        names = list(dict.fromkeys(n.strip() for n in value.split(",") if n.strip()))
+        if not names:
+            raise ValueError("fields must name at least one field")
+        known = cls.fields_model.model_fields
+        unknown = [name for name in names if name not in known]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        return ",".join(names)
+
+    @property
+    def field_names(self) -> Tuple[str, ...] | None:
+        """Requested fields, None for the whole model"""
+        return tuple(self.fields.split(",")) if self.fields else None
+
+
+@lru_cache(maxsize=256)
+def sparse_model(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """Lightweight response model holding only `fields` of `model`"""
+    definitions = {
+        name: (model.model_fields[name].annotation, model.model_fields[name])
+        for name in fields
+    }
+    return create_model(f"{model.__name__}Fields", **definitions)
+
+
+def sparse_copy(item: BaseModel, fields: Tuple[str, ...]) -> BaseModel:
+    """Restrict an already loaded model, e.g. a cached row, to `fields`"""
+    return sparse_model(type(item), fields).model_validate(item.model_dump())
+
+
+@lru_cache(maxsize=256)
+def _parse_free_text_date(value: str, relative_base: datetime) -> datetime | None:
+    # dateparser is slow to import and to run, only free text needs it
+    import dateparser
+
+    return dateparser.parse(value, settings={"RELATIVE_BASE": relative_base})
+
+
+def parse_date(value: str) -> datetime | None:
+    """Parse an ISO-8601 date, falling back to free text such as "yesterday".
+
+    Free text results are memoised per minute, as relative expressions
+    depend on the current time.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        now = datetime.now().replace(second=0, microsecond=0)
+        return _parse_free_text_date(value, now)
+
+
+def iso_date(value: Any) -> str | None:
+    """ISO-8601 form of a date filter, None when missing or unparsable"""
+    parsed = parse_date(value) if isinstance(value, str) else None
+    return parsed.isoformat() if parsed is not None else None
+
+
+class ExportFormat(Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+    @property
+    def media_type(self) -> str:
+        return "text/csv" if self == ExportFormat.CSV else "application/x-ndjson"
+
+
 class FilterPayload(BaseModel):
     """Base filters for all list endpoints"""
 
@@ -22,20 +156,8 @@ class FilterPayload(BaseModel):
 
     @model_validator(mode="after")
     def validate_dates(self) -> Self:
-
-        self.start_date = (
-            dateparser.parse(self.start_date)
-            if isinstance(self.start_date, str)
-            else None
-        )
-        self.end_date = (
-            dateparser.parse(self.end_date) if isinstance(self.end_date, str) else None
-        )
-        self.start_date = (
-            self.start_date.isoformat() if self.start_date is not None else None
-        )
-        self.end_date = self.end_date.isoformat() if self.end_date is not None else None
-
+        self.start_date = iso_date(self.start_date)
+        self.end_date = iso_date(self.end_date)
         return self
 
     @property
@@ -47,3 +169,17 @@ class FilterPayload(BaseModel):
     def is_desc(self) -> bool:
         """Boolean check for descending order"""
         return self.order == Order.DESCENDING
+
+
+class ExportPayload(BaseModel):
+    """Query parameters of the streaming export endpoints"""
+
+    format: ExportFormat = ExportFormat.CSV
+    start_date: datetime | None | str = None
+    end_date: datetime | None | str = None
+
+    @model_validator(mode="after")
+    def validate_dates(self) -> Self:
+        self.start_date = iso_date(self.start_date)
+        self.end_date = iso_date(self.end_date)
+        return self
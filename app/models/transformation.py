@@ -1,13 +1,14 @@
 """Transformation data models."""
 
 from datetime import date, datetime
-from typing import Self
-from pydantic import BaseModel, model_validator
-from app.models.shared import FilterPayload
-
-
-class TransformationPayload(FilterPayload):
-    pass
+from typing import List, Self
+from pydantic import BaseModel, Field, model_validator
+from app.models.shared import (
+    CountPayload,
+    CursorPayload,
+    FieldsPayload,
+    FilterPayload,
+)
 
 
 class TransformationBase(BaseModel):
@@ -59,8 +60,20 @@ class Transformation(TransformationBase):
         from_attributes = True
 
 
+class TransformationDetailPayload(FieldsPayload):
+    fields_model = Transformation
+
+
+class TransformationPayload(FilterPayload, CursorPayload, CountPayload, FieldsPayload):
+    fields_model = Transformation
+
+
+class TransformationSummaryPayload(BaseModel):
+    ids: List[str] = Field(min_length=1, max_length=100)
+
+
 class TransformationSummary(Transformation):
     total_portions: int
-    total_step_quantity: int
+    total_step_quantity: int | float
     step_count: int
     remaining_quantity: float
@@ -1,7 +1,8 @@
 """Transformation step data models."""
 
 from datetime import datetime
-from pydantic import BaseModel
+from typing import Any
+from pydantic import BaseModel, field_validator
 from app.models.shared import FilterPayload
 
 
@@ -34,3 +35,18 @@ class TransformationStep(TransformationStepBase):
 
     class Config:
         from_attributes = True
+
+
+class TransformationStepTotals(BaseModel):
+    """Aggregated figures of all steps of a transformation"""
+
+    transformation_id: str | None = None
+    step_count: int = 0
+    total_portions: int = 0
+    total_step_quantity: int | float = 0
+
+    @field_validator("total_portions", "total_step_quantity", mode="before")
+    @classmethod
+    def empty_sum(cls, value: Any) -> Any:
+        """SUM over no rows is NULL"""
+        return 0 if value is None else value
@@ -5,6 +5,8 @@ from enum import Enum
 
 from pydantic import BaseModel, EmailStr
 
+from app.models.shared import FieldsPayload
+
 
 class UserRole(str, Enum):
     manager = "manager"
@@ -33,4 +35,10 @@ class User(UserBase):
     updated_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class UserPayload(FieldsPayload):
+    """Query parameters of the user list and detail endpoints"""
+
+    fields_model = User
\ No newline at end of file
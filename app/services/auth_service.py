@@ -8,40 +8,40 @@ class AuthService:
     def __init__(self) -> None:
         self.repo = AuthRepo()
 
-    def login(self, form: AuthForm) -> AuthResponse:
+    async def login(self, form: AuthForm) -> AuthResponse:
         """Authenticate user with email and password"""
         try:
-            return self.repo.sign_in(form)
+            return await self.repo.sign_in(form)
         except Exception as e:
             raise DatabaseError("login", str(e))
 
-    def logout(self, access_token: str) -> Dict[str, str]:
+    async def logout(self, access_token: str) -> Dict[str, str]:
         """Sign out user"""
         try:
-            return self.repo.sign_out()
+            return await self.repo.sign_out(access_token)
         except Exception as e:
             raise DatabaseError("logout", str(e))
 
-    def signup(self, form: SignupForm) -> AuthResponse:
+    async def signup(self, form: SignupForm) -> AuthResponse:
         """Register new user with email and password"""
         try:
-            return self.repo.sign_up(form)
+            return await self.repo.sign_up(form)
         except Exception as e:
             raise DatabaseError("signup", str(e))
 
-    def validate_token(self, token: str) -> bool:
+    async def validate_token(self, token: str) -> bool:
         """Validate user token"""
-        return self.repo.validate_token(token)
+        return await self.repo.validate_token(token)
 
-    def refresh_session(self, refresh_token: str) -> AuthResponse:
+    async def refresh_session(self, refresh_token: str) -> AuthResponse:
         """Refresh user session"""
         try:
-            return self.repo.refresh_session(refresh_token)
+            return await self.repo.refresh_session(refresh_token)
         except Exception as e:
             raise DatabaseError("refresh_session", str(e))
     
-    def change_password(self, payload: ChangePasswordForm):
+    async def change_password(self, payload: ChangePasswordForm):
         """Change user password"""
-        response = self.repo.change_password(payload)
+        response = await self.repo.change_password(payload)
         if not response:
             raise DatabaseError("change_password", "Failed to change password")
\ No newline at end of file
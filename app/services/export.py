@@ -0,0 +1,60 @@
+"""Streaming CSV / NDJSON encoding of exported rows.
+
+Rows are raw PostgREST dicts read in keyset chunks, so neither the whole
+export nor per-row response models are ever held in memory.
+"""
+
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Dict, List
+
+from app.core.exception import DatabaseError
+from app.models.shared import ExportFormat
+
+Rows = List[Dict[str, Any]]
+
+
+def _cell(value: Any) -> Any:
+    """Nested JSON values are written as JSON text in CSV cells"""
+    return json.dumps(value) if isinstance(value, (dict, list)) else value
+
+
+async def encode_rows(
+    chunks: AsyncIterator[Rows], format: ExportFormat
+) -> AsyncIterator[bytes]:
+    """Encode each chunk of rows as one block of CSV lines or NDJSON lines"""
+    fieldnames: List[str] | None = None
+    async for rows in chunks:
+        if format == ExportFormat.NDJSON:
+            yield "".join(json.dumps(row, default=str) + "\n" for row in rows).encode()
+            continue
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if fieldnames is None:
+            fieldnames = list(rows[0].keys())
+            writer.writerow(fieldnames)
+        writer.writerows(
+            [_cell(row.get(name)) for name in fieldnames] for row in rows
+        )
+        yield buffer.getvalue().encode()
+
+
+async def start_export(
+    name: str, stream: AsyncIterator[bytes]
+) -> AsyncIterator[bytes]:
+    """Fetch the first chunk eagerly so that database errors are still reported
+    as an error response instead of a truncated download.
+    """
+    try:
+        first = await anext(stream, b"")
+    except Exception as e:
+        raise DatabaseError(name, str(e))
+
+    async def resume() -> AsyncIterator[bytes]:
+        yield first
+        async for block in stream:
+            yield block
+
+    return resume()
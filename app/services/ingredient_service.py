@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from app.models.ingredients import (
     Ingredient,
     IngredientPayload,
@@ -13,46 +13,55 @@ class IngredientService:
     def __init__(self) -> None:
         self.repo = IngredientRepo()
 
-    def get_ingredients(
+    async def get_ingredients(
         self, payload: IngredientPayload
-    ) -> Dict[str, List[Ingredient] | int]:
+    ) -> Dict[str, List[Ingredient] | int | str | None]:
         """Get all ingredients with optional filters."""
         try:
-            ingredients, count = self.repo.list_ingredients(
+            ingredients, count, next_cursor = await self.repo.list_ingredients(
                 limit=payload.limit,
                 offset=payload.offset,
                 name=payload.name,
                 category=payload.category,
+                cursor=payload.keyset,
+                count_mode=payload.count_mode,
+                fields=payload.field_names,
             )
-            return {"ingredients": ingredients, "count": count}
+            return {
+                "ingredients": ingredients,
+                "count": count,
+                "next_cursor": next_cursor,
+                "count_mode": payload.count_mode.value,
+            }
         except Exception as e:
             raise DatabaseError("get_ingredients", str(e))
 
-    def get_ingredient(self, ingredient_id: str) -> Ingredient:
-        """Get a single ingredient by ID."""
+    async def get_ingredient(
+        self, ingredient_id: str, fields: Tuple[str, ...] | None = None
+    ) -> Ingredient:
+        """Get a single ingredient by ID, restricted to `fields` when given."""
         ingredient = None
         try:
-            ingredient = self.repo.get_ingredient_by_id(ingredient_id)
+            ingredient = await self.repo.get_ingredient_by_id(ingredient_id, fields)
         except Exception as e:
             raise DatabaseError("get_ingredient", str(e))
         if not ingredient:
             raise ItemNotFoundError("get_ingredient", ingredient_id)
         return ingredient
 
-    def create_ingredient(self, payload: IngredientCreate) -> Ingredient:
+    async def create_ingredient(self, payload: IngredientCreate) -> Ingredient:
         """Create a new ingredient."""
         try:
-            return self.repo.create_ingredient(payload)
+            return await self.repo.create_ingredient(payload)
         except Exception as e:
             raise DatabaseError("create_ingredient", str(e))
 
-    def update_ingredient(
+    async def update_ingredient(
         self, ingredient_id: str, payload: IngredientUpdate
     ) -> Ingredient:
         """Update an existing ingredient."""
         try:
-            self.get_ingredient(ingredient_id)
-            ingredient = self.repo.update_ingredient(ingredient_id, payload)
+            ingredient = await self.repo.update_ingredient(ingredient_id, payload)
             if not ingredient:
                 raise ItemNotFoundError("update_ingredient", ingredient_id)
             return ingredient
@@ -61,12 +70,11 @@ class IngredientService:
         except Exception as e:
             raise DatabaseError("update_ingredient", str(e))
 
-    def delete_ingredient(self, ingredient_id: str) -> None:
+    async def delete_ingredient(self, ingredient_id: str) -> None:
         """Delete an ingredient."""
         try:
-            self.get_ingredient(ingredient_id)
-            self.repo.delete_ingredient(ingredient_id)
-        except (DatabaseError, ItemNotFoundError):
-            raise
+            deleted = await self.repo.delete_ingredient(ingredient_id)
         except Exception as e:
             raise DatabaseError("delete_ingredient", str(e))
+        if not deleted:
+            raise ItemNotFoundError("delete_ingredient", ingredient_id)
@@ -1,29 +1,43 @@
-from typing import Dict, List
+import json
+from typing import Any, AsyncIterator, Dict, List
 
-from app.core.exception import DatabaseError, ItemNotFoundError
+from pydantic import TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+
+from app.config import INVENTORY_BULK_CHUNK_SIZE
+from app.core.exception import DatabaseError, ItemNotFoundError, ValidationError
 from app.db.repositories.inventory_repository import InventoryRepository
 from app.models.inventory import (
     InventoryCreate,
     InventoryPayload,
     InventoryResponse,
     InventoryTransaction,
+    InventoryTransactionBulkReport,
+    InventoryTransactionChunkResult,
     InventoryTransactionCreate,
     InventoryUpdate,
     InventoryWeeklySummary,
     InventoryWeeklySummaryQuery,
+    InventoryTransactionExportPayload,
 )
+from app.services.export import encode_rows, start_export
+
+# Number of invalid items listed in a rejected bulk ingestion
+MAX_REPORTED_ERRORS = 20
+
+transactions_adapter = TypeAdapter(List[InventoryTransactionCreate])
 
 
 class InventoryService:
     def __init__(self) -> None:
         self.repo = InventoryRepository()
 
-    def get_inventories(
+    async def get_inventories(
         self, payload: InventoryPayload
-    ) -> Dict[str, List[InventoryResponse] | int]:
+    ) -> Dict[str, List[InventoryResponse] | int | str | None]:
         """Get all inventories with filters"""
         try:
-            inventories, count = self.repo.list_inventories(
+            inventories, count, next_cursor = await self.repo.list_inventories(
                 search=payload.search,
                 limit=payload.limit,
                 offset=payload.offset,
@@ -35,16 +49,27 @@ class InventoryService:
                 if isinstance(payload.end_date, str)
                 else None,
                 category_id=payload.category_id,
+                cursor=payload.keyset,
+                count_mode=payload.count_mode,
+                include_summary=payload.embeds_summary,
+                summary_from=payload.summary_from,
+                summary_to=payload.summary_end,
+                summary_limit=payload.summary_limit,
             )
-            return {"inventories": inventories, "count": count}
+            return {
+                "inventories": inventories,
+                "count": count,
+                "next_cursor": next_cursor,
+                "count_mode": payload.count_mode.value,
+            }
         except Exception as e:
             raise DatabaseError("get_inventories", str(e))
 
-    def get_inventory(self, inventory_id: str) -> InventoryResponse:
+    async def get_inventory(self, inventory_id: str) -> InventoryResponse:
         """Get a single inventory"""
         print("unsupposed call")
         try:
-            inventory = self.repo.get_by_id(inventory_id)
+            inventory = await self.repo.get_by_id(inventory_id)
             if not inventory:
                 raise ItemNotFoundError("get_inventory", inventory_id)
             return inventory
@@ -53,20 +78,20 @@ class InventoryService:
         except Exception as e:
             raise DatabaseError("get_inventory", str(e))
 
-    def create_inventory(self, payload: InventoryCreate) -> InventoryResponse:
+    async def create_inventory(self, payload: InventoryCreate) -> InventoryResponse:
         """Create a new inventory"""
         try:
-            inventory = self.repo.create(payload)
+            inventory = await self.repo.create(payload)
             return inventory
         except Exception as e:
             raise DatabaseError("create_inventory", str(e))
 
-    def update_inventory(
+    async def update_inventory(
         self, inventory_id: str, payload: InventoryUpdate
     ) -> InventoryResponse:
         """Update an existing inventory"""
         try:
-            inventory = self.repo.update(inventory_id, payload)
+            inventory = await self.repo.update(inventory_id, payload)
             if not inventory:
                 raise ItemNotFoundError("update_inventory", inventory_id)
             return inventory
@@ -75,30 +100,82 @@ class InventoryService:
         except Exception as e:
             raise DatabaseError("update_inventory", str(e))
 
-    def delete_inventory(self, inventory_id: str) -> None:
+    async def delete_inventory(self, inventory_id: str) -> None:
         """Delete an inventory"""
         try:
-            self.get_inventory(inventory_id)
-            self.repo.delete(inventory_id)
+            deleted = await self.repo.delete(inventory_id)
         except Exception as e:
             raise DatabaseError("delete_inventory", str(e))
+        if not deleted:
+            raise ItemNotFoundError("delete_inventory", inventory_id)
 
-    def add_transaction(
+    async def add_transaction(
         self, payload: InventoryTransactionCreate
     ) -> InventoryTransaction:
         """Add a transaction to an inventory"""
         try:
-            transaction = self.repo.add_transaction(payload)
+            transaction = await self.repo.add_transaction(payload)
             return transaction
         except Exception as e:
             raise DatabaseError("add_transaction", str(e))
 
-    def get_transactions(
+    @staticmethod
+    def parse_transactions(
+        body: bytes, ndjson: bool
+    ) -> List[InventoryTransactionCreate]:
+        """Validate a JSON array or NDJSON body of transactions, all or nothing"""
+        try:
+            if ndjson:
+                items: Any = [
+                    json.loads(line) for line in body.splitlines() if line.strip()
+                ]
+            else:
+                items = json.loads(body)
+            return transactions_adapter.validate_python(items)
+        except json.JSONDecodeError as e:
+            raise ValidationError("add_transactions", f"Malformed body: {e}")
+        except PydanticValidationError as e:
+            errors = [
+                f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+                for error in e.errors()[:MAX_REPORTED_ERRORS]
+            ]
+            raise ValidationError("add_transactions", "; ".join(errors))
+
+    async def add_transactions(
+        self,
+        transactions: List[InventoryTransactionCreate],
+        chunk_size: int = INVENTORY_BULK_CHUNK_SIZE,
+    ) -> InventoryTransactionBulkReport:
+        """Insert transactions with one multi-row insert per chunk.
+
+        A failing chunk is reported and does not stop the following ones.
+        """
+        chunks: List[InventoryTransactionChunkResult] = []
+        for index, start in enumerate(range(0, len(transactions), chunk_size)):
+            batch = transactions[start : start + chunk_size]
+            result = InventoryTransactionChunkResult(
+                chunk=index, start=start, size=len(batch)
+            )
+            try:
+                result.inserted = len(await self.repo.add_transactions(batch))
+            except Exception as e:
+                result.error = str(DatabaseError("add_transactions", str(e)))
+            chunks.append(result)
+
+        inserted = sum(chunk.inserted for chunk in chunks)
+        return InventoryTransactionBulkReport(
+            total=len(transactions),
+            inserted=inserted,
+            failed=len(transactions) - inserted,
+            chunks=chunks,
+        )
+
+    async def get_transactions(
         self, inventory_id: str, payload: InventoryPayload
     ) -> List[InventoryTransaction]:
         """Retrieve all transactions for a specific inventory"""
         try:
-            transactions = self.repo.get_transactions(
+            transactions = await self.repo.get_transactions(
                 inventory_id=inventory_id,
                 start_date=payload.start_date,
                 end_date=payload.end_date,
@@ -107,12 +184,25 @@ class InventoryService:
         except Exception as e:
             raise DatabaseError("get_transactions", str(e))
 
-    def get_weekly_summary(
+    async def export_transactions(
+        self, payload: InventoryTransactionExportPayload
+    ) -> AsyncIterator[bytes]:
+        """Stream the inventory transactions of a period as CSV or NDJSON"""
+        chunks = self.repo.iter_transactions(
+            inventory_id=payload.inventory_id,
+            start_date=payload.start_date,
+            end_date=payload.end_date,
+        )
+        return await start_export(
+            "export_transactions", encode_rows(chunks, payload.format)
+        )
+
+    async def get_weekly_summary(
         self, payload: InventoryWeeklySummaryQuery
     ) -> InventoryWeeklySummary:
         """Retrieve weekly summary for a specific inventory"""
         try:
-            summary = self.repo.get_weekly_summary(payload)
+            summary = await self.repo.get_weekly_summary(payload)
             return summary
         except Exception as e:
             raise DatabaseError("get_weekly_summary", str(e))
@@ -1,60 +1,73 @@
 """Product service for business logic."""
 
-from collections import defaultdict
-from typing import Dict, List
+from typing import Any, AsyncIterator, Dict, List
+from uuid import UUID
 from app.models.product import (
     Product,
     ProductPayload,
     ProductCreate,
+    ProductTransactionBatchSales,
+    ProductTransactionBatchSalesReport,
+    ProductTransactionExportPayload,
     ProductTransactionPayload,
+    ProductTransactionSalesResult,
     ProductTransactionUpdateSales,
     ProductUpdate,
 )
 from app.db.repositories.product_repository import ProductRepo
 from app.core.exception import DatabaseError, ItemNotFoundError
+from app.services.export import encode_rows, start_export
 
 
 class ProductService:
     def __init__(self) -> None:
         self.repo = ProductRepo()
 
-    def get_products(self, payload: ProductPayload) -> Dict[str, List[Product] | int]:
+    async def get_products(
+        self, payload: ProductPayload
+    ) -> Dict[str, List[Product] | int | str | None]:
         """Get all products with optional filters."""
         try:
-            products, count = self.repo.list_products(
+            products, count, next_cursor = await self.repo.list_products(
                 limit=payload.limit,
                 offset=payload.offset,
                 name=payload.name,
                 category=payload.category,
                 ingredient_id=payload.ingredient_id,
+                cursor=payload.keyset,
+                count_mode=payload.count_mode,
             )
-            return {"products": products, "count": count}
+            return {
+                "products": products,
+                "count": count,
+                "next_cursor": next_cursor,
+                "count_mode": payload.count_mode.value,
+            }
         except Exception as e:
             raise DatabaseError("get_products", str(e))
 
-    def get_product(self, product_id: str) -> Product:
+    async def get_product(self, product_id: str) -> Product:
         """Get a single product by ID."""
         product = None
         try:
-            product = self.repo.get_product_by_id(product_id)
+            product = await self.repo.get_product_by_id(product_id)
         except Exception as e:
             raise DatabaseError("get_product", str(e))
         if not product:
             raise ItemNotFoundError("get_product", product_id)
         return product
 
-    def create_product(self, payload: ProductCreate) -> Product:
+    async def create_product(self, payload: ProductCreate) -> Product:
         """Create a new product."""
         try:
-            return self.repo.create_product(payload)
+            return await self.repo.create_product(payload)
         except Exception as e:
             raise DatabaseError("create_product", str(e))
 
-    def update_product(self, product_id: str, payload: ProductUpdate) -> Product:
+    async def update_product(self, product_id: str, payload: ProductUpdate) -> Product:
         """Update an existing product."""
         try:
-            self.get_product(product_id)
-            product = self.repo.update_product(product_id, payload)
+            product = await self.repo.update_product(product_id, payload)
             if not product:
                 raise ItemNotFoundError("update_product", product_id)
             return product
@@ -63,43 +76,96 @@ class ProductService:
         except Exception as e:
             raise DatabaseError("update_product", str(e))
 
-    def delete_product(self, product_id: str) -> None:
+    async def delete_product(self, product_id: str) -> None:
         """Delete a product."""
         try:
-            self.get_product(product_id)
-            self.repo.delete_product(product_id)
-        except (DatabaseError, ItemNotFoundError):
-            raise
+            deleted = await self.repo.delete_product(product_id)
         except Exception as e:
             raise DatabaseError("delete_product", str(e))
+        if not deleted:
+            raise ItemNotFoundError("delete_product", product_id)
 
-    def get_product_transaction_summary(
+    async def get_product_transaction_summary(
         self, payload: ProductTransactionPayload
-    ) -> Dict:
-        """Calculate transaction summary of all products in the range selected"""
-        try:
-            response = self.repo.calculate_product_transaction_summary(payload)
-            grouped = defaultdict(list)
-
-            # Iterate through the summaries list
-            for item in response.summaries:
-                name = item.product_name
-                grouped[name].append(item)
-
-            # Convert back to a standard dict for the final output
-            return dict(grouped)
+    ) -> Dict[str, List[Dict[str, Any]] | int]:
+        """Calculate transaction summary of all products in the range selected.
 
+        Products come grouped and paginated by the database, each with its
+        daily rows in `days`, and `count` is the number of products in range.
+        """
+        try:
+            products, count = await self.repo.calculate_product_transaction_summary(
+                payload
+            )
+            return {"products": products, "count": count}
         except (DatabaseError, ItemNotFoundError):
             raise
         except Exception as e:
             raise DatabaseError("get_product_transaction_summary", str(e))
 
-    def update_product_sales(self, payload: ProductTransactionUpdateSales):
+    async def export_product_transaction_summary(
+        self, payload: ProductTransactionExportPayload
+    ) -> AsyncIterator[bytes]:
+        """Stream the daily summaries of all products in the range as CSV or NDJSON"""
+        chunks = self.repo.iter_product_transaction_summary(
+            start_date=payload.start_date, end_date=payload.end_date, name=payload.name
+        )
+        return await start_export(
+            "export_product_transaction_summary", encode_rows(chunks, payload.format)
+        )
+
+    async def update_product_sales(self, payload: ProductTransactionUpdateSales):
         """Update product transaction sales"""
         try:
-            self.get_product(payload.product_id)
-            self.repo.update_product_transaction_sales(payload)
+            await self.get_product(payload.product_id)
+            await self.repo.update_product_transaction_sales(payload)
         except (DatabaseError, ItemNotFoundError):
             raise
         except Exception as e:
             raise DatabaseError("update_product_sales", str(e))
+
+    async def update_products_sales(
+        self, payload: ProductTransactionBatchSales
+    ) -> ProductTransactionBatchSalesReport:
+        """Record many sales at once, reporting unknown products per item"""
+        # Only well-formed UUIDs may reach the in_ filter, anything else would
+        # make the database reject the whole query
+        product_ids = [_as_uuid(item.product_id) for item in payload.items]
+        try:
+            existing = set()
+            if any(product_ids):
+                existing = await self.repo.get_existing_product_ids(
+                    list({pid for pid in product_ids if pid})
+                )
+            known = [
+                item
+                for item, pid in zip(payload.items, product_ids)
+                if pid in existing
+            ]
+            if known:
+                await self.repo.add_product_transaction_sales(known)
+        except Exception as e:
+            raise DatabaseError("update_products_sales", str(e))
+
+        results = []
+        for index, (item, pid) in enumerate(zip(payload.items, product_ids)):
+            result = ProductTransactionSalesResult(
+                index=index, product_id=item.product_id, recorded=pid in existing
+            )
+            if not result.recorded:
+                result.error = str(
+                    ItemNotFoundError("update_products_sales", item.product_id)
+                )
+            results.append(result)
+
+        return ProductTransactionBatchSalesReport(
+            recorded=len(known), failed=len(results) - len(known), items=results
+        )
+
+
+def _as_uuid(value: str) -> str | None:
+    """Canonical form of a UUID string, as returned by the database"""
+    try:
+        return str(UUID(value))
+    except ValueError:
+        return None
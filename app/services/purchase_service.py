@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import AsyncIterator, Dict, List, Tuple
 from app.models.purchase import (
     Purchase,
     PurchasePayload,
@@ -7,6 +7,8 @@ from app.models.purchase import (
 from app.db.repositories.purchase_repository import PurchaseRepo
 from app.db.repositories.transformation_repository import TransformationRepo
 from app.core.exception import DatabaseError, ItemNotFoundError, ValidationError
+from app.models.shared import ExportPayload
+from app.services.export import encode_rows, start_export
 
 
 class PurchaseService:
@@ -14,12 +16,12 @@ class PurchaseService:
         self.repo = PurchaseRepo()
         self.transformation_repo = TransformationRepo()
 
-    def get_purchases(
+    async def get_purchases(
         self, payload: PurchasePayload
-    ) -> Dict[str, List[Purchase] | int]:
+    ) -> Dict[str, List[Purchase] | int | str | None]:
         """Get all purchases with filter or not"""
         try:
-            purchases, count = self.repo.list_purchases(
+            purchases, count, next_cursor = await self.repo.list_purchases(
                 search=payload.search,
                 limit=payload.limit,
                 offset=payload.offset,
@@ -33,23 +35,33 @@ class PurchaseService:
                 category_id=payload.category_id,
                 created_by=payload.created_by,
                 ingredient=payload.ingredient,
+                cursor=payload.keyset,
+                count_mode=payload.count_mode,
+                fields=payload.field_names,
             )
-            return {"purchases": purchases, "count": count}
+            return {
+                "purchases": purchases,
+                "count": count,
+                "next_cursor": next_cursor,
+                "count_mode": payload.count_mode.value,
+            }
         except Exception as e:
             raise DatabaseError("get_purchases", str(e))
 
-    def get_purchase(self, purchase_id: str) -> Purchase:
-        """Get a single purchase"""
+    async def get_purchase(
+        self, purchase_id: str, fields: Tuple[str, ...] | None = None
+    ) -> Purchase:
+        """Get a single purchase, restricted to `fields` when given"""
         purchase = None
         try:
-            purchase = self.repo.get_purchase_by_id(purchase_id)
+            purchase = await self.repo.get_purchase_by_id(purchase_id, fields)
         except Exception as e:
             raise DatabaseError("get_purchase", str(e))
         if not purchase:
             raise ItemNotFoundError("get_purchase", purchase_id)
         return purchase
 
-    def create_purchase(self, payload: PurchaseCreate) -> Purchase:
+    async def create_purchase(self, payload: PurchaseCreate) -> Purchase:
         """Create a new purchase"""
         if payload.quantity * payload.price_per_unit != payload.total_price:
             raise ValidationError(
@@ -58,16 +70,25 @@ class PurchaseService:
             )
 
         try:
-            purchase = self.repo.create_purchase(payload)
+            purchase = await self.repo.create_purchase(payload)
             return purchase
         except Exception as e:
             raise DatabaseError("create_purchase", str(e))
 
-    def delete_purchase(self, purchase_id: str) -> None:
+    async def delete_purchase(self, purchase_id: str) -> None:
         """Delete a purchase"""
         try:
-            # Check if purchase exists first
-            self.get_purchase(purchase_id)
-            self.repo.delete_purchase(purchase_id)
+            deleted = await self.repo.delete_purchase(purchase_id)
         except Exception as e:
             raise DatabaseError("delete_purchase", str(e))
+        if not deleted:
+            raise ItemNotFoundError("delete_purchase", purchase_id)
+
+    async def export_purchases(self, payload: ExportPayload) -> AsyncIterator[bytes]:
+        """Stream all purchases of a period as CSV or NDJSON"""
+        chunks = self.repo.iter_purchases(
+            start_date=payload.start_date, end_date=payload.end_date
+        )
+        return await start_export(
+            "export_purchases", encode_rows(chunks, payload.format)
+        )
@@ -1,4 +1,6 @@
-from typing import Dict, List
+import asyncio
+from functools import cached_property
+from typing import Dict, List, Tuple
 from app.db.repositories.transformation_repository import TransformationRepo
 from app.db.repositories.transformation_step_repository import TransformationStepRepo
 from app.core.exception import DatabaseError, ItemNotFoundError
@@ -8,7 +10,9 @@ from app.models.transformation import (
     TransformationPayload,
     TransformationUpdate,
     TransformationSummary,
+    TransformationSummaryPayload,
 )
+from app.models.transformation_step import TransformationStepTotals
 from app.services.purchase_service import PurchaseService
 
 
@@ -17,12 +21,17 @@ class TransformationService:
         self.repo = TransformationRepo()
         self.step_repo = TransformationStepRepo()
 
-    def get_transformations(
+    @cached_property
+    def purchase_service(self) -> PurchaseService:
+        """Only used to check the purchase of a new transformation"""
+        return PurchaseService()
+
+    async def get_transformations(
         self, payload: TransformationPayload
-    ) -> Dict[str, List[Transformation] | int]:
+    ) -> Dict[str, List[Transformation] | int | str | None]:
         """Get all transformations"""
         try:
-            transformations, count = self.repo.list_transformations(
+            transformations, count, next_cursor = await self.repo.list_transformations(
                 search=payload.search,
                 limit=payload.limit,
                 offset=payload.offset,
@@ -33,88 +42,135 @@ class TransformationService:
                 end_date=(
                     payload.end_date if isinstance(payload.end_date, str) else None
                 ),
+                cursor=payload.keyset,
+                count_mode=payload.count_mode,
+                fields=payload.field_names,
             )
-            return {"transformations": transformations, "count": count}
+            return {
+                "transformations": transformations,
+                "count": count,
+                "next_cursor": next_cursor,
+                "count_mode": payload.count_mode.value,
+            }
         except Exception as e:
             raise DatabaseError("get_transformations", str(e))
 
-    def get_transformation(self, transformation_id: str) -> Transformation:
-        """Get a single transformation"""
+    async def get_transformation(
+        self, transformation_id: str, fields: Tuple[str, ...] | None = None
+    ) -> Transformation:
+        """Get a single transformation, restricted to `fields` when given"""
         transformation = None
         try:
-            transformation = self.repo.get_transformation_by_id(transformation_id)
+            transformation = await self.repo.get_transformation_by_id(
+                transformation_id, fields
+            )
         except Exception as e:
             raise DatabaseError("get_transformation", str(e))
         if not transformation:
             raise ItemNotFoundError("get_transformation", transformation_id)
         return transformation
 
-    def get_transformation_by_purchase(self, purchase_id: str) -> Transformation:
+    async def get_transformation_by_purchase(self, purchase_id: str) -> Transformation:
         """Get transformation by purchase id"""
         transformation = None
         try:
-            transformation = self.repo.get_transformation_by_purchase(purchase_id)
+            transformation = await self.repo.get_transformation_by_purchase(purchase_id)
         except Exception as e:
             raise DatabaseError("get_transformation_by_purchase", str(e))
         if not transformation:
             raise ItemNotFoundError("get_transformation_by_purchase", purchase_id)
         return transformation
 
-    def create_transformation(self, payload: TransformationCreate) -> Transformation:
+    async def create_transformation(
+        self, payload: TransformationCreate
+    ) -> Transformation:
         """Create a new transformation"""
         # Verify that the purchase exists
-        PurchaseService().get_purchase(payload.purchase_id)
+        await self.purchase_service.get_purchase(payload.purchase_id)
 
         try:
-            transformation = self.repo.create_transformation(payload)
+            transformation = await self.repo.create_transformation(payload)
             return transformation
         except Exception as e:
             raise DatabaseError("create_transformation", str(e))
 
-    def update_transformation(
+    async def update_transformation(
         self, transformation_id: str, payload: TransformationUpdate
     ) -> Transformation:
         """Update an existing transformation"""
         try:
-            transformation = self.repo.update_transformation(transformation_id, payload)
+            transformation = await self.repo.update_transformation(
+                transformation_id, payload
+            )
             if not transformation:
                 raise ItemNotFoundError("update_transformation", transformation_id)
             return transformation
         except Exception as e:
             raise DatabaseError("update_transformation", str(e))
 
-    def delete_transformation(self, transformation_id: str) -> None:
+    async def delete_transformation(self, transformation_id: str) -> None:
         """Delete a transformation"""
-        # Check if transformation exists first
-        self.get_transformation(transformation_id)
-
         try:
-            self.repo.delete_transformation(transformation_id)
+            deleted = await self.repo.delete_transformation(transformation_id)
         except Exception as e:
             raise DatabaseError("delete_transformation", str(e))
+        if not deleted:
+            raise ItemNotFoundError("delete_transformation", transformation_id)
 
-    def transformation_summary(self, transformation_id: str) -> TransformationSummary:
+    async def transformation_summary(
+        self, transformation_id: str
+    ) -> TransformationSummary:
         """Get transformation summary with step calculations"""
         try:
             # Get the transformation
-            transformation = self.get_transformation(transformation_id)
+            transformation = await self.get_transformation(transformation_id)
 
-            # Get all steps for this transformation
-            steps = self.step_repo.list_steps_by_transformation(transformation_id)
+            # Aggregate all steps of this transformation in the database
+            totals = await self.step_repo.get_step_totals(transformation_id)
+            return self._build_summary(transformation, totals)
+        except Exception as e:
+            raise DatabaseError("transformation_summary", str(e))
 
-            # Calculate totals from steps
-            total_portions = sum(step.portions for step in steps)
-            total_step_quantity = sum(step.quantity for step in steps)
-            step_count = len(steps)
-            remaining_quantity = transformation.quantity_usable - total_step_quantity
+    async def transformation_summaries(
+        self, payload: TransformationSummaryPayload
+    ) -> List[TransformationSummary]:
+        """Get the summaries of several transformations, in the requested order.
 
-            # Create summary with calculated values
-            return TransformationSummary(
-                **transformation.model_dump(),
-                total_portions=total_portions,
-                total_step_quantity=total_step_quantity,
-                step_count=step_count,
-                remaining_quantity=remaining_quantity,
+        Unknown IDs are skipped.
+        """
+        ids = list(dict.fromkeys(payload.ids))
+        try:
+            # Both queries only depend on the IDs, so run them side by side
+            transformations, totals = await asyncio.gather(
+                self.repo.get_transformations_by_ids(ids),
+                self.step_repo.list_step_totals(ids),
             )
         except Exception as e:
-            raise DatabaseError("transformation_summary", str(e))
+            raise DatabaseError("transformation_summaries", str(e))
+
+        by_id = {item.id: item for item in transformations}
+        return [
+            self._build_summary(
+                by_id[transformation_id],
+                totals.get(transformation_id, TransformationStepTotals()),
+            )
+            for transformation_id in ids
+            if transformation_id in by_id
+        ]
+
+    @staticmethod
+    def _build_summary(
+        transformation: Transformation, totals: TransformationStepTotals
+    ) -> TransformationSummary:
+        """Combine a transformation with the totals of its steps"""
+        return TransformationSummary.model_validate(
+            {
+                **transformation.model_dump(),
+                "total_portions": totals.total_portions,
+                "total_step_quantity": totals.total_step_quantity,
+                "step_count": totals.step_count,
+                "remaining_quantity": (
+                    transformation.quantity_usable - totals.total_step_quantity
+                ),
+            }
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import List
 
 from app.db.repositories.transformation_step_repository import TransformationStepRepo
@@ -14,19 +15,23 @@ from app.services.transformation_service import TransformationService
 class TransformationStepService:
     def __init__(self) -> None:
         self.repo = TransformationStepRepo()
-        self.transformation = TransformationService()
 
-    def get_steps_by_transformation(
+    @cached_property
+    def transformation(self) -> TransformationService:
+        """Only the step writes check the parent transformation"""
+        return TransformationService()
+
+    async def get_steps_by_transformation(
         self, transformation_id: str, payload: TransformationStepPayload
     ) -> List[TransformationStep]:
         """Get all transformation steps for a specific transformation with filters"""
         try:
-            start_date = payload.start_date.isoformat() if payload.start_date else None
-            end_date = payload.end_date.isoformat() if payload.end_date else None
+            start_date = payload.start_date
+            end_date = payload.end_date
             is_desc = payload.order.value == "desc"
             offset = (payload.page - 1) * payload.limit
 
-            steps = self.repo.list_steps_by_transformation(
+            steps = await self.repo.list_steps_by_transformation(
                 transformation_id=transformation_id,
                 limit=payload.limit,
                 offset=offset,
@@ -38,46 +43,49 @@ class TransformationStepService:
         except Exception as e:
             raise DatabaseError("get_steps_by_transformation", str(e))
 
-    def get_step(self, step_id: str) -> TransformationStep:
+    async def get_step(self, step_id: str) -> TransformationStep:
         """Get a single transformation step"""
         step = None
         try:
-            step = self.repo.get_step_by_id(step_id)
+            step = await self.repo.get_step_by_id(step_id)
         except Exception as e:
             raise DatabaseError("get_step", str(e))
         if not step:
             raise ItemNotFoundError("get_step", step_id)
         return step
 
-    def create_step(self, payload: TransformationStepCreate) -> TransformationStep:
+    async def create_step(
+        self, payload: TransformationStepCreate
+    ) -> TransformationStep:
         """Create a new transformation step"""
 
         # Verify that the transformation exists
-        self.transformation.get_transformation(payload.transformation_id)
+        await self.transformation.get_transformation(payload.transformation_id)
 
         try:
-            step = self.repo.create_step(payload)
+            step = await self.repo.create_step(payload)
             return step
         except Exception as e:
             raise DatabaseError("create_step", str(e))
 
-    def update_step(
+    async def update_step(
         self, step_id: str, payload: TransformationStepUpdate
     ) -> TransformationStep:
         """Update an existing transformation step"""
         try:
-            step = self.repo.update_step(step_id, payload)
+            step = await self.repo.update_step(step_id, payload)
             if not step:
                 raise ItemNotFoundError("update_step", step_id)
             return step
         except Exception as e:
             raise DatabaseError("update_step", str(e))
 
-    def delete_step(self, step_id: str) -> None:
+    async def delete_step(self, step_id: str) -> None:
         """Delete a transformation step"""
         try:
-            self.get_step(step_id)
-            self.repo.delete_step(step_id)
+            deleted = await self.repo.delete_step(step_id)
         except Exception as e:
             raise DatabaseError("delete_step", str(e))
+        if not deleted:
+            raise ItemNotFoundError("delete_step", step_id)
 
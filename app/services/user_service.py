@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 from app.models.users import User, UserCreate, UserUpdate
 from app.db.repositories.users_repository import UserRepo
 from app.core.exception import DatabaseError, ItemNotFoundError
@@ -8,48 +8,50 @@ class UserService:
     def __init__(self) -> None:
         self.repo = UserRepo()
 
-    def get_users(self) -> List[User]:
-        """Get all users"""
+    async def get_users(self, fields: Tuple[str, ...] | None = None) -> List[User]:
+        """Get all users, restricted to `fields` when given"""
         try:
-            users = self.repo.list_users()
+            users = await self.repo.list_users(fields=fields)
             return users
         except Exception as e:
             raise DatabaseError("get_users", str(e))
 
-    def get_user(self, user_id: str) -> User:
-        """Get a single user"""
+    async def get_user(
+        self, user_id: str, fields: Tuple[str, ...] | None = None
+    ) -> User:
+        """Get a single user, restricted to `fields` when given"""
         user = None
         try:
-            user = self.repo.get_user_by_id(user_id)
+            user = await self.repo.get_user_by_id(user_id, fields)
         except Exception as e:
             raise DatabaseError("get_user", str(e))
         if not user:
             raise ItemNotFoundError("get_user", user_id)
         return user
 
-    def create_user(self, payload: UserCreate) -> User:
+    async def create_user(self, payload: UserCreate) -> User:
         """Create a new user"""
         try:
-            user = self.repo.create_user(payload)
+            user = await self.repo.create_user(payload)
             return user
         except Exception as e:
             raise DatabaseError("create_user", str(e))
 
-    def update_user(self, user_id: str, payload: UserUpdate) -> User:
+    async def update_user(self, user_id: str, payload: UserUpdate) -> User:
         """Update an existing user"""
         try:
-            user = self.repo.update_user(user_id, payload.full_name)
+            user = await self.repo.update_user(user_id, payload.full_name)
             if not user:
                 raise ItemNotFoundError("update_user", user_id)
             return user
         except Exception as e:
             raise DatabaseError("update_user", str(e))
 
-    def delete_user(self, user_id: str) -> None:
+    async def delete_user(self, user_id: str) -> None:
         """Delete a user"""
         try:
-            # Check if user exists first
-            self.get_user(user_id)
-            self.repo.delete_user(user_id)
+            deleted = await self.repo.delete_user(user_id)
         except Exception as e:
-            raise DatabaseError("delete_user", str(e))
\ No newline at end of file
+            raise DatabaseError("delete_user", str(e))
+        if not deleted:
+            raise ItemNotFoundError("delete_user", user_id)
\ No newline at end of file
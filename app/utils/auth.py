@@ -1,17 +1,87 @@
-from typing import Any
+from typing import Any, Dict
 
+import jwt
 from fastapi import Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from app.config import (
+    AUTH_VERIFY_MODE,
+    SUPABASE_JWKS_TTL,
+    SUPABASE_JWT_AUDIENCE,
+    SUPABASE_JWT_SECRET,
+    SUPABASE_SERVICE_ROLE_KEY,
+    SUPABASE_URL,
+)
 from app.db.supabase import SUPABASE
+from app.utils.token_cache import confirmed_users, token_cache
+from app.utils.token_verifier import LocalTokenVerifier, SigningKeyUnavailable
 
 bearer_scheme = HTTPBearer()
 
+auth_db = SUPABASE()
 
-def check_login(token: HTTPAuthorizationCredentials = Depends(bearer_scheme)) -> bool:
-    client = SUPABASE().client
+token_verifier = LocalTokenVerifier(
+    jwks_url=f"{(SUPABASE_URL or '').rstrip('/')}/auth/v1/.well-known/jwks.json",
+    api_key=SUPABASE_SERVICE_ROLE_KEY,
+    secret=SUPABASE_JWT_SECRET,
+    audience=SUPABASE_JWT_AUDIENCE,
+    jwks_ttl=SUPABASE_JWKS_TTL,
+)
+
+
+async def check_login(
+    token: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> bool:
+    if token_cache.get(token.credentials):
+        return True
+
+    # FastAPI ignores the return value of a dependency, only raising blocks
+    if not await verify_token(token.credentials):
+        raise HTTPException(status_code=401, detail="Unconfirmed or unknown user")
+    token_cache.add(token.credentials)
+    return True
+
+
+async def verify_token(access_token: str) -> bool:
+    if AUTH_VERIFY_MODE == "local":
+        try:
+            # May refetch the JWKS, so keep it off the event loop
+            claims = await run_in_threadpool(token_verifier.verify, access_token)
+        except SigningKeyUnavailable:
+            # Key set rotated or unreachable, let Supabase Auth decide
+            claims = None
+        except jwt.PyJWTError as e:
+            raise HTTPException(status_code=401, detail=f"Invalid token: {str(e)}")
+
+        if claims is not None:
+            if "email_confirmed_at" in claims:
+                return check_claims(claims)
+
+            # Supabase only puts `email_confirmed_at` in the token when a
+            # custom access token hook adds it, otherwise Supabase Auth is
+            # asked once per user instead of once per token
+            if confirmed_users.get(claims["sub"]):
+                return True
+            is_valid = await check_remote(access_token)
+            if is_valid:
+                confirmed_users.add(claims["sub"])
+            return is_valid
+
+    return await check_remote(access_token)
+
+
+def check_claims(claims: Dict[str, Any]) -> bool:
+    """Apply the same user checks as the remote path to verified claims"""
+    if not claims.get("sub"):
+        return False
+
+    return bool(claims["email_confirmed_at"])
+
+
+async def check_remote(access_token: str) -> bool:
     try:
-        response = client.auth.get_user(token.credentials)
+        response = await auth_db.run(auth_db.client.auth.get_user, access_token)
 
         # Vérification que l'utilisateur existe et n'est pas anonyme
         if response.user is None:
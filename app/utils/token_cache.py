@@ -0,0 +1,122 @@
+"""In-process cache of validated access tokens.
+
+Entries are keyed by a SHA-256 of the token, bounded by LRU size, expire
+after a TTL and never outlive the token's own `exp` claim.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple
+
+import jwt
+
+from app.config import (
+    AUTH_CONFIRMED_USER_TTL,
+    AUTH_TOKEN_CACHE_SIZE,
+    AUTH_TOKEN_CACHE_TTL,
+)
+
+
+class CachedToken(NamedTuple):
+    expires_at: float
+    user_id: str | None
+
+
+class TokenCache:
+    def __init__(self, max_size: int = 1024, ttl: float = 60) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, CachedToken] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> bool:
+        """Return True if the token was validated recently and is still alive"""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False
+
+    def add(self, token: str) -> None:
+        """Remember a token that has just been validated"""
+        try:
+            claims = jwt.decode(token, options={"verify_signature": False})
+        except jwt.DecodeError:
+            return
+
+        expires_at = time.time() + self.ttl
+        if "exp" in claims:
+            expires_at = min(expires_at, float(claims["exp"]))
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = CachedToken(expires_at, claims.get("sub"))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def revoke(self, token: str) -> None:
+        """Drop a single token, e.g. on logout"""
+        with self._lock:
+            self._entries.pop(self._key(token), None)
+
+    def revoke_user(self, user_id: str) -> None:
+        """Drop every cached token of a user, e.g. after a password change"""
+        with self._lock:
+            for key in [k for k, v in self._entries.items() if v.user_id == user_id]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Hit and miss counters plus current size"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+class ConfirmedUsers:
+    """Users whose email Supabase Auth reported confirmed, by `sub`.
+
+    Lets local verification accept tokens without an `email_confirmed_at`
+    claim after one remote check per user and TTL, instead of one per token.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 3600) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, float] = OrderedDict()
+
+    def get(self, user_id: str) -> bool:
+        """Return True if the user was confirmed within the TTL"""
+        with self._lock:
+            expires_at = self._entries.get(user_id)
+            if expires_at is not None and expires_at > time.time():
+                self._entries.move_to_end(user_id)
+                return True
+            self._entries.pop(user_id, None)
+            return False
+
+    def add(self, user_id: str) -> None:
+        with self._lock:
+            self._entries[user_id] = time.time() + self.ttl
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+token_cache = TokenCache(max_size=AUTH_TOKEN_CACHE_SIZE, ttl=AUTH_TOKEN_CACHE_TTL)
+confirmed_users = ConfirmedUsers(
+    max_size=AUTH_TOKEN_CACHE_SIZE, ttl=AUTH_CONFIRMED_USER_TTL
+)
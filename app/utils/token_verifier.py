@@ -0,0 +1,107 @@
+"""Local verification of Supabase access tokens.
+
+Tokens are checked against a cached JWKS (asymmetric signing keys) or the
+project's shared JWT secret (HS256), so the auth dependency does not need
+a round-trip to Supabase Auth for every request.
+"""
+
+import threading
+import time
+from typing import Any, Dict
+
+import httpx
+import jwt
+
+from app.db.supabase import registry
+
+
+class SigningKeyUnavailable(Exception):
+    """Raised when the token cannot be verified with the keys known locally"""
+
+
+class LocalTokenVerifier:
+    def __init__(
+        self,
+        jwks_url: str,
+        api_key: str | None,
+        secret: str | None = None,
+        audience: str = "authenticated",
+        jwks_ttl: float = 600,
+        jwks_min_refresh_interval: float = 30,
+    ) -> None:
+        self.jwks_url = jwks_url
+        self.api_key = api_key
+        self.secret = secret
+        self.audience = audience
+        self.jwks_ttl = jwks_ttl
+        self.jwks_min_refresh_interval = jwks_min_refresh_interval
+        self._lock = threading.Lock()
+        self._keys: Dict[str, jwt.PyJWK] = {}
+        self._fetched_at: float | None = None
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """Verify signature, expiry and audience and return the token claims.
+
+        The accepted algorithm comes from the key, never from the token header,
+        which only has to agree with it.
+
+        Raises:
+            jwt.PyJWTError: If the token is malformed, expired or forged
+            SigningKeyUnavailable: If no local key can check the signature
+        """
+        header = jwt.get_unverified_header(token)
+
+        if header.get("alg") == "HS256":
+            if not self.secret:
+                raise SigningKeyUnavailable("No shared JWT secret configured")
+            key: Any = self.secret
+            algorithm = "HS256"
+        else:
+            kid = header.get("kid")
+            if not kid:
+                raise jwt.InvalidTokenError("Token header has no kid")
+            signing_key = self._get_signing_key(kid)
+            key, algorithm = signing_key.key, signing_key.algorithm_name
+            if header.get("alg") != algorithm:
+                raise jwt.InvalidAlgorithmError(
+                    f"Token algorithm {header.get('alg')} does not match key {kid}"
+                )
+
+        return jwt.decode(
+            token,
+            key,
+            algorithms=[algorithm],
+            audience=self.audience,
+            options={"require": ["exp", "sub"]},
+        )
+
+    def _get_signing_key(self, kid: str) -> jwt.PyJWK:
+        """Look the key up in the cached JWKS, refetching it when stale or unknown"""
+        now = time.monotonic()
+        fresh = self._fetched_at is not None and now - self._fetched_at < self.jwks_ttl
+        if fresh and kid in self._keys:
+            return self._keys[kid]
+
+        with self._lock:
+            now = time.monotonic()
+            recently_fetched = (
+                self._fetched_at is not None
+                and now - self._fetched_at < self.jwks_min_refresh_interval
+            )
+            if kid not in self._keys or not recently_fetched:
+                self._refresh_keys()
+
+            if kid not in self._keys:
+                raise SigningKeyUnavailable(f"Signing key {kid} not found in JWKS")
+            return self._keys[kid]
+
+    def _refresh_keys(self) -> None:
+        headers = {"apikey": self.api_key} if self.api_key else {}
+        try:
+            response = registry.http_client.get(self.jwks_url, headers=headers)
+            response.raise_for_status()
+            jwk_set = jwt.PyJWKSet.from_dict(response.json())
+        except (httpx.HTTPError, jwt.PyJWKSetError) as e:
+            raise SigningKeyUnavailable(f"Could not load JWKS: {e}")
+        self._keys = {key.key_id: key for key in jwk_set.keys if key.key_id}
+        self._fetched_at = time.monotonic()
@@ -0,0 +1,379 @@
+"""Local stand-in for the Supabase REST and Auth APIs used by the benchmarks.
+
+Serves seeded, deterministic data for the tables and RPCs read by the
+benchmarked routes, with a configurable latency added to every response.
+Only the PostgREST subset the repositories emit is understood: `eq.`, `in.`,
+`gt.`, `gte.`, `lt.`, `lte.` and `ilike.` filters, `or=(...)` logic trees
+(the keyset cursors), `order`, `limit`/`offset` (also on the embedded daily
+summaries), `Prefer: count=...`,
+aggregate selects (`count()` and `column.sum()`, grouped by the plain columns
+selected alongside) and the grouped product summary RPC.
+"""
+
+import asyncio
+import random
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+USER_ID = "00000000-0000-4000-8000-000000000001"
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _timestamp(rng: random.Random, days: int = 180) -> str:
+    return (EPOCH + timedelta(seconds=rng.randrange(days * 86400))).isoformat()
+
+
+def seed(rows: int = 2000, seed: int = 42) -> Dict[str, List[Dict[str, Any]]]:
+    """Build the tables, `rows` purchases and proportionate related data"""
+    rng = random.Random(seed)
+    tables: Dict[str, List[Dict[str, Any]]] = {}
+
+    categories = [_uuid(rng) for _ in range(10)]
+    inventories = []
+    for i in range(max(rows // 20, 1)):
+        inventory_id = _uuid(rng)
+        inventories.append(
+            {
+                "inventory_id": inventory_id,
+                "name": f"Stock item {i}",
+                "initial_quantity": rng.randrange(10, 500),
+                "unit": "kg",
+                "category": rng.choice(categories),
+                "created_at": _timestamp(rng),
+                "current_quantity": rng.randrange(0, 500),
+                "last_txn_at": _timestamp(rng),
+                "daily_transaction_summary": [
+                    {
+                        "created_at": _timestamp(rng),
+                        "total_sales": rng.randrange(50),
+                        "total_quantity": rng.randrange(500),
+                        "inventory_id": inventory_id,
+                        "summary_date": (EPOCH.date() + timedelta(days=d)).isoformat(),
+                    }
+                    for d in range(7)
+                ],
+            }
+        )
+    tables["inventory"] = inventories
+
+    purchases = []
+    for i in range(rows):
+        quantity = rng.randrange(1, 50)
+        price = rng.randrange(1, 40)
+        created_at = _timestamp(rng)
+        purchases.append(
+            {
+                "id": _uuid(rng),
+                "item_name": f"Item {i % 150}",
+                "quantity": quantity,
+                "unit": "kg",
+                "price_per_unit": price,
+                "total_price": quantity * price,
+                "purchase_date": created_at[:10],
+                "category_id": rng.choice(categories),
+                "inventory_id": rng.choice(inventories)["inventory_id"],
+                "notes": None,
+                "created_by": USER_ID,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+        )
+    tables["purchases"] = purchases
+
+    transformations, steps = [], []
+    for purchase in purchases[: max(rows // 4, 1)]:
+        transformation_id = _uuid(rng)
+        usable = purchase["quantity"] * 0.8
+        transformations.append(
+            {
+                "id": transformation_id,
+                "purchase_id": purchase["id"],
+                "product_name": purchase["item_name"],
+                "quantity_received": purchase["quantity"],
+                "quantity_usable": usable,
+                "waste_quantity": purchase["quantity"] - usable,
+                "transformation_date": purchase["purchase_date"],
+                "unit": "kg",
+                "created_by": USER_ID,
+                "created_at": purchase["created_at"],
+                "updated_at": purchase["created_at"],
+            }
+        )
+        for _ in range(rng.randrange(1, 30)):
+            steps.append(
+                {
+                    "id": _uuid(rng),
+                    "transformation_id": transformation_id,
+                    "portions": rng.randrange(1, 10),
+                    "quantity": round(rng.uniform(0.1, 2), 2),
+                }
+            )
+    tables["transformations"] = transformations
+    tables["transformation_steps"] = steps
+
+    products = [
+        {"product_id": _uuid(rng), "product_name": f"Dish {i}"}
+        for i in range(max(rows // 40, 1))
+    ]
+    tables["product_daily_summary"] = [
+        {
+            "product_id": product["product_id"],
+            "product_name": product["product_name"],
+            "day": (EPOCH.date() + timedelta(days=d)).isoformat(),
+            "initial_portion": 40.0,
+            "entry": float(rng.randrange(20)),
+            "final_portion": 0.0,
+            "sale": float(rng.randrange(30)),
+            "remaining": float(rng.randrange(10)),
+        }
+        for product in products
+        for d in range(60)
+    ]
+    return tables
+
+
+def _matches(row: Dict[str, Any], column: str, expression: str) -> bool:
+    op, _, value = expression.partition(".")
+    if value.startswith('"'):
+        value = value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    if op == "eq":
+        return str(row.get(column)) == value
+    if op == "in":
+        return str(row.get(column)) in value.strip("()").split(",")
+    if op == "gt":
+        return str(row.get(column)) > value
+    if op == "gte":
+        return str(row.get(column)) >= value
+    if op == "lt":
+        return str(row.get(column)) < value
+    if op == "lte":
+        return str(row.get(column)) <= value
+    if op == "ilike":
+        return value.strip("*%").lower() in str(row.get(column)).lower()
+    return True
+
+
+def _split_terms(tree: str) -> List[str]:
+    """Top-level comma separated terms of a logic tree, quotes kept intact"""
+    terms, depth, quoted, start = [], 0, False, 0
+    for i, char in enumerate(tree):
+        if char == '"' and tree[i - 1] != "\\":
+            quoted = not quoted
+        elif not quoted and char == "(":
+            depth += 1
+        elif not quoted and char == ")":
+            depth -= 1
+        elif not quoted and char == "," and depth == 0:
+            terms.append(tree[start:i])
+            start = i + 1
+    terms.append(tree[start:])
+    return terms
+
+
+def _matches_tree(row: Dict[str, Any], operator: str, tree: str) -> bool:
+    """Evaluate an `or=(...)` / `and(...)` logic tree against a row"""
+    results = []
+    for term in _split_terms(tree):
+        if term.startswith(("and(", "or(")):
+            inner_operator, _, inner = term.partition("(")
+            results.append(_matches_tree(row, inner_operator, inner[:-1]))
+        else:
+            column, _, expression = term.partition(".")
+            results.append(_matches(row, column, expression))
+    return any(results) if operator == "or" else all(results)
+
+
+# Aggregate functions of a PostgREST select, over the non-null values
+AGGREGATES = {
+    "sum": lambda values: sum(values) if values else None,
+    "min": lambda values: min(values) if values else None,
+    "max": lambda values: max(values) if values else None,
+    "count": len,
+}
+
+
+def _aggregate(rows: List[Dict[str, Any]], select: str) -> List[Dict[str, Any]]:
+    """Evaluate an aggregate select, the plain columns acting as GROUP BY"""
+    keys, aggregates = [], []
+    for item in select.split(","):
+        alias, _, expression = item.strip().rpartition(":")
+        column, _, function = expression.partition(".")
+        if expression == "count()":
+            aggregates.append((alias or "count", None, "count"))
+        elif function.endswith("()"):
+            function = function.removesuffix("()")
+            aggregates.append((alias or function, column, function))
+        else:
+            keys.append((alias or column, column))
+
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(row.get(c) for _, c in keys), []).append(row)
+    if not keys and not groups:
+        # Without GROUP BY an empty table still aggregates to one row
+        groups[()] = []
+
+    result = []
+    for group, members in groups.items():
+        out = {name: value for (name, _), value in zip(keys, group)}
+        for name, column, function in aggregates:
+            values = [
+                member[column] if column else 1
+                for member in members
+                if column is None or member.get(column) is not None
+            ]
+            out[name] = AGGREGATES[function](values)
+        result.append(out)
+    return result
+
+
+def _page(request: Request, rows: List[Dict[str, Any]]) -> JSONResponse:
+    """Apply order, limit, offset and count headers to filtered rows"""
+    params = request.query_params
+    for term in reversed(params.get("order", "").split(",")):
+        if term:
+            column, _, direction = term.partition(".")
+            rows = sorted(
+                rows, key=lambda r: str(r.get(column)), reverse=direction == "desc"
+            )
+
+    total = len(rows)
+    offset = int(params.get("offset", 0))
+    rows = rows[offset : offset + int(params.get("limit", total or 1))]
+
+    headers = {}
+    if "count=" in request.headers.get("prefer", ""):
+        end = offset + len(rows) - 1
+        headers["Content-Range"] = f"{offset}-{end}/{total}" if rows else f"*/{total}"
+    return JSONResponse(rows, headers=headers)
+
+
+def _embed_summary(
+    request: Request, row: Dict[str, Any], select: str
+) -> Dict[str, Any]:
+    """Apply the `daily_transaction_summary.*` options to an inventory row"""
+    embed = "daily_transaction_summary"
+    days = row.get(embed, [])
+    row = {k: v for k, v in row.items() if k != embed}
+    if embed not in select:
+        return row
+
+    options = {}
+    for key, value in request.query_params.multi_items():
+        if not key.startswith(f"{embed}."):
+            continue
+        column = key.removeprefix(f"{embed}.")
+        if column in ("order", "limit"):
+            options[column] = value
+        else:
+            days = [day for day in days if _matches(day, column, value)]
+    if "order" in options:
+        column, _, direction = options["order"].partition(".")
+        days = sorted(days, key=lambda d: d[column], reverse=direction == "desc")
+    if "limit" in options:
+        days = days[: int(options["limit"])]
+    return {**row, embed: days}
+
+
+def build_app(
+    tables: Dict[str, List[Dict[str, Any]]],
+    latency_ms: float = 0,
+    jitter_ms: float = 0,
+) -> Starlette:
+    async def delay() -> None:
+        if latency_ms or jitter_ms:
+            await asyncio.sleep((latency_ms + random.uniform(0, jitter_ms)) / 1000)
+
+    async def table(request: Request) -> JSONResponse:
+        await delay()
+        name = request.path_params["table"]
+        params = request.query_params
+        reserved = {"select", "order", "limit", "offset", "or", "columns"}
+        rows = [
+            row
+            for row in tables.get(name, [])
+            if all(
+                _matches(row, column, value)
+                for column, value in params.multi_items()
+                if column not in reserved and "." not in column
+            )
+            and all(
+                _matches_tree(row, "or", tree[1:-1]) for tree in params.getlist("or")
+            )
+        ]
+
+        select = params.get("select", "*")
+        if "()" in select:
+            return JSONResponse(_aggregate(rows, select))
+        if name == "inventory":
+            rows = [_embed_summary(request, row, select) for row in rows]
+        return _page(request, rows)
+
+    async def product_summary(request: Request) -> JSONResponse:
+        await delay()
+        body = await request.json()
+        grouped: Dict[str, Dict[str, Any]] = {}
+        for row in tables["product_daily_summary"]:
+            if not body["p_start_date"] <= row["day"] <= body["p_end_date"]:
+                continue
+            if body.get("p_name") and body["p_name"].lower() not in (
+                row["product_name"].lower()
+            ):
+                continue
+            product = grouped.setdefault(
+                row["product_id"],
+                {
+                    "product_id": row["product_id"],
+                    "product_name": row["product_name"],
+                    "days": [],
+                },
+            )
+            product["days"].append(row)
+
+        products = sorted(
+            grouped.values(), key=lambda p: (p["product_name"], p["product_id"])
+        )
+        page = products[body["p_offset"] : body["p_offset"] + body["p_limit"]]
+        return JSONResponse([{**p, "total_count": len(products)} for p in page])
+
+    async def user(request: Request) -> JSONResponse:
+        await delay()
+        now = EPOCH.isoformat()
+        return JSONResponse(
+            {
+                "id": USER_ID,
+                "aud": "authenticated",
+                "email": "bench@example.com",
+                "email_confirmed_at": now,
+                "app_metadata": {},
+                "user_metadata": {},
+                "created_at": now,
+            }
+        )
+
+    return Starlette(
+        routes=[
+            Route("/auth/v1/user", user),
+            Route(
+                "/rest/v1/rpc/get_product_transactions_summary_grouped",
+                product_summary,
+                methods=["POST"],
+            ),
+            Route("/rest/v1/{table}", table),
+        ]
+    )
+
+
+def today() -> date:
+    """Last seeded day, handy for date-range routes"""
+    return EPOCH.date() + timedelta(days=59)
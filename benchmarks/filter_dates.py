@@ -0,0 +1,60 @@
+"""Micro-benchmark of the date filters parsed by `FilterPayload`.
+
+Compares the per-request cost of the previous `dateparser.parse` call with
+the ISO fast path and the memoised free text fallback of `parse_date`.
+
+Run from the repository root:
+
+    python -m benchmarks.filter_dates
+"""
+
+import subprocess
+import sys
+import timeit
+from typing import Callable
+
+from app.models.shared import FilterPayload, parse_date
+
+SAMPLES = {
+    "date": "2024-03-15",
+    "datetime": "2024-03-15T08:30:00+00:00",
+    "free text": "15 March 2024",
+    "relative": "3 days ago",
+}
+
+
+def per_call_us(fn: Callable[[], object], number: int) -> float:
+    """Best of 5 runs, in microseconds per call"""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def import_ms(module: str) -> float:
+    """Import time of a module in a fresh interpreter, in milliseconds"""
+    code = f"import time; t = time.perf_counter(); import {module}; "
+    code += "print((time.perf_counter() - t) * 1000)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return float(out.stdout)
+
+
+def main() -> None:
+    import dateparser
+
+    print(f"{'input':<12}{'dateparser':>14}{'parse_date':>14}{'speedup':>10}")
+    for name, value in SAMPLES.items():
+        before = per_call_us(lambda: dateparser.parse(value), number=200)
+        after = per_call_us(lambda: parse_date(value), number=20_000)
+        print(f"{name:<12}{before:>12.1f}us{after:>12.2f}us{before / after:>9.0f}x")
+
+    payload = per_call_us(
+        lambda: FilterPayload(start_date="2024-03-01", end_date="2024-03-31"),
+        number=20_000,
+    )
+    print(f"\nFilterPayload with two ISO dates: {payload:.2f}us per request")
+    print(f"import dateparser: {import_ms('dateparser'):.0f}ms")
+    print(f"import app.models.shared: {import_ms('app.models.shared'):.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
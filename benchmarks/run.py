@@ -0,0 +1,297 @@
+"""Latency and throughput of the main read routes against a local Supabase.
+
+Starts `benchmarks.fake_supabase` with seeded data and a configurable
+per-call latency, points the application at it and drives the routes
+in-process with concurrent clients. Reports p50/p95/p99 and throughput per
+route, so changes to the request path can be compared without a real
+Supabase project.
+
+Run from the repository root:
+
+    python -m benchmarks.run
+    python -m benchmarks.run --latency-ms 20 --concurrency 32 --auth local
+    python -m benchmarks.run --routes purchases,auth --json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List
+
+import httpx
+import jwt
+import uvicorn
+
+from benchmarks import fake_supabase
+
+JWT_SECRET = "benchmark-secret-benchmark-secret-32b"
+
+# Route name -> builder of (method, path, params or body) from the seeded tables
+ROUTES: Dict[str, Callable[[Dict[str, List[Dict[str, Any]]], random.Random], Any]] = {
+    "purchases": lambda tables, rng: (
+        "GET",
+        "/v1/purchases/",
+        {"page": rng.randrange(1, 10), "limit": 20},
+    ),
+    "inventories": lambda tables, rng: (
+        "GET",
+        "/v1/inventories/",
+        {"page": rng.randrange(1, 5), "limit": 20},
+    ),
+    "transformation_summary": lambda tables, rng: (
+        "GET",
+        f"/v1/transformations/{rng.choice(tables['transformations'])['id']}/summary",
+        None,
+    ),
+    "transformation_summaries": lambda tables, rng: (
+        "POST",
+        "/v1/transformations/summaries",
+        {"ids": [t["id"] for t in rng.sample(tables["transformations"], 10)]},
+    ),
+    "product_summary": lambda tables, rng: (
+        "POST",
+        "/v1/products/transaction/summary",
+        {
+            "start_date": fake_supabase.EPOCH.date().isoformat(),
+            "end_date": fake_supabase.today().isoformat(),
+            "limit": 10,
+            "offset": rng.randrange(0, 40),
+        },
+    ),
+    # Cheapest authenticated route, dominated by the auth dependency
+    "auth": lambda tables, rng: ("GET", "/v1/cache/stats", None),
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_fake_supabase(
+    tables: Dict[str, List[Dict[str, Any]]], latency_ms: float, jitter_ms: float
+) -> str:
+    """Serve the stand-in from a background thread and return its URL"""
+    port = free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(
+            fake_supabase.build_app(tables, latency_ms, jitter_ms),
+            host="127.0.0.1",
+            port=port,
+            log_level="warning",
+        )
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}"
+
+
+def access_token() -> str:
+    now = int(time.time())
+    claims = {
+        "sub": fake_supabase.USER_ID,
+        "aud": "authenticated",
+        "email_confirmed_at": fake_supabase.EPOCH.isoformat(),
+        "iat": now,
+        "exp": now + 3600,
+    }
+    return jwt.encode(claims, JWT_SECRET, algorithm="HS256")
+
+
+def percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+async def bench_route(
+    client: httpx.AsyncClient,
+    build: Callable[..., Any],
+    tables: Dict[str, List[Dict[str, Any]]],
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    seed: int,
+) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    calls = [build(tables, rng) for _ in range(warmup + requests)]
+    latencies: List[float] = []
+    errors = 0
+
+    async def call(method: str, path: str, data: Any) -> float:
+        nonlocal errors
+        kwargs = {"json": data} if method == "POST" else {"params": data}
+        started = time.perf_counter()
+        response = await client.request(method, path, **kwargs)
+        elapsed = time.perf_counter() - started
+        if response.status_code >= 400:
+            errors += 1
+        return elapsed
+
+    for method, path, data in calls[:warmup]:
+        await call(method, path, data)
+
+    queue = iter(calls[warmup:])
+
+    async def worker() -> None:
+        for method, path, data in queue:
+            latencies.append(await call(method, path, data))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+
+    return {
+        "requests": requests,
+        "errors": errors,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "rps": requests / wall,
+    }
+
+
+async def check_transformation_summaries(
+    client: httpx.AsyncClient, tables: Dict[str, List[Dict[str, Any]]]
+) -> None:
+    """Fail unless the batched summaries match the seeded steps, one per id"""
+    ids = [t["id"] for t in tables["transformations"][:5]]
+    response = await client.post(
+        "/v1/transformations/summaries", json={"ids": ids + [str(uuid.uuid4())]}
+    )
+    response.raise_for_status()
+    summaries = response.json()
+    if [s["id"] for s in summaries] != ids:
+        raise SystemExit(f"transformation summaries: expected ids {ids}")
+    for summary in summaries:
+        steps = [
+            step
+            for step in tables["transformation_steps"]
+            if step["transformation_id"] == summary["id"]
+        ]
+        expected = (
+            len(steps),
+            sum(step["portions"] for step in steps),
+            round(sum(step["quantity"] for step in steps), 6),
+        )
+        got = (
+            summary["step_count"],
+            summary["total_portions"],
+            round(summary["total_step_quantity"], 6),
+        )
+        if got != expected:
+            raise SystemExit(
+                f"transformation summary {summary['id']}: {got} != {expected}"
+            )
+
+
+async def run(
+    args: argparse.Namespace, tables: Dict[str, List[Dict[str, Any]]]
+) -> Dict[str, Dict[str, Any]]:
+    from app.main import app
+
+    headers = {"Authorization": f"Bearer {access_token()}"}
+    results = {}
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", headers=headers
+        ) as client:
+            await check_transformation_summaries(client, tables)
+            for name in args.routes:
+                results[name] = await bench_route(
+                    client,
+                    ROUTES[name],
+                    tables,
+                    args.requests,
+                    args.concurrency,
+                    args.warmup,
+                    args.seed,
+                )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500, help="per route")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=20, help="per route")
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rows", type=int, default=2000, help="seeded purchases")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--routes",
+        type=lambda value: value.split(","),
+        default=list(ROUTES),
+        help=f"comma separated subset of {','.join(ROUTES)}",
+    )
+    parser.add_argument(
+        "--auth",
+        choices=["remote", "local"],
+        default="remote",
+        help="AUTH_VERIFY_MODE of the application",
+    )
+    parser.add_argument(
+        "--token-cache",
+        action="store_true",
+        help="keep the validated token cache on (off by default so the auth "
+        "dependency is measured on every request)",
+    )
+    parser.add_argument("--cache", choices=["memory", "none"], default="memory")
+    parser.add_argument("--client-mode", choices=["sync", "async"], default="sync")
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    args = parser.parse_args()
+
+    unknown = set(args.routes) - set(ROUTES)
+    if unknown:
+        parser.error(f"unknown routes: {', '.join(sorted(unknown))}")
+
+    tables = fake_supabase.seed(args.rows, args.seed)
+    url = start_fake_supabase(tables, args.latency_ms, args.jitter_ms)
+
+    # app.config reads the environment at import time
+    os.environ.update(
+        {
+            "SUPABASE_URL": url,
+            "SUPABASE_SERVICE_ROLE_KEY": "benchmark",
+            "SUPABASE_CLIENT_MODE": args.client_mode,
+            "SUPABASE_JWT_SECRET": JWT_SECRET,
+            "AUTH_VERIFY_MODE": args.auth,
+            "AUTH_TOKEN_CACHE_TTL": "60" if args.token_cache else "0",
+            "CACHE_BACKEND": args.cache,
+        }
+    )
+    results = asyncio.run(run(args, tables))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(
+        f"{args.requests} requests per route, concurrency {args.concurrency}, "
+        f"Supabase latency {args.latency_ms:g}ms, auth {args.auth}"
+    )
+    print(
+        f"{'route':<24}{'p50':>9}{'p95':>9}{'p99':>9}{'mean':>9}{'req/s':>9}"
+        f"{'errors':>8}"
+    )
+    for name, r in results.items():
+        print(
+            f"{name:<24}{r['p50_ms']:>7.1f}ms{r['p95_ms']:>7.1f}ms"
+            f"{r['p99_ms']:>7.1f}ms{r['mean_ms']:>7.1f}ms{r['rps']:>9.0f}"
+            f"{r['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Micro-benchmark of the list response serialization on 100-row pages.
+
+Compares FastAPI's handling of the declared `response_model` (revalidation of
+the returned models against the `Dict[str, List[Model] | int | str | None]`
+union, then serialization to JSON bytes) with the pre-rendered
+`RenderedJSONResponse` of `FAST_RESPONSES`, and with the raw Supabase rows
+serialized as they come, the floor of any path.
+
+Run from the repository root:
+
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --rows 20
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List, Type
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from app.api.responses import RenderedJSONResponse
+from app.models.inventory import InventoryResponse
+from app.models.purchase import Purchase
+from app.models.transformation import Transformation
+from benchmarks import fake_supabase
+
+# Response key -> (seeded table, model of its rows)
+PAGES: Dict[str, tuple[str, Type[BaseModel]]] = {
+    "purchases": ("purchases", Purchase),
+    "transformations": ("transformations", Transformation),
+    "inventories": ("inventory", InventoryResponse),
+}
+
+
+async def per_call_us(fn: Any, number: int) -> float:
+    """Best of 5 runs, in microseconds per call"""
+    runs = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(number):
+            await fn()
+        runs.append(time.perf_counter() - start)
+    return min(runs) / number * 1e6
+
+
+async def compare(
+    key: str, model: Type[BaseModel], rows: List[Dict[str, Any]]
+) -> None:
+    field = create_model_field(
+        name=f"Response_{key}",
+        type_=Dict[str, List[model] | int | str | None],
+        mode="serialization",
+    )
+    models = [model.model_validate(row) for row in rows]
+    content = {key: models, "count": len(rows), "next_cursor": None}
+    raw = {key: rows, "count": len(rows), "next_cursor": None}
+    # Both paths must send the same bytes for the comparison to hold
+
+    async def response_model() -> bytes:
+        return await serialize_response(
+            field=field, response_content=content, dump_json=True
+        )
+
+    async def rendered() -> bytes:
+        return RenderedJSONResponse(content).body
+
+    async def raw_rows() -> bytes:
+        return to_json(raw)
+
+    assert await response_model() == await rendered()
+    before = await per_call_us(response_model, number=200)
+    after = await per_call_us(rendered, number=200)
+    floor = await per_call_us(raw_rows, number=200)
+    print(
+        f"{key:<16}{before:>14.0f}us{after:>12.0f}us{floor:>12.0f}us"
+        f"{before / after:>9.1f}x"
+    )
+
+
+async def main(rows: int) -> None:
+    # The seed holds one inventory item per 20 purchases
+    tables = fake_supabase.seed(rows * 20)
+    print(f"{rows} rows per page")
+    print(
+        f"{'page':<16}{'response_model':>16}{'rendered':>14}"
+        f"{'raw rows':>14}{'speedup':>10}"
+    )
+    for key, (table, model) in PAGES.items():
+        await compare(key, model, tables[table][:rows])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100, help="rows per page")
+    asyncio.run(main(parser.parse_args().rows))
@@ -0,0 +1,37 @@
+-- One row per product with all its daily summaries as a JSON array, so that
+-- the API paginates products instead of day rows and does no grouping itself.
+create or replace function public.get_product_transactions_summary_grouped(
+    p_start_date date,
+    p_end_date date,
+    p_name text default null,
+    p_limit integer default 10,
+    p_offset integer default 0
+)
+returns table (
+    product_id text,
+    product_name text,
+    days jsonb,
+    total_count bigint
+)
+language sql
+stable
+as $$
+    with summary as (
+        select *
+        from public.get_product_transactions_summary(p_start_date, p_end_date) s
+        where p_name is null or s.product_name ilike '%' || p_name || '%'
+    ),
+    grouped as (
+        select
+            s.product_id::text as product_id,
+            s.product_name,
+            jsonb_agg(to_jsonb(s) order by s.day) as days
+        from summary s
+        group by s.product_id, s.product_name
+    )
+    select g.product_id, g.product_name, g.days, count(*) over () as total_count
+    from grouped g
+    order by g.product_name, g.product_id
+    limit p_limit
+    offset p_offset;
+$$;
@@ -0,0 +1,101 @@
+-- Stock level of each inventory item, maintained by triggers so that the
+-- API reads it directly instead of deriving it from the transaction history:
+-- current_quantity = initial_quantity + sum(entry) - sum(sale)
+alter table public.inventory
+    add column if not exists current_quantity numeric not null default 0,
+    add column if not exists last_txn_at timestamptz;
+
+update public.inventory i
+set current_quantity = i.initial_quantity + coalesce((
+        select sum(coalesce(t.entry, 0) - coalesce(t.sale, 0))
+        from public.inventory_transaction t
+        where t.inventory_id = i.inventory_id
+    ), 0),
+    last_txn_at = (
+        select max(t.created_at)
+        from public.inventory_transaction t
+        where t.inventory_id = i.inventory_id
+    );
+
+
+-- New items start at their initial quantity, and correcting the initial
+-- quantity shifts the stock level by the same amount
+create or replace function public.inventory_sync_initial_quantity()
+returns trigger
+language plpgsql
+as $$
+begin
+    if tg_op = 'INSERT' then
+        new.current_quantity := new.initial_quantity;
+    elsif new.initial_quantity is distinct from old.initial_quantity then
+        new.current_quantity :=
+            old.current_quantity + new.initial_quantity - old.initial_quantity;
+    end if;
+    return new;
+end;
+$$;
+
+drop trigger if exists inventory_sync_initial_quantity on public.inventory;
+create trigger inventory_sync_initial_quantity
+    before insert or update of initial_quantity on public.inventory
+    for each row execute function public.inventory_sync_initial_quantity();
+
+
+-- Inserted transactions move the stock level of their items in the same
+-- statement, once per item, so single and bulk inserts cost one update each
+create or replace function public.inventory_apply_inserted_transactions()
+returns trigger
+language plpgsql
+as $$
+begin
+    update public.inventory i
+    set current_quantity = i.current_quantity + t.delta,
+        last_txn_at = greatest(i.last_txn_at, t.last_txn_at)
+    from (
+        select
+            inventory_id,
+            sum(coalesce(entry, 0) - coalesce(sale, 0)) as delta,
+            max(coalesce(created_at::timestamptz, now())) as last_txn_at
+        from inserted
+        group by inventory_id
+    ) t
+    where i.inventory_id = t.inventory_id;
+    return null;
+end;
+$$;
+
+drop trigger if exists inventory_apply_inserted_transactions
+    on public.inventory_transaction;
+create trigger inventory_apply_inserted_transactions
+    after insert on public.inventory_transaction
+    referencing new table as inserted
+    for each statement execute function public.inventory_apply_inserted_transactions();
+
+
+-- Corrections and deletions are rare, they are applied row by row
+create or replace function public.inventory_revert_transaction()
+returns trigger
+language plpgsql
+as $$
+begin
+    update public.inventory
+    set current_quantity = current_quantity
+            - (coalesce(old.entry, 0) - coalesce(old.sale, 0))
+            + case when tg_op = 'UPDATE'
+                then coalesce(new.entry, 0) - coalesce(new.sale, 0)
+                else 0
+            end,
+        last_txn_at = (
+            select max(created_at)
+            from public.inventory_transaction
+            where inventory_id = old.inventory_id
+        )
+    where inventory_id = old.inventory_id;
+    return null;
+end;
+$$;
+
+drop trigger if exists inventory_revert_transaction on public.inventory_transaction;
+create trigger inventory_revert_transaction
+    after update of entry, sale, created_at or delete on public.inventory_transaction
+    for each row execute function public.inventory_revert_transaction();
@@ -0,0 +1,6 @@
+-- The transformation summaries count and sum their steps with PostgREST
+-- aggregate functions (`count()`, `portions.sum()`), which PostgREST only
+-- accepts once they are enabled for the role it connects as
+alter role authenticator set pgrst.db_aggregates_enabled = 'true';
+
+notify pgrst, 'reload config';
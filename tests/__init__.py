@@ -1 +1,13 @@
-\"\"\"Test package.\n\nThis package contains all test modules for the O-Platy60 server application.\nTests should be organized to mirror the application structure:\n\n- test_api/: API endpoint tests\n- test_models/: Model validation tests\n- test_repositories/: Repository layer tests\n- test_services/: Service layer tests\n\nTest framework: pytest\nTest database: Should use test-specific Supabase instance\n\nCurrently empty but ready for test implementation.\n\"\"\"\n\n# Test modules will be added here
\ No newline at end of file
+"""Test package.
+
+This package contains all test modules for the O-Platy60 server application.
+Tests should be organized to mirror the application structure:
+
+- test_api/: API endpoint tests
+- test_models/: Model validation tests
+- test_repositories/: Repository layer tests
+- test_services/: Service layer tests
+
+Test framework: pytest
+Test database: `benchmarks.fake_supabase`, a local stand-in seeded per session
+"""
@@ -0,0 +1,35 @@
+"""Shared fixtures: the application wired to a seeded local Supabase stand-in."""
+
+import os
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from fastapi.testclient import TestClient
+
+from benchmarks import fake_supabase
+from benchmarks.run import JWT_SECRET, access_token, start_fake_supabase
+
+TABLES: Dict[str, List[Dict[str, Any]]] = fake_supabase.seed(rows=200)
+
+# app.config reads the environment at import time, and test modules import the
+# application while they are collected, after this module
+os.environ.update(
+    {
+        "SUPABASE_URL": start_fake_supabase(TABLES, latency_ms=0, jitter_ms=0),
+        "SUPABASE_SERVICE_ROLE_KEY": "test",
+        "SUPABASE_JWT_SECRET": JWT_SECRET,
+        "AUTH_VERIFY_MODE": "local",
+        "CACHE_BACKEND": "memory",
+        "WEB_CONCURRENCY": "1",
+        "REQUEST_TIMING_LOG": "false",
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    from app.main import app
+
+    headers = {"Authorization": f"Bearer {access_token()}"}
+    with TestClient(app, headers=headers) as client:
+        yield client
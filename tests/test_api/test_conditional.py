@@ -0,0 +1,25 @@
+from fastapi.testclient import TestClient
+
+
+def test_matching_etag_returns_304(client: TestClient) -> None:
+    params = {"limit": 5}
+    response = client.get("/v1/inventories/", params=params)
+    etag = response.headers["etag"]
+
+    cached = client.get(
+        "/v1/inventories/", params=params, headers={"If-None-Match": etag}
+    )
+
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert not cached.content
+
+
+def test_stale_etag_returns_body(client: TestClient) -> None:
+    params = {"limit": 5}
+    response = client.get(
+        "/v1/inventories/", params=params, headers={"If-None-Match": '"stale"'}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["inventories"]
@@ -0,0 +1,24 @@
+from fastapi.testclient import TestClient
+
+
+def test_cursor_round_trip(client: TestClient) -> None:
+    params = {"limit": 5}
+    expected = client.get("/v1/purchases/", params={"limit": 10}).json()
+
+    first = client.get("/v1/purchases/", params=params).json()
+    assert first["next_cursor"]
+    second = client.get(
+        "/v1/purchases/", params={**params, "cursor": first["next_cursor"]}
+    ).json()
+
+    first_ids = [p["id"] for p in first["purchases"]]
+    second_ids = [p["id"] for p in second["purchases"]]
+    assert len(second_ids) == 5
+    assert not set(first_ids) & set(second_ids)
+    assert first_ids + second_ids == [p["id"] for p in expected["purchases"]]
+
+
+def test_invalid_cursor_is_rejected(client: TestClient) -> None:
+    response = client.get("/v1/purchases/", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 422
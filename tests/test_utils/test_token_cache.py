@@ -0,0 +1,49 @@
+import time
+
+import jwt
+from fastapi.testclient import TestClient
+
+from benchmarks import fake_supabase
+from benchmarks.run import JWT_SECRET, access_token
+from app.utils.token_cache import TokenCache, token_cache
+
+
+def test_revoke_drops_the_token() -> None:
+    cache = TokenCache()
+    token = access_token()
+    cache.add(token)
+    assert cache.get(token)
+
+    cache.revoke(token)
+
+    assert not cache.get(token)
+
+
+def test_revoke_user_drops_every_token_of_the_user() -> None:
+    cache = TokenCache()
+    tokens = [
+        jwt.encode(
+            {"sub": fake_supabase.USER_ID, "exp": int(time.time()) + 60, "n": n},
+            JWT_SECRET,
+        )
+        for n in range(3)
+    ]
+    for token in tokens:
+        cache.add(token)
+
+    cache.revoke_user(fake_supabase.USER_ID)
+
+    assert not any(cache.get(token) for token in tokens)
+    assert cache.stats()["size"] == 0
+
+
+def test_revoked_token_is_verified_again(client: TestClient) -> None:
+    token = client.headers["authorization"].removeprefix("Bearer ")
+    assert client.get("/v1/cache/stats").status_code == 200
+    assert token_cache.get(token)
+
+    token_cache.revoke(token)
+    assert not token_cache.get(token)
+
+    assert client.get("/v1/cache/stats").status_code == 200
+    assert token_cache.get(token)